@@ -44,6 +44,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'registrar.middleware.AuditFlushMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -113,12 +114,78 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_PAGINATION_CLASS': 'registrar.pagination.KeysetPagination',
+    'PAGE_SIZE': int(os.getenv('REGISTRAR_PAGE_SIZE', '50')),
 }
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=int(os.getenv('JWT_ACCESS_DAYS', '1'))),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    'TOKEN_OBTAIN_SERIALIZER': 'registrar.serializers.RegistrarTokenObtainPairSerializer',
 }
 
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+
+# Shared cache for cross-process invalidation; falls back to a per-process
+# cache when Redis is not configured (tests, quick local runs).
+REDIS_CACHE_URL = os.getenv('REDIS_CACHE_URL', '')
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'KEY_PREFIX': 'registrar',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'registrar',
+        }
+    }
+
+REGISTRAR_AUTO_LOAD_CHUNK_SIZE = int(os.getenv('REGISTRAR_AUTO_LOAD_CHUNK_SIZE', '100'))
+REGISTRAR_CURRICULUM_CACHE_SIZE = int(os.getenv('REGISTRAR_CURRICULUM_CACHE_SIZE', '1024'))
+REGISTRAR_PROMOTION_CHUNK_SIZE = int(os.getenv('REGISTRAR_PROMOTION_CHUNK_SIZE', '200'))
+# 'compact' stores AcademicHistory profile columns once per distinct value set
+# in HistoryProfile; 'full' copies them onto every snapshot row.
+REGISTRAR_HISTORY_STORAGE = os.getenv('REGISTRAR_HISTORY_STORAGE', 'compact')
+# 'buffered' collects audit rows and bulk-inserts them at the end of each
+# request/task (or every REGISTRAR_AUDIT_FLUSH_INTERVAL seconds when > 0);
+# 'sync' writes each row immediately.
+REGISTRAR_AUDIT_SINK = os.getenv('REGISTRAR_AUDIT_SINK', 'buffered')
+REGISTRAR_AUDIT_BUFFER_SIZE = int(os.getenv('REGISTRAR_AUDIT_BUFFER_SIZE', '500'))
+REGISTRAR_AUDIT_FLUSH_INTERVAL = float(os.getenv('REGISTRAR_AUDIT_FLUSH_INTERVAL', '0'))
+# Audit payloads larger than REGISTRAR_AUDIT_COMPRESS_BYTES are stored
+# zlib-compressed; compressed payloads over REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES
+# keep only the list of changed fields.
+REGISTRAR_AUDIT_COMPRESS_BYTES = int(os.getenv('REGISTRAR_AUDIT_COMPRESS_BYTES', '1024'))
+REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES = int(os.getenv('REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES', '16384'))
+# Share of the query's name trigrams a student must contain to be returned
+# by /students/search/.
+REGISTRAR_NAME_SEARCH_MIN_SCORE = float(os.getenv('REGISTRAR_NAME_SEARCH_MIN_SCORE', '0.3'))
+# Read-through cache for reference list/retrieve responses: an in-process
+# LRU (size, TTL seconds) in front of the shared cache (timeout seconds).
+REGISTRAR_RESPONSE_CACHE_L1_SIZE = int(os.getenv('REGISTRAR_RESPONSE_CACHE_L1_SIZE', '256'))
+REGISTRAR_RESPONSE_CACHE_L1_TTL = float(os.getenv('REGISTRAR_RESPONSE_CACHE_L1_TTL', '30'))
+REGISTRAR_RESPONSE_CACHE_TIMEOUT = int(os.getenv('REGISTRAR_RESPONSE_CACHE_TIMEOUT', '300'))
+# Seconds a process reuses a namespace version before re-reading it, and
+# hit/miss counts batched per push of the shared totals.
+REGISTRAR_RESPONSE_CACHE_VERSION_TTL = float(os.getenv('REGISTRAR_RESPONSE_CACHE_VERSION_TTL', '1'))
+REGISTRAR_RESPONSE_CACHE_STATS_FLUSH_EVERY = int(os.getenv('REGISTRAR_RESPONSE_CACHE_STATS_FLUSH_EVERY', '100'))
+# Plain list endpoints build rows from values() and render them directly
+# (with orjson when installed); the output is identical to the serializers.
+REGISTRAR_FAST_LIST_RENDERING = os.getenv('REGISTRAR_FAST_LIST_RENDERING', 'True') == 'True'
+# Rows per query for the streaming CSV/XLSX export endpoints.
+REGISTRAR_EXPORT_CHUNK_SIZE = int(os.getenv('REGISTRAR_EXPORT_CHUNK_SIZE', '2000'))
+# Rows per transaction (validation, bulk insert, name index) for
+# /student-imports/ and `manage.py import_students`.
+REGISTRAR_IMPORT_CHUNK_SIZE = int(os.getenv('REGISTRAR_IMPORT_CHUNK_SIZE', '500'))
+# AuditLog keeps the current month plus REGISTRAR_AUDIT_HOT_MONTHS previous
+# ones; `manage.py archive_audit_log` moves older rows to AuditLogArchive and
+# exports rows past REGISTRAR_AUDIT_COLD_MONTHS to gzip files.
+REGISTRAR_AUDIT_HOT_MONTHS = int(os.getenv('REGISTRAR_AUDIT_HOT_MONTHS', '3'))
+REGISTRAR_AUDIT_COLD_MONTHS = int(os.getenv('REGISTRAR_AUDIT_COLD_MONTHS', '24'))
+REGISTRAR_AUDIT_COLD_STORAGE_DIR = os.getenv('REGISTRAR_AUDIT_COLD_STORAGE_DIR', str(BASE_DIR / 'audit_archive'))
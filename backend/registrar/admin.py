@@ -1,6 +1,6 @@
 ﻿from django.contrib import admin
 
-from .models import AcademicTerm, AuditLog, Department, Program, ProspectusEntry, Section, Student, StudentLoad, Subject
+from .models import AcademicTerm, AuditLog, Department, Program, ProspectusEntry, ProspectusRequisite, Section, Student, StudentLoad, Subject
 
 admin.site.register(Department)
 admin.site.register(Program)
@@ -8,6 +8,7 @@ admin.site.register(AcademicTerm)
 admin.site.register(Section)
 admin.site.register(Subject)
 admin.site.register(ProspectusEntry)
+admin.site.register(ProspectusRequisite)
 admin.site.register(Student)
 admin.site.register(StudentLoad)
 admin.site.register(AuditLog)
@@ -4,3 +4,6 @@
 class RegistrarConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'registrar'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,95 @@
+import gzip
+import json
+import os
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import AuditLog, AuditLogArchive
+
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVE_FIELDS = ('id', 'actor_id', 'action', 'entity', 'entity_id', 'payload', 'created_at', 'updated_at')
+
+
+def month_start(months_back, now=None):
+    # First instant of the month `months_back` months before the current one.
+    now = timezone.localtime(now or timezone.now())
+    index = now.year * 12 + now.month - 1 - months_back
+    return now.replace(year=index // 12, month=index % 12 + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def hot_cutoff(now=None):
+    return month_start(getattr(settings, 'REGISTRAR_AUDIT_HOT_MONTHS', 3), now)
+
+
+def cold_cutoff(now=None):
+    return month_start(getattr(settings, 'REGISTRAR_AUDIT_COLD_MONTHS', 24), now)
+
+
+def cold_storage_dir():
+    return getattr(settings, 'REGISTRAR_AUDIT_COLD_STORAGE_DIR', os.path.join(settings.BASE_DIR, 'audit_archive'))
+
+
+def archive_audit_entries(before, batch_size=ARCHIVE_BATCH_SIZE):
+    # Moves hot rows created before `before` into AuditLogArchive. Each batch
+    # is copied and deleted in one transaction, so a row is always in exactly
+    # one table and an interrupted run can simply be restarted.
+    moved = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                AuditLog.objects.filter(created_at__lt=before)
+                .order_by('created_at', 'id')
+                .values(*ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return moved
+            AuditLogArchive.objects.bulk_create([AuditLogArchive(**row) for row in rows], ignore_conflicts=True)
+            AuditLog.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        moved += len(rows)
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def cold_storage_path(created_at):
+    created_at = timezone.localtime(created_at)
+    return os.path.join(cold_storage_dir(), f'auditlog-{created_at:%Y-%m}.ndjson.gz')
+
+
+def export_cold_entries(before, batch_size=ARCHIVE_BATCH_SIZE):
+    # Appends archive rows created before `before` to one gzip NDJSON file per
+    # month, then drops them from the database. Each batch is appended as its
+    # own gzip member, which standard readers concatenate transparently.
+    os.makedirs(cold_storage_dir(), exist_ok=True)
+    exported = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                AuditLogArchive.objects.filter(created_at__lt=before)
+                .order_by('created_at', 'id')
+                .values(*ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return exported
+            by_path = {}
+            for row in rows:
+                by_path.setdefault(cold_storage_path(row['created_at']), []).append(row)
+            for path, path_rows in by_path.items():
+                with gzip.open(path, 'ab') as handle:
+                    for row in path_rows:
+                        handle.write(json.dumps(row, default=_isoformat).encode() + b'\n')
+            AuditLogArchive.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        exported += len(rows)
+
+
+def read_cold_entries(path):
+    with gzip.open(path, 'rt') as handle:
+        for line in handle:
+            row = json.loads(line)
+            for field in ('created_at', 'updated_at'):
+                row[field] = datetime.fromisoformat(row[field])
+            yield row
@@ -0,0 +1,228 @@
+import atexit
+import base64
+import json
+import logging
+import threading
+import time
+import zlib
+
+from celery.signals import task_postrun, worker_shutdown
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+AUDIT_SINK_SYNC = 'sync'
+AUDIT_SINK_BUFFERED = 'buffered'
+COMPRESSED_PAYLOAD_KEY = '_zlib'
+
+
+class SyncAuditSink:
+    # Writes inside the caller's transaction, exactly like a direct create.
+    def record(self, entries):
+        AuditLog.objects.bulk_create(entries)
+
+    def flush(self):
+        return 0
+
+    def checkpoint(self):
+        pass
+
+
+class BufferedAuditSink:
+    # Process-wide bounded buffer written with bulk_create at the end of each
+    # request or Celery task, or by a background drainer when flush_interval
+    # is set. A full buffer is flushed by the writer, which waits and retries
+    # while the database refuses it rather than dropping entries; whatever is
+    # left is flushed at shutdown.
+    def __init__(self, max_size=500, flush_interval=0, retry_delay=0.1, max_retry_delay=5):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._entries = []
+        self._lock = threading.Lock()
+        self._drainer = None
+
+    def record(self, entries):
+        # Entries written inside a transaction only reach the buffer if it
+        # commits, matching a rolled-back AuditLog.objects.create.
+        transaction.on_commit(lambda: self.write(entries))
+
+    def write(self, entries):
+        # Runs in an on_commit callback, so a failed flush must not fail the
+        # already committed request; a full buffer blocks the writer instead.
+        delay = self.retry_delay
+        while True:
+            with self._lock:
+                if len(self._entries) < self.max_size:
+                    self._entries.extend(entries)
+                    full = len(self._entries) >= self.max_size
+                    break
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Audit buffer full and flush failed; retrying in %.1fs.', delay)
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+        if full:
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Audit log flush failed; entries kept for the next flush.')
+        self._ensure_drainer()
+
+    def flush(self):
+        with self._lock:
+            entries, self._entries = self._entries, []
+        if not entries:
+            return 0
+        try:
+            AuditLog.objects.bulk_create(entries, batch_size=self.max_size)
+        except Exception:
+            self._requeue(entries)
+            raise
+        return len(entries)
+
+    def _requeue(self, entries):
+        # Failed entries go back to the head of the buffer. Writers only add
+        # to a buffer below max_size, so it stays within about twice that.
+        with self._lock:
+            self._entries[:0] = entries
+
+    def checkpoint(self):
+        if self.flush_interval > 0:
+            return
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Audit log flush failed; entries kept for the next flush.')
+
+    def _ensure_drainer(self):
+        if self.flush_interval <= 0 or self._drainer is not None:
+            return
+        with self._lock:
+            if self._drainer is None:
+                self._drainer = threading.Thread(target=self._drain, name='audit-drainer', daemon=True)
+                self._drainer.start()
+
+    def _drain(self):
+        while True:
+            time.sleep(self.flush_interval)
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Audit log flush failed; entries kept for the next flush.')
+
+
+_sinks = {}
+_sinks_lock = threading.Lock()
+
+
+def get_audit_sink():
+    mode = getattr(settings, 'REGISTRAR_AUDIT_SINK', AUDIT_SINK_BUFFERED)
+    with _sinks_lock:
+        if mode not in _sinks:
+            if mode == AUDIT_SINK_SYNC:
+                _sinks[mode] = SyncAuditSink()
+            else:
+                _sinks[mode] = BufferedAuditSink(
+                    max_size=getattr(settings, 'REGISTRAR_AUDIT_BUFFER_SIZE', 500),
+                    flush_interval=getattr(settings, 'REGISTRAR_AUDIT_FLUSH_INTERVAL', 0),
+                )
+        return _sinks[mode]
+
+
+def instance_state(instance):
+    # JSON-ready values of the concrete columns, keyed by field name, without
+    # the auto-maintained timestamps.
+    state = {}
+    for field in instance._meta.concrete_fields:
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            continue
+        state[field.name] = field.value_from_object(instance)
+    return json.loads(json.dumps(state, cls=DjangoJSONEncoder))
+
+
+def field_diff(before, after):
+    # {field: [old, new]} for every column whose value changed; `before` is
+    # None for newly created rows, which then only list non-empty fields.
+    before = before or {}
+    return {
+        name: [before.get(name), value]
+        for name, value in after.items()
+        if before.get(name) != value and (name in before or value not in (None, ''))
+    }
+
+
+def compact_payload(payload):
+    # Payloads over REGISTRAR_AUDIT_COMPRESS_BYTES are stored zlib-compressed;
+    # anything still over REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES keeps only the
+    # changed field names.
+    if not payload:
+        return {}
+    encoded = json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+    if len(encoded) <= getattr(settings, 'REGISTRAR_AUDIT_COMPRESS_BYTES', 1024):
+        return json.loads(encoded)
+    compressed = base64.b64encode(zlib.compress(encoded)).decode()
+    if len(compressed) <= getattr(settings, 'REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES', 16384):
+        return {COMPRESSED_PAYLOAD_KEY: compressed}
+    return {'truncated': True, 'size': len(encoded), 'fields': sorted(payload.get('changes', payload))}
+
+
+def expand_payload(payload):
+    if isinstance(payload, dict) and COMPRESSED_PAYLOAD_KEY in payload:
+        return json.loads(zlib.decompress(base64.b64decode(payload[COMPRESSED_PAYLOAD_KEY])))
+    return payload
+
+
+def change_payload(before, instance, state=instance_state):
+    return {'changes': field_diff(before, state(instance))}
+
+
+def audit_entry(actor, action, entity, entity_id, payload=None):
+    return AuditLog(
+        actor=actor,
+        action=action,
+        entity=entity,
+        entity_id=str(entity_id),
+        payload=compact_payload(payload),
+        created_at=timezone.now(),
+    )
+
+
+def record_audit_entries(entries):
+    entries = list(entries)
+    if not entries:
+        return
+    get_audit_sink().record(entries)
+
+
+def record_audit(actor, action, entity, entity_id, payload=None):
+    record_audit_entries([audit_entry(actor, action, entity, entity_id, payload)])
+
+
+def flush_audit_log():
+    return sum(sink.flush() for sink in list(_sinks.values()))
+
+
+def audit_checkpoint():
+    get_audit_sink().checkpoint()
+
+
+@task_postrun.connect
+def _flush_after_task(**kwargs):
+    audit_checkpoint()
+
+
+@worker_shutdown.connect
+def _flush_on_worker_shutdown(**kwargs):
+    flush_audit_log()
+
+
+atexit.register(flush_audit_log)
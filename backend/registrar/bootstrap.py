@@ -0,0 +1,78 @@
+import gzip
+import hashlib
+
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from .caching import get_version
+from .conditional import table_namespace
+from .models import AcademicTerm, Department, Program, ProspectusEntry, Section, Subject
+from .serializers import (
+    AcademicTermSerializer,
+    DepartmentSerializer,
+    ProgramSerializer,
+    ProspectusEntrySerializer,
+    SectionSerializer,
+    SubjectSerializer,
+)
+
+BOOTSTRAP_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Collection name, queryset and serializer, in the same order the list
+# endpoints use.
+BOOTSTRAP_COLLECTIONS = (
+    ('departments', lambda: Department.objects.all().order_by('name', 'id'), DepartmentSerializer),
+    ('programs', lambda: Program.objects.all().order_by('name', 'id'), ProgramSerializer),
+    ('terms', lambda: AcademicTerm.objects.all().order_by('-year_label', 'semester'), AcademicTermSerializer),
+    (
+        'sections',
+        lambda: Section.objects.all().order_by('name', 'program_id', 'year_level', 'semester', 'id'),
+        SectionSerializer,
+    ),
+    ('subjects', lambda: Subject.objects.all().order_by('code'), SubjectSerializer),
+    ('prospectus', lambda: ProspectusEntry.objects.all().order_by('id'), ProspectusEntrySerializer),
+)
+BOOTSTRAP_MODELS = (Department, Program, AcademicTerm, Section, Subject, ProspectusEntry)
+
+
+def bootstrap_version():
+    # Moves whenever any of the bundled tables is written (see touch_tables),
+    # so stale bundles are never read again and simply expire.
+    versions = ','.join(str(get_version(table_namespace(model))) for model in BOOTSTRAP_MODELS)
+    return hashlib.sha1(versions.encode()).hexdigest()
+
+
+def render_bootstrap():
+    payload = {name: serializer(queryset(), many=True).data for name, queryset, serializer in BOOTSTRAP_COLLECTIONS}
+    return gzip.compress(JSONRenderer().render(payload))
+
+
+def accepts_gzip(accept_encoding):
+    # True when Accept-Encoding gives gzip (or, failing an explicit gzip
+    # entry, *) a non-zero q-value.
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, *params = item.split(';')
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    if 'gzip' in qualities:
+        return qualities['gzip'] > 0
+    return qualities.get('*', 0) > 0
+
+
+def get_bootstrap_bundle():
+    # (version, gzip-compressed JSON bytes)
+    version = bootstrap_version()
+    key = f'bootstrap:{version}'
+    bundle = cache.get(key)
+    if bundle is None:
+        bundle = render_bootstrap()
+        cache.set(key, bundle, timeout=BOOTSTRAP_CACHE_TIMEOUT)
+    return version, bundle
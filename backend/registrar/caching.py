@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.db import transaction
+
+_MISSING = object()
+# namespace -> (monotonic expiry, version) for cached_version.
+_local_versions = {}
+
+
+class LRUCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _version_key(namespace):
+    return f'version:{namespace}'
+
+
+def get_version(namespace):
+    # Versions live in the shared cache so every worker process sees a bump.
+    # A missing key is re-seeded from the clock rather than 1 so an evicted
+    # counter can never collide with a version a process still holds.
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def cached_version(namespace, ttl):
+    # get_version, reusing this process's last answer for up to `ttl`
+    # seconds. Bumps made in this process are seen at once; bumps from other
+    # processes within `ttl`.
+    now = time.monotonic()
+    entry = _local_versions.get(namespace)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    version = get_version(namespace)
+    _local_versions[namespace] = (now + ttl, version)
+    return version
+
+
+def clear_local_versions():
+    _local_versions.clear()
+
+
+def bump_version(namespace):
+    _local_versions.pop(namespace, None)
+    key = _version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+        return cache.incr(key)
+
+
+class VersionedLRUCache(LRUCache):
+    # An in-process LRU whose contents are dropped whenever the shared
+    # namespace version moves, so a write in one process invalidates all.
+    def __init__(self, namespace, maxsize=1024):
+        super().__init__(maxsize=maxsize)
+        self.namespace = namespace
+        self._version = None
+
+    def sync(self):
+        version = get_version(self.namespace)
+        if version != self._version:
+            self.clear()
+            self._version = version
+        return version
+
+    def invalidate(self):
+        self.clear()
+        bump_version(self.namespace)
+
+
+class TTLLRUCache(LRUCache):
+    # LRUCache whose entries also expire `ttl` seconds after being set.
+    def __init__(self, maxsize=1024, ttl=30):
+        super().__init__(maxsize=maxsize)
+        self.ttl = ttl
+
+    def get(self, key, default=None):
+        entry = super().get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires, value = entry
+        if expires < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value):
+        super().set(key, (time.monotonic() + self.ttl, value))
+
+
+class CacheStats:
+    # Per-process counters, also accumulated in the shared cache so the
+    # totals cover every worker. Increments are pushed to the shared cache in
+    # batches of flush_every, not one round trip each.
+    def __init__(self, name, flush_every=100):
+        self.name = name
+        self.flush_every = flush_every
+        self._counts = {}
+        self._pending = {}
+        self._pending_total = 0
+        self._lock = threading.Lock()
+
+    def incr(self, metric):
+        with self._lock:
+            self._counts[metric] = self._counts.get(metric, 0) + 1
+            self._pending[metric] = self._pending.get(metric, 0) + 1
+            self._pending_total += 1
+            due = self._pending_total >= self.flush_every
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending, self._pending_total = self._pending, {}, 0
+        for metric, delta in pending.items():
+            key = f'stats:{self.name}:{metric}'
+            try:
+                cache.incr(key, delta)
+            except ValueError:
+                cache.add(key, 0, timeout=None)
+                cache.incr(key, delta)
+
+    def local(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def shared(self, metrics):
+        self.flush()
+        values = cache.get_many([f'stats:{self.name}:{metric}' for metric in metrics])
+        return {metric: values.get(f'stats:{self.name}:{metric}', 0) for metric in metrics}
+
+
+class ReadThroughCache:
+    # Two-tier cache for rendered read results: an in-process TTL/LRU tier in
+    # front of the shared (Redis) cache. Keys embed the current namespace
+    # version, so a bump from any process retires every cached entry (within
+    # version_ttl seconds, for which the version itself is held locally).
+    METRICS = ('l1_hits', 'l2_hits', 'misses')
+
+    def __init__(self, namespace, maxsize=256, ttl=30, timeout=300, version_ttl=1, stats_flush_every=100):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.version_ttl = version_ttl
+        self.local = TTLLRUCache(maxsize=maxsize, ttl=ttl)
+        self.stats = CacheStats(namespace, flush_every=stats_flush_every)
+
+    def get_or_set(self, key, compute, version=None):
+        if version is None:
+            version = cached_version(self.namespace, self.version_ttl)
+        full_key = f'{self.namespace}:{version}:{key}'
+        value = self.local.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self.stats.incr('l1_hits')
+            return value
+        value = cache.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self.stats.incr('l2_hits')
+        else:
+            self.stats.incr('misses')
+            value = compute()
+            cache.set(full_key, value, timeout=self.timeout)
+        self.local.set(full_key, value)
+        return value
+
+    def invalidate(self):
+        # The shared bump waits for commit so no reader can cache pre-commit
+        # rows under the new version.
+        self.local.clear()
+        transaction.on_commit(lambda: bump_version(self.namespace))
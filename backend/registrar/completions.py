@@ -0,0 +1,64 @@
+from collections import defaultdict
+
+from .models import CompletedSubject, StudentLoad
+
+COMPLETED_LOAD_STATUSES = ('passed', 'completed')
+REBUILD_BATCH_SIZE = 1000
+
+
+def completed_subject_ids(student):
+    return set(CompletedSubject.objects.filter(student=student).values_list('subject_id', flat=True))
+
+
+def completed_subject_ids_by_student(student_pks):
+    completed = defaultdict(set)
+    rows = CompletedSubject.objects.filter(student_id__in=student_pks).values_list('student_id', 'subject_id')
+    for student_pk, subject_id in rows:
+        completed[student_pk].add(subject_id)
+    return completed
+
+
+def sync_completed_subject(student_id, subject_id, status=None):
+    # A completed load is enough to mark the subject done; anything else has
+    # to look at the student's other loads for the same subject.
+    if status in COMPLETED_LOAD_STATUSES:
+        CompletedSubject.objects.bulk_create(
+            [CompletedSubject(student_id=student_id, subject_id=subject_id)], ignore_conflicts=True
+        )
+        return
+    still_completed = StudentLoad.objects.filter(
+        student_id=student_id,
+        subject_id=subject_id,
+        status__in=COMPLETED_LOAD_STATUSES,
+    ).exists()
+    if still_completed:
+        CompletedSubject.objects.bulk_create(
+            [CompletedSubject(student_id=student_id, subject_id=subject_id)], ignore_conflicts=True
+        )
+    else:
+        CompletedSubject.objects.filter(student_id=student_id, subject_id=subject_id).delete()
+
+
+def completed_subject_drift():
+    expected = set(
+        StudentLoad.objects.filter(status__in=COMPLETED_LOAD_STATUSES)
+        .values_list('student_id', 'subject_id')
+        .distinct()
+    )
+    actual = set(CompletedSubject.objects.values_list('student_id', 'subject_id'))
+    return expected - actual, actual - expected
+
+
+def rebuild_completed_subjects():
+    missing, stale = completed_subject_drift()
+    CompletedSubject.objects.bulk_create(
+        [CompletedSubject(student_id=student_id, subject_id=subject_id) for student_id, subject_id in missing],
+        batch_size=REBUILD_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    stale_by_student = defaultdict(list)
+    for student_id, subject_id in stale:
+        stale_by_student[student_id].append(subject_id)
+    for student_id, subject_ids in stale_by_student.items():
+        CompletedSubject.objects.filter(student_id=student_id, subject_id__in=subject_ids).delete()
+    return missing, stale
@@ -0,0 +1,91 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .caching import bump_version, get_version
+
+_touch_listeners = []
+
+
+def table_namespace(model):
+    return f'table:{model._meta.label_lower}'
+
+
+def _modified_key(model):
+    return f'modified:{model._meta.label_lower}'
+
+
+def on_tables_touched(listener):
+    # listener(models) runs after touch_tables has moved the tables' versions.
+    _touch_listeners.append(listener)
+    return listener
+
+
+def touch_tables(*models):
+    # Called for every write to a reference table, including bulk writes that
+    # skip signals. The bump waits for commit so a reader can never cache
+    # pre-commit rows under the new version.
+    def bump():
+        now = int(time.time())
+        for model in models:
+            bump_version(table_namespace(model))
+            cache.set(_modified_key(model), now, timeout=None)
+        for listener in _touch_listeners:
+            listener(models)
+
+    transaction.on_commit(bump)
+
+
+def table_last_modified(model):
+    # Falls back to max(updated_at) when the timestamp was never recorded or
+    # has been evicted; deletes are covered by the version in the ETag.
+    key = _modified_key(model)
+    modified = cache.get(key)
+    if modified is None:
+        latest = model.objects.aggregate(latest=Max('updated_at'))['latest']
+        modified = int(latest.timestamp()) if latest else 0
+        cache.add(key, modified, timeout=None)
+        modified = cache.get(key, modified)
+    return modified
+
+
+class ConditionalGetMixin:
+    # ETag / Last-Modified for list and retrieve on tables that change rarely.
+    # The ETag covers the table versions and the full request path (filters,
+    # cursor, sparse fieldsets), so a match answers 304 without touching the
+    # queryset or the serializer. The versions read here are kept on the view
+    # (table_versions) so a cached body is looked up under the same snapshot.
+    conditional_models = ()
+    table_versions = None
+
+    def _validators(self, request):
+        self.table_versions = {
+            table_namespace(model): get_version(table_namespace(model)) for model in self.conditional_models
+        }
+        versions = ','.join(str(version) for version in self.table_versions.values())
+        digest = hashlib.sha1(f'{versions}|{request.get_full_path()}'.encode()).hexdigest()
+        last_modified = max(table_last_modified(model) for model in self.conditional_models)
+        return f'"{digest}"', last_modified
+
+    def _conditional(self, request, handler, *args, **kwargs):
+        if not self.conditional_models:
+            return handler(request, *args, **kwargs)
+        etag, last_modified = self._validators(request)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        response = not_modified or handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,117 @@
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .caching import VersionedLRUCache
+from .models import ProspectusEntry
+
+CURRICULUM_NAMESPACE = 'curriculum'
+
+_index = VersionedLRUCache(
+    CURRICULUM_NAMESPACE,
+    maxsize=getattr(settings, 'REGISTRAR_CURRICULUM_CACHE_SIZE', 1024),
+)
+
+
+def curriculum_tiers(academic_year, section_id):
+    year = academic_year or ''
+    tiers = []
+    if year and section_id:
+        tiers.append((year, section_id))
+    if year:
+        tiers.append((year, None))
+    if section_id:
+        tiers.append(('', section_id))
+    tiers.append(('', None))
+    return tiers
+
+
+class ResolvedCurriculum(NamedTuple):
+    # tiers holds the (academic_year, section_id) candidates in fallback order
+    # and entries_by_tier the (subject_id, prerequisite_id) pairs of each one.
+    tiers: tuple
+    entries_by_tier: tuple
+
+    @property
+    def tier(self):
+        for tier, entries in zip(self.tiers, self.entries_by_tier):
+            if entries:
+                return tier
+        return self.tiers[-1]
+
+    @property
+    def entries(self):
+        for entries in self.entries_by_tier:
+            if entries:
+                return entries
+        return ()
+
+    def entry_for_subject(self, subject_id):
+        # Single-subject lookups fall back tier by tier for that subject only,
+        # so a subject missing from a section-specific curriculum can still
+        # be matched by the program default.
+        for entries in self.entries_by_tier:
+            for entry in entries:
+                if entry[0] == subject_id:
+                    return entry
+        return None
+
+
+def curriculum_key(student, semester):
+    return (student.program_id, student.year_level, semester, student.academic_year or '', student.section_id)
+
+
+def get_resolved_curricula(keys):
+    keys = set(keys)
+    _index.sync()
+    resolved = {}
+    missing = []
+    for key in keys:
+        curriculum = _index.get(key)
+        if curriculum is None:
+            missing.append(key)
+        else:
+            resolved[key] = curriculum
+
+    if missing:
+        rows = (
+            ProspectusEntry.objects.filter(
+                program_id__in={key[0] for key in missing},
+                year_level__in={key[1] for key in missing},
+                semester__in={key[2] for key in missing},
+                academic_year__in={key[3] for key in missing} | {''},
+            )
+            .order_by('id')
+            .values_list('program_id', 'year_level', 'semester', 'academic_year', 'section_id', 'subject_id', 'prerequisite_id')
+        )
+        grouped = defaultdict(list)
+        for program_id, year_level, semester, academic_year, section_id, subject_id, prerequisite_id in rows:
+            grouped[(program_id, year_level, semester, academic_year, section_id)].append((subject_id, prerequisite_id))
+
+        for key in missing:
+            program_id, year_level, semester, academic_year, section_id = key
+            tiers = tuple(curriculum_tiers(academic_year, section_id))
+            curriculum = ResolvedCurriculum(
+                tiers=tiers,
+                entries_by_tier=tuple(
+                    tuple(grouped.get((program_id, year_level, semester, tier_year, tier_section), ()))
+                    for tier_year, tier_section in tiers
+                ),
+            )
+            _index.set(key, curriculum)
+            resolved[key] = curriculum
+    return resolved
+
+
+def get_resolved_curriculum(student, semester):
+    key = curriculum_key(student, semester)
+    return get_resolved_curricula([key])[key]
+
+
+def invalidate_curricula():
+    # Bump after commit so no process can re-cache pre-commit rows under the
+    # new version.
+    _index.clear()
+    transaction.on_commit(_index.invalidate)
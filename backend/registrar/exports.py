@@ -0,0 +1,229 @@
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+
+from .history import PROFILE_FIELDS
+from .models import AcademicHistory
+from .pagination import KeysetPagination
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# (header, ORM lookup) per exported column.
+STUDENT_EXPORT_COLUMNS = [
+    ('student_id', 'student_id'),
+    ('last_name', 'last_name'),
+    ('first_name', 'first_name'),
+    ('middle_name', 'middle_name'),
+    ('extension_name', 'extension_name'),
+    ('sex', 'sex'),
+    ('date_of_birth', 'date_of_birth'),
+    ('program_code', 'program__code'),
+    ('section_name', 'section__name'),
+    ('year_level', 'year_level'),
+    ('academic_year', 'academic_year'),
+    ('semester', 'semester'),
+    ('scholarship', 'scholarship'),
+    ('email_address', 'email_address'),
+    ('contact_number', 'contact_number'),
+    ('is_active', 'is_active'),
+]
+STUDENT_LOAD_EXPORT_COLUMNS = [
+    ('student_id', 'student__student_id'),
+    ('last_name', 'student__last_name'),
+    ('first_name', 'student__first_name'),
+    ('year_label', 'term__year_label'),
+    ('semester', 'term__semester'),
+    ('subject_code', 'subject__code'),
+    ('subject_title', 'subject__title'),
+    ('units', 'subject__units'),
+    ('status', 'status'),
+]
+# Name and scholarship columns of compact snapshots live in HistoryProfile;
+# history_export_rows fills them back in.
+ACADEMIC_HISTORY_EXPORT_COLUMNS = [
+    ('student_id', 'student__student_id'),
+    ('last_name', 'last_name'),
+    ('first_name', 'first_name'),
+    ('middle_name', 'middle_name'),
+    ('academic_year', 'academic_year'),
+    ('semester', 'semester'),
+    ('year_level', 'year_level'),
+    ('program_code', 'program__code'),
+    ('section_name', 'section__name'),
+    ('scholarship', 'scholarship'),
+    ('status', 'status'),
+    ('start_date', 'start_date'),
+    ('end_date', 'end_date'),
+]
+
+_XML_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def export_chunk_size():
+    return getattr(settings, 'REGISTRAR_EXPORT_CHUNK_SIZE', 2000)
+
+
+def export_rows(queryset, columns, ordering, extra=(), chunk_size=None):
+    # Yields one tuple per row (column values, then `extra` lookups) in
+    # keyset-ordered batches of chunk_size. Each batch is a separate
+    # iterator() query, so memory stays flat even on drivers that buffer a
+    # whole result set client-side.
+    chunk_size = chunk_size or export_chunk_size()
+    lookups = [lookup for _, lookup in columns] + list(extra)
+    names = [field.lstrip('-') for field in ordering]
+    width = len(lookups)
+    paginator = KeysetPagination()
+    queryset = queryset.order_by(*ordering)
+    last = None
+    while True:
+        batch = queryset if last is None else queryset.filter(paginator.keyset_filter(ordering, last))
+        count = 0
+        for values in batch.values_list(*lookups, *names)[:chunk_size].iterator(chunk_size=chunk_size):
+            count += 1
+            last = values[width:]
+            yield values[:width]
+        if count < chunk_size:
+            return
+
+
+def history_export_rows(queryset, ordering, chunk_size=None):
+    columns = ACADEMIC_HISTORY_EXPORT_COLUMNS
+    profile_columns = [
+        (index, AcademicHistory._meta.get_field(header))
+        for index, (header, _) in enumerate(columns)
+        if header in PROFILE_FIELDS
+    ]
+    for values in export_rows(queryset, columns, ordering, extra=('profile__data',), chunk_size=chunk_size):
+        row, profile_data = list(values[:-1]), values[-1]
+        if profile_data is not None:
+            for index, field in profile_columns:
+                row[index] = field.to_python(profile_data.get(field.name))
+        yield row
+
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def csv_export(rows, headers):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([_text(value) for value in row])
+
+
+class _Sink(io.RawIOBase):
+    # Unseekable file object for zipfile; the generator drains it as it goes.
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="{sheet}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+
+def _xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, Decimal)):
+        return f'<c><v>{value}</v></c>'
+    text = escape(_XML_ILLEGAL.sub('', _text(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def xlsx_export(rows, headers, sheet='Export', rows_per_flush=500):
+    # Minimal single-sheet workbook with inline strings, written through an
+    # unseekable zip stream so no part of it is held in memory.
+    sink = _Sink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content.replace('{sheet}', escape(sheet)))
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as part:
+            part.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            part.write(('<row>' + ''.join(_xlsx_cell(header) for header in headers) + '</row>').encode())
+            for count, row in enumerate(rows, start=1):
+                part.write(('<row>' + ''.join(_xlsx_cell(value) for value in row) + '</row>').encode())
+                if count % rows_per_flush == 0:
+                    yield sink.drain()
+            part.write(b'</sheetData></worksheet>')
+        yield sink.drain()
+    yield sink.drain()
+
+
+def export_stream(rows, columns, output, sheet='Export'):
+    headers = [header for header, _ in columns]
+    if output == 'xlsx':
+        return xlsx_export(rows, headers, sheet=sheet)
+    return csv_export(rows, headers)
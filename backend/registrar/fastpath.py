@@ -0,0 +1,126 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Field classes whose to_representation is a plain type cast. Exact classes
+# only: subclasses (ChoiceField, DecimalField...) keep their own method.
+_CASTS = {
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.SlugField: str,
+    serializers.URLField: str,
+    serializers.IntegerField: int,
+    serializers.BooleanField: bool,
+}
+_UNSUPPORTED = (
+    serializers.SerializerMethodField,
+    serializers.BaseSerializer,
+    serializers.ManyRelatedField,
+    serializers.FloatField,
+    serializers.JSONField,
+    serializers.HiddenField,
+)
+
+
+def _converter(field):
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+        return None
+    return _CASTS.get(type(field), field.to_representation)
+
+
+def compile_row_builder(serializer):
+    # Returns (columns, build) where build(row) turns a values() dict into
+    # the dict the serializer would produce, or None when the serializer
+    # needs model instances (method fields, nested or dotted sources, a
+    # custom to_representation).
+    serializer = getattr(serializer, 'child', serializer)
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return None
+    model = serializer.Meta.model
+    plan = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, _UNSUPPORTED) or field.source == '*' or '.' in field.source:
+            return None
+        if isinstance(field, serializers.RelatedField) and not isinstance(field, serializers.PrimaryKeyRelatedField):
+            return None
+        try:
+            column = model._meta.get_field(field.source).attname
+        except Exception:
+            return None
+        plan.append((name, column, _converter(field)))
+
+    def build(row):
+        data = {}
+        for name, column, convert in plan:
+            value = row[column]
+            data[name] = value if value is None or convert is None else convert(value)
+        return data
+
+    return [column for _, column, _ in plan], build
+
+
+def _drf_default(value):
+    return JSONRenderer.encoder_class().default(value)
+
+
+def render_json(data):
+    # Same bytes as DRF's JSONRenderer with the compact/unicode/strict
+    # defaults this project uses.
+    if orjson is not None:
+        # Anything orjson would format differently (dates, decimals) goes
+        # through DRF's encoder instead.
+        rendered = orjson.dumps(data, default=_drf_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    else:
+        rendered = json.dumps(
+            data, ensure_ascii=False, allow_nan=False, separators=(',', ':'), cls=JSONRenderer.encoder_class
+        ).encode()
+    return rendered.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+def fast_rendering_applies(request):
+    renderer = getattr(request, 'accepted_renderer', None)
+    return (
+        getattr(settings, 'REGISTRAR_FAST_LIST_RENDERING', True)
+        and type(renderer) is JSONRenderer
+        and api_settings.COMPACT_JSON
+        and api_settings.UNICODE_JSON
+        and api_settings.STRICT_JSON
+        and 'indent' not in (request.accepted_media_type or '')
+    )
+
+
+class FastListMixin:
+    # Serves list actions from values() rows through a precompiled row
+    # builder and renders them directly, skipping per-instance field lookups
+    # and the Response/renderer round trip. Falls back to the regular list
+    # whenever the serializer or renderer is not covered.
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        if not (self.fast_list and fast_rendering_applies(request)):
+            return super().list(request, *args, **kwargs)
+        compiled = compile_row_builder(self.get_serializer())
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+        columns, build = compiled
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = [field.lstrip('-') for field in getattr(self, 'keyset_ordering', ())]
+        rows = queryset.values(*dict.fromkeys(columns + ordering))
+        page = self.paginate_queryset(rows)
+        if page is None:
+            data = [build(row) for row in rows]
+        else:
+            data = self.get_paginated_response([build(row) for row in page]).data
+        return HttpResponse(render_json(data), content_type='application/json')
@@ -0,0 +1,54 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+def _param_names(request, param):
+    raw = request.query_params.get(param, '')
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+def sparse_field_params(request):
+    # (fields to keep, fields to drop) for a read request; empty sets when the
+    # request does not ask for a sparse fieldset.
+    if request is None or request.method not in SAFE_METHODS:
+        return set(), set()
+    return _param_names(request, 'fields'), _param_names(request, 'omit')
+
+
+class SparseFieldsMixin:
+    # ?fields=a,b keeps only those fields and ?omit=a,b drops them. Writes
+    # always see the full field set.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep, omit = sparse_field_params(self.context.get('request'))
+        if not keep and not omit:
+            return
+        for name in list(self.fields):
+            if (keep and name not in keep) or name in omit:
+                self.fields.pop(name)
+
+
+def defer_unused_columns(queryset, serializer):
+    # Defers the model columns whose serializer field was dropped by a sparse
+    # fieldset. Columns read by method fields or nested sources are left
+    # alone, as are relations that the queryset already joins.
+    serializer = getattr(serializer, 'child', serializer)
+    used = {(field.source or name).split('.')[0] for name, field in serializer.fields.items()}
+    joined = queryset.query.select_related
+    deferred = []
+    for field in queryset.model._meta.concrete_fields:
+        if field.primary_key or field.name in used:
+            continue
+        if field.is_relation and (joined is True or (joined and field.name in joined)):
+            continue
+        deferred.append(field.name)
+    return queryset.defer(*deferred) if deferred else queryset
+
+
+class SparseQuerysetMixin:
+    # Matches list/retrieve querysets to the requested sparse fieldset.
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        keep, omit = sparse_field_params(self.request)
+        if (keep or omit) and self.action in ('list', 'retrieve'):
+            queryset = defer_unused_columns(queryset, self.get_serializer())
+        return queryset
@@ -0,0 +1,165 @@
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import AcademicHistory, HistoryProfile
+
+HISTORY_STORAGE_COMPACT = 'compact'
+HISTORY_STORAGE_FULL = 'full'
+HISTORY_BATCH_SIZE = 500
+# Unreferenced profiles younger than this are kept: a writer may have looked
+# one up and not yet saved the snapshot that points at it.
+PROFILE_PRUNE_GRACE = timedelta(hours=1)
+
+# Columns that rarely change between semesters and are therefore stored once
+# per distinct value set in HistoryProfile instead of on every snapshot.
+PROFILE_FIELDS = [
+    'first_name',
+    'last_name',
+    'middle_name',
+    'extension_name',
+    'gender',
+    'sex',
+    'date_of_birth',
+    'age',
+    'civil_status',
+    'nationality',
+    'admission_date',
+    'scholarship',
+    'course',
+    'home_address',
+    'postal_code',
+    'email_address',
+    'contact_number',
+    'mother_maiden_name',
+    'mother_contact_number',
+    'father_name',
+    'father_contact_number',
+    'elementary_school',
+    'junior_high_school',
+    'senior_high_school',
+    'senior_high_track_strand',
+]
+
+_profile_model_fields = {field: AcademicHistory._meta.get_field(field) for field in PROFILE_FIELDS}
+
+
+def history_storage_mode():
+    return getattr(settings, 'REGISTRAR_HISTORY_STORAGE', HISTORY_STORAGE_COMPACT)
+
+
+def profile_values(source):
+    return {field: getattr(source, field) for field in PROFILE_FIELDS}
+
+
+def _encode(values):
+    return {field: value.isoformat() if hasattr(value, 'isoformat') else value for field, value in values.items()}
+
+
+def profile_digest(encoded):
+    return hashlib.sha256(json.dumps(encoded, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def _blank(field):
+    return None if field.null else field.get_default()
+
+
+def get_or_create_profiles(value_sets):
+    # Two queries (plus one insert) for any number of snapshots.
+    encoded = {}
+    for values in value_sets:
+        data = _encode(values)
+        encoded.setdefault(profile_digest(data), data)
+    profiles = dict(HistoryProfile.objects.filter(digest__in=encoded).values_list('digest', 'pk'))
+    missing = [HistoryProfile(digest=digest, data=data) for digest, data in encoded.items() if digest not in profiles]
+    if missing:
+        HistoryProfile.objects.bulk_create(missing, batch_size=HISTORY_BATCH_SIZE, ignore_conflicts=True)
+        profiles.update(
+            HistoryProfile.objects.filter(digest__in=[profile.digest for profile in missing]).values_list('digest', 'pk')
+        )
+    return profiles
+
+
+def compact(snapshots):
+    # Point each unsaved/loaded snapshot at its shared profile and clear the
+    # duplicated columns. Snapshots that are already compact are left alone.
+    pending = [snapshot for snapshot in snapshots if snapshot.profile_id is None]
+    value_sets = [profile_values(snapshot) for snapshot in pending]
+    profiles = get_or_create_profiles(value_sets)
+    for snapshot, values in zip(pending, value_sets):
+        snapshot.profile_id = profiles[profile_digest(_encode(values))]
+        for field in PROFILE_FIELDS:
+            setattr(snapshot, field, _blank(_profile_model_fields[field]))
+    return snapshots
+
+
+def materialize(snapshot, profile_data=None):
+    # Fill the profile columns of a compact snapshot back in, in place.
+    if snapshot.profile_id is None:
+        return snapshot
+    if profile_data is None:
+        profile_data = snapshot.profile.data
+    for field in PROFILE_FIELDS:
+        setattr(snapshot, field, _profile_model_fields[field].to_python(profile_data.get(field)))
+    return snapshot
+
+
+def materialize_all(snapshots):
+    snapshots = list(snapshots)
+    profile_ids = {snapshot.profile_id for snapshot in snapshots if snapshot.profile_id}
+    profiles = dict(HistoryProfile.objects.filter(pk__in=profile_ids).values_list('pk', 'data'))
+    for snapshot in snapshots:
+        if snapshot.profile_id:
+            materialize(snapshot, profiles[snapshot.profile_id])
+    return snapshots
+
+
+def compact_existing_histories(batch_size=HISTORY_BATCH_SIZE):
+    converted = 0
+    queryset = AcademicHistory.objects.filter(profile__isnull=True).order_by('pk')
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return converted
+        with transaction.atomic():
+            compact(batch)
+            AcademicHistory.objects.bulk_update(batch, ['profile', *PROFILE_FIELDS])
+        converted += len(batch)
+        last_pk = batch[-1].pk
+
+
+def prune_unreferenced_profiles(batch_size=HISTORY_BATCH_SIZE, grace=PROFILE_PRUNE_GRACE):
+    # Edited snapshots move to a new profile and expanded ones drop theirs;
+    # the profiles nothing points at any more are deleted here.
+    referenced = AcademicHistory.objects.filter(profile__isnull=False).values('profile_id')
+    queryset = HistoryProfile.objects.filter(created_at__lt=timezone.now() - grace).exclude(pk__in=referenced)
+    pruned = 0
+    last_pk = 0
+    while True:
+        ids = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return pruned
+        with transaction.atomic():
+            pruned += HistoryProfile.objects.filter(pk__in=ids).exclude(pk__in=referenced).delete()[0]
+        last_pk = ids[-1]
+
+
+def expand_existing_histories(batch_size=HISTORY_BATCH_SIZE):
+    expanded = 0
+    queryset = AcademicHistory.objects.filter(profile__isnull=False).order_by('pk')
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return expanded
+        last_pk = batch[-1].pk
+        for snapshot in materialize_all(batch):
+            snapshot.profile_id = None
+        with transaction.atomic():
+            AcademicHistory.objects.bulk_update(batch, ['profile', *PROFILE_FIELDS])
+        expanded += len(batch)
@@ -0,0 +1,194 @@
+import csv
+import io
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from .audit import audit_entry, record_audit_entries
+from .models import Program, Section, Student, StudentImport
+from .search import NAME_FIELDS, sync_student_name_index
+
+REQUIRED_IMPORT_COLUMNS = ['student_id', 'first_name', 'last_name', 'program']
+# Every editable Student column; program and section are given by code/name
+# (or pk) and resolved against the preloaded lookup maps.
+IMPORT_COLUMNS = [
+    field.name
+    for field in Student._meta.concrete_fields
+    if not field.primary_key and field.name not in ('is_active', 'created_at', 'updated_at')
+]
+IMPORT_ERROR_CSV_FIELDS = ['row', 'student_id', 'field', 'message']
+
+
+def import_chunk_size():
+    return getattr(settings, 'REGISTRAR_IMPORT_CHUNK_SIZE', 500)
+
+
+def _reader(source):
+    reader = csv.DictReader(io.StringIO(source))
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+    return reader
+
+
+def check_import_header(source):
+    columns = _reader(source).fieldnames
+    missing = [column for column in REQUIRED_IMPORT_COLUMNS if column not in columns]
+    if missing:
+        return f'Missing required columns: {", ".join(missing)}.'
+    unknown = [column for column in columns if column not in IMPORT_COLUMNS]
+    if unknown:
+        return f'Unknown columns: {", ".join(unknown)}.'
+    return None
+
+
+def create_student_import(source, filename='', actor=None):
+    error = check_import_header(source)
+    if error:
+        raise ValueError(error)
+    total = sum(1 for _ in _reader(source))
+    return StudentImport.objects.create(actor=actor, filename=filename, source=source, total_rows=total)
+
+
+class ImportLookups:
+    # Programs and sections loaded once per run, so row validation never
+    # queries per foreign key.
+    def __init__(self):
+        self.programs = {}
+        for pk, code in Program.objects.values_list('pk', 'code'):
+            self.programs[code.lower()] = pk
+            self.programs[str(pk)] = pk
+        self.sections = {}
+        for pk, program_id, name in Section.objects.values_list('pk', 'program_id', 'name'):
+            self.sections[(program_id, name.lower())] = pk
+            self.sections[(program_id, str(pk))] = pk
+        self.fields = {name: Student._meta.get_field(name) for name in IMPORT_COLUMNS}
+
+    def clean_value(self, field, raw):
+        if raw == '':
+            if field.null:
+                return None
+            if field.has_default():
+                return field.get_default()
+        return field.clean(raw, None)
+
+    def clean_row(self, row):
+        # (Student kwargs, {column: [messages]}) for one CSV row.
+        values, errors = {}, {}
+        if None in row:
+            errors['row'] = ['Row has more values than the header.']
+        program_id = self.programs.get((row.get('program') or '').strip().lower())
+        for name, raw in row.items():
+            if name is None:
+                continue
+            raw = (raw or '').strip()
+            if name == 'program':
+                if program_id is None:
+                    errors[name] = ['Unknown program.' if raw else 'This field is required.']
+                values['program_id'] = program_id
+            elif name == 'section':
+                if not raw:
+                    values['section_id'] = None
+                elif program_id is not None:
+                    section_id = self.sections.get((program_id, raw.lower()))
+                    if section_id is None:
+                        errors[name] = ['Unknown section for this program.']
+                    values['section_id'] = section_id
+            else:
+                try:
+                    values[name] = self.clean_value(self.fields[name], raw)
+                except DjangoValidationError as exc:
+                    errors[name] = exc.messages
+        return values, errors
+
+
+def _row_errors(line, student_id, errors):
+    return {'row': line, 'student_id': student_id, 'errors': errors}
+
+
+def import_rows(rows, lookups, actor=None, import_id=None):
+    # Validates and inserts one chunk of (line number, row) pairs. Returns
+    # (created students, per-row error entries).
+    candidates, report = [], []
+    for line, row in rows:
+        values, errors = lookups.clean_row(row)
+        student_id = (row.get('student_id') or '').strip()
+        if errors:
+            report.append(_row_errors(line, student_id, errors))
+        else:
+            candidates.append((line, values))
+
+    ids = [values['student_id'] for _, values in candidates]
+    taken = set(Student.objects.filter(student_id__in=ids).values_list('student_id', flat=True))
+    students, seen = [], set()
+    for line, values in candidates:
+        student_id = values['student_id']
+        if student_id in taken or student_id in seen:
+            report.append(_row_errors(line, student_id, {'student_id': ['A student with this student ID already exists.']}))
+            continue
+        seen.add(student_id)
+        students.append(Student(**values))
+    report.sort(key=lambda entry: entry['row'])
+    if not students:
+        return [], report
+
+    # bulk_create skips Student.save and its signals, and MySQL does not
+    # return the new pks, so the rows are read back for the name index and
+    # the audit trail.
+    Student.objects.bulk_create(students, batch_size=len(students))
+    created = list(Student.objects.filter(student_id__in=seen).only('pk', 'student_id', *NAME_FIELDS))
+    sync_student_name_index(created)
+    record_audit_entries(
+        audit_entry(actor, 'import', 'Student', student.pk, {'student_import': import_id}) for student in created
+    )
+    return created, report
+
+
+def run_student_import(import_id, chunk_size=None):
+    # Safe to call again after a crash or failure, and against a concurrent
+    # run (redelivery, resume): every chunk locks the import row and starts
+    # from its processed_rows checkpoint.
+    job = StudentImport.objects.select_related('actor').get(pk=import_id)
+    if job.status == 'completed':
+        return job
+    job.status = 'running'
+    job.last_error = ''
+    job.save(update_fields=['status', 'last_error', 'updated_at'])
+
+    chunk_size = chunk_size or import_chunk_size()
+    lookups = ImportLookups()
+    rows = enumerate(_reader(job.source), start=2)
+    position = 0
+    try:
+        while True:
+            with transaction.atomic():
+                job = StudentImport.objects.select_for_update().select_related('actor').get(pk=import_id)
+                if job.status == 'completed':
+                    return job
+                skipped = len(list(islice(rows, job.processed_rows - position)))
+                chunk = list(islice(rows, chunk_size))
+                position += skipped + len(chunk)
+                if not chunk:
+                    # The CSV is only needed to resume; the error report
+                    # keeps what matters.
+                    job.status = 'completed'
+                    job.source = ''
+                    job.save(update_fields=['status', 'source', 'updated_at'])
+                    return job
+                created, report = import_rows(chunk, lookups, actor=job.actor, import_id=job.pk)
+                job.processed_rows += len(chunk)
+                job.created_count += len(created)
+                job.error_count += len(report)
+                job.errors.extend(report)
+                job.save(update_fields=['processed_rows', 'created_count', 'error_count', 'errors', 'updated_at'])
+    except Exception as exc:
+        StudentImport.objects.filter(pk=import_id).update(status='failed', last_error=str(exc), updated_at=timezone.now())
+        raise
+
+
+def error_report_rows(job):
+    for entry in job.errors:
+        for field, messages in entry['errors'].items():
+            for message in messages:
+                yield {'row': entry['row'], 'student_id': entry['student_id'], 'field': field, 'message': message}
@@ -0,0 +1,77 @@
+import time
+import uuid
+
+from django.core.cache import cache
+
+JOB_TTL = 60 * 60 * 24
+JOB_COUNTERS = ('processed', 'created', 'failed')
+
+
+def _key(job_id, field):
+    return f'job:{job_id}:{field}'
+
+
+def create_job(kind, total, **meta):
+    # Job state lives only in the shared cache (Redis in deployment) so
+    # workers can bump counters and pollers can read them without MySQL.
+    job_id = uuid.uuid4().hex
+    values = {_key(job_id, counter): 0 for counter in JOB_COUNTERS}
+    values[_key(job_id, 'meta')] = {'kind': kind, 'total': total, 'created_at': time.time(), **meta}
+    cache.set_many(values, timeout=JOB_TTL)
+    return job_id
+
+
+def mark_job_started(job_id):
+    if job_id:
+        cache.add(_key(job_id, 'started_at'), time.time(), timeout=JOB_TTL)
+
+
+def record_job_progress(job_id, processed=0, created=0, failed=0):
+    if not job_id:
+        return
+    for counter, amount in zip(JOB_COUNTERS, (processed, created, failed)):
+        if amount:
+            try:
+                cache.incr(_key(job_id, counter), amount)
+            except ValueError:
+                # Counter expired; the job is past its TTL and no longer polled.
+                pass
+
+
+def get_job_status(job_id):
+    fields = ['meta', 'started_at', *JOB_COUNTERS]
+    values = cache.get_many([_key(job_id, field) for field in fields])
+    meta = values.get(_key(job_id, 'meta'))
+    if meta is None:
+        return None
+
+    total = meta['total']
+    processed, created, failed = (values.get(_key(job_id, counter), 0) for counter in JOB_COUNTERS)
+    started_at = values.get(_key(job_id, 'started_at'))
+    done = processed + failed
+
+    if done >= total and failed:
+        job_status = 'completed_with_errors' if processed else 'failed'
+    elif done >= total:
+        job_status = 'completed'
+    elif started_at:
+        job_status = 'running'
+    else:
+        job_status = 'queued'
+
+    eta_seconds = None
+    if job_status == 'running' and done:
+        elapsed = time.time() - started_at
+        eta_seconds = round(elapsed / done * (total - done), 1)
+
+    return {
+        'job_id': job_id,
+        'kind': meta['kind'],
+        'status': job_status,
+        'total_students': total,
+        'students_processed': processed,
+        'rows_created': created,
+        'failures': failed,
+        'eta_seconds': eta_seconds,
+        **{key: value for key, value in meta.items() if key not in ('kind', 'total')},
+    }
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from registrar.archive import ARCHIVE_BATCH_SIZE, archive_audit_entries, cold_storage_dir, export_cold_entries, month_start
+from registrar.models import AuditLog, AuditLogArchive
+
+
+class Command(BaseCommand):
+    help = 'Roll AuditLog rows past the hot window into AuditLogArchive, and old archive rows into gzip files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hot-months', type=int, default=None, help='Months kept in AuditLog, including the current one.')
+        parser.add_argument('--cold-months', type=int, default=None, help='Months kept in the database before export to files.')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would move.')
+
+    def handle(self, *args, **options):
+        hot_months = options['hot_months']
+        if hot_months is None:
+            hot_months = getattr(settings, 'REGISTRAR_AUDIT_HOT_MONTHS', 3)
+        cold_months = options['cold_months']
+        if cold_months is None:
+            cold_months = getattr(settings, 'REGISTRAR_AUDIT_COLD_MONTHS', 24)
+        hot_before = month_start(hot_months)
+        cold_before = month_start(max(cold_months, hot_months))
+
+        if options['dry_run']:
+            archive = AuditLog.objects.filter(created_at__lt=hot_before).count()
+            export = AuditLogArchive.objects.filter(created_at__lt=cold_before).count()
+            self.stdout.write(f'{archive} audit rows before {hot_before:%Y-%m-%d} would be archived.')
+            self.stdout.write(f'{export} archive rows before {cold_before:%Y-%m-%d} would be exported.')
+            return
+
+        archived = archive_audit_entries(hot_before, batch_size=options['batch_size'])
+        exported = export_cold_entries(cold_before, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} audit rows before {hot_before:%Y-%m-%d}.'))
+        self.stdout.write(self.style.SUCCESS(
+            f'Exported {exported} archive rows before {cold_before:%Y-%m-%d} to {cold_storage_dir()}.'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from registrar.models import AcademicTerm, Student
+from registrar.reports import DRY_RUN_CSV_FIELDS, auto_load_dry_run, csv_stream, flatten_dry_run, ndjson_stream
+
+
+class Command(BaseCommand):
+    help = 'Simulate auto-load for every active student in a term and stream the per-student diff.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('term_id', type=int)
+        parser.add_argument('--format', choices=['ndjson', 'csv'], default='ndjson')
+        parser.add_argument('--program', type=int, help='Limit the run to one program.')
+
+    def handle(self, *args, **options):
+        try:
+            term = AcademicTerm.objects.get(pk=options['term_id'])
+        except AcademicTerm.DoesNotExist:
+            raise CommandError('Specified term does not exist.')
+
+        students = Student.objects.filter(is_active=True)
+        if options['program']:
+            students = students.filter(program_id=options['program'])
+
+        rows = auto_load_dry_run(term, students)
+        if options['format'] == 'csv':
+            lines = csv_stream(flatten_dry_run(rows), DRY_RUN_CSV_FIELDS)
+        else:
+            lines = ndjson_stream(rows)
+        for line in lines:
+            self.stdout.write(line, ending='')
@@ -0,0 +1,70 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from registrar import fastpath
+from registrar.models import Department, Program, Student
+from registrar.serializers import StudentSerializer
+
+
+class Command(BaseCommand):
+    help = 'Time the serializer and fast list paths over synthetic students (rolled back afterwards).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._seed(options['rows'])
+            queryset = Student.objects.filter(student_id__startswith='BENCH-').order_by('student_id')
+            columns, build = fastpath.compile_row_builder(StudentSerializer())
+
+            def serializer_path():
+                return JSONRenderer().render(StudentSerializer(queryset.all(), many=True).data)
+
+            def fast_path():
+                return fastpath.render_json([build(row) for row in queryset.values(*columns)])
+
+            if serializer_path() != fast_path():
+                raise CommandError('Fast path output differs from the serializer output.')
+            slow = self._best(serializer_path, options['repeat'])
+            fast = self._best(fast_path, options['repeat'])
+            transaction.set_rollback(True)
+
+        encoder = 'orjson' if fastpath.orjson is not None else 'json'
+        self.stdout.write(f'{options["rows"]} students, best of {options["repeat"]}:')
+        self.stdout.write(f'  serializer + JSONRenderer: {slow * 1000:.1f} ms')
+        self.stdout.write(f'  values() rows + {encoder}: {fast * 1000:.1f} ms')
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {slow / fast:.1f}x, output identical.'))
+
+    def _seed(self, count):
+        department = Department.objects.create(name='Benchmark Department', code='BENCH')
+        program = Program.objects.create(name='Benchmark Program', code='BENCH', department=department)
+        Student.objects.bulk_create(
+            Student(
+                student_id=f'BENCH-{index:06d}',
+                first_name='Maria',
+                last_name=f'Santos {index}',
+                middle_name='Reyes',
+                date_of_birth=date(2004, 1, 1 + index % 28),
+                email_address=f'student{index}@example.com',
+                home_address='123 Rizal Avenue, Quezon City',
+                program=program,
+                year_level=1 + index % 4,
+                semester=1,
+                academic_year='2025-2026',
+            )
+            for index in range(count)
+        )
+
+    def _best(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
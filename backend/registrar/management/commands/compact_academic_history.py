@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from registrar.history import (
+    HISTORY_BATCH_SIZE,
+    compact_existing_histories,
+    expand_existing_histories,
+    prune_unreferenced_profiles,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Move AcademicHistory profile columns into shared HistoryProfile rows (or back with --expand), '
+        'then delete profiles no snapshot references.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--expand', action='store_true', help='Copy profiles back onto every snapshot row.')
+        parser.add_argument('--batch-size', type=int, default=HISTORY_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if options['expand']:
+            count = expand_existing_histories(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Expanded {count} academic history snapshots.'))
+        else:
+            count = compact_existing_histories(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Compacted {count} academic history snapshots.'))
+        pruned = prune_unreferenced_profiles(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {pruned} unreferenced history profiles.'))
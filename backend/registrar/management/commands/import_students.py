@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from registrar.imports import IMPORT_ERROR_CSV_FIELDS, create_student_import, error_report_rows, run_student_import
+from registrar.models import StudentImport
+from registrar.reports import csv_stream
+
+
+class Command(BaseCommand):
+    help = 'Import new students from an intake CSV and write a per-row error report.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help='UTF-8 CSV with a header row.')
+        parser.add_argument('--resume', type=int, help='Continue an unfinished import by id instead.')
+        parser.add_argument('--chunk-size', type=int, help='Rows per transaction.')
+        parser.add_argument('--errors', help='Write the error report CSV here instead of stdout.')
+
+    def handle(self, *args, **options):
+        if options['resume']:
+            try:
+                job = StudentImport.objects.get(pk=options['resume'])
+            except StudentImport.DoesNotExist:
+                raise CommandError('Specified import does not exist.')
+        elif options['path']:
+            try:
+                with open(options['path'], encoding='utf-8-sig') as handle:
+                    source = handle.read()
+            except (OSError, UnicodeDecodeError) as exc:
+                raise CommandError(f'Could not read {options["path"]}: {exc}')
+            try:
+                job = create_student_import(source, filename=options['path'])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+        else:
+            raise CommandError('Give a CSV path or --resume <import id>.')
+
+        started = time.perf_counter()
+        job = run_student_import(job.pk, chunk_size=options['chunk_size'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Import {job.pk}: {job.created_count} students created, {job.error_count} rows rejected '
+            f'out of {job.total_rows} in {elapsed:.1f}s.'
+        ))
+
+        if not job.error_count:
+            return
+        lines = csv_stream(error_report_rows(job), IMPORT_ERROR_CSV_FIELDS)
+        if options['errors']:
+            with open(options['errors'], 'w', newline='', encoding='utf-8') as handle:
+                handle.writelines(lines)
+            self.stdout.write(f'Error report written to {options["errors"]}.')
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
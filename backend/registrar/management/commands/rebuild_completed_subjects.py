@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from registrar.completions import completed_subject_drift, rebuild_completed_subjects
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the completed-subjects table from StudentLoad and report any drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report drift; do not modify anything.')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            missing, stale = completed_subject_drift()
+        else:
+            with transaction.atomic():
+                missing, stale = rebuild_completed_subjects()
+
+        for student_id, subject_id in sorted(missing):
+            self.stdout.write(f'missing: student={student_id} subject={subject_id}')
+        for student_id, subject_id in sorted(stale):
+            self.stdout.write(f'stale: student={student_id} subject={subject_id}')
+
+        summary = f'{len(missing)} missing, {len(stale)} stale completed-subject rows'
+        if not missing and not stale:
+            self.stdout.write(self.style.SUCCESS('No drift: ' + summary))
+        elif options['check']:
+            self.stdout.write(self.style.WARNING('Drift found: ' + summary))
+        else:
+            self.stdout.write(self.style.SUCCESS('Repaired ' + summary))
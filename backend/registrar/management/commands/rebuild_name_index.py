@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from registrar.search import INDEX_BATCH_SIZE, name_index_drift, rebuild_name_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the student name trigram index used by /students/search/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report students whose index rows are stale.')
+        parser.add_argument('--batch-size', type=int, default=INDEX_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if options['check']:
+            drifted = name_index_drift()
+            for student_pk in drifted:
+                self.stdout.write(f'stale: student={student_pk}')
+            if drifted:
+                self.stdout.write(self.style.WARNING(f'Drift found: {len(drifted)} students'))
+            else:
+                self.stdout.write(self.style.SUCCESS('No drift in the name index.'))
+            return
+
+        count = rebuild_name_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} students.'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from registrar.models import Student
+from registrar.promotion import chunked_student_pks
+from registrar.transcripts import refresh_transcripts
+
+
+class Command(BaseCommand):
+    help = 'Rebuild stale materialized transcript terms, e.g. before printing a graduating batch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--program', type=int, help='Only students of this program id.')
+        parser.add_argument('--year-level', type=int, help='Only students at this year level.')
+
+    def handle(self, *args, **options):
+        students = Student.objects.filter(is_active=True)
+        if options['program']:
+            students = students.filter(program_id=options['program'])
+        if options['year_level']:
+            students = students.filter(year_level=options['year_level'])
+
+        built = 0
+        for student_pks in chunked_student_pks(students):
+            built += refresh_transcripts(student_pks)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {built} transcript terms.'))
@@ -0,0 +1,14 @@
+from .audit import audit_checkpoint
+
+
+class AuditFlushMiddleware:
+    # Writes the audit entries buffered while handling a request in one
+    # bulk insert once the response is ready.
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            return self.get_response(request)
+        finally:
+            audit_checkpoint()
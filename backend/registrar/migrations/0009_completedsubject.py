@@ -0,0 +1,40 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_completed_subjects(apps, schema_editor):
+    StudentLoad = apps.get_model('registrar', 'StudentLoad')
+    CompletedSubject = apps.get_model('registrar', 'CompletedSubject')
+    pairs = (
+        StudentLoad.objects.filter(status__in=['passed', 'completed'])
+        .values_list('student_id', 'subject_id')
+        .distinct()
+    )
+    CompletedSubject.objects.bulk_create(
+        [CompletedSubject(student_id=student_id, subject_id=subject_id) for student_id, subject_id in pairs],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0008_academichistory_admission_date_academichistory_age_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompletedSubject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='completed_subjects', to='registrar.student')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='registrar.subject')),
+            ],
+            options={
+                'unique_together': {('student', 'subject')},
+            },
+        ),
+        migrations.RunPython(populate_completed_subjects, migrations.RunPython.noop),
+    ]
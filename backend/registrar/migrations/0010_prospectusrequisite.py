@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0009_completedsubject'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProspectusRequisite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(default='prerequisite', max_length=20)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='requisites', to='registrar.prospectusentry')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='required_by', to='registrar.subject')),
+            ],
+            options={
+                'unique_together': {('entry', 'subject', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0010_prospectusrequisite'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PromotionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('filters', models.JSONField(default=dict)),
+                ('target', models.JSONField(default=dict)),
+                ('total_students', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('actor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('term', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='registrar.academicterm')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PromotionJobChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('index', models.PositiveIntegerField()),
+                ('student_ids', models.JSONField(default=list)),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('committed_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='registrar.promotionjob')),
+            ],
+            options={
+                'ordering': ['index'],
+                'unique_together': {('job', 'index')},
+            },
+        ),
+    ]
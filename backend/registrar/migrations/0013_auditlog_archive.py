@@ -0,0 +1,41 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0012_historyprofile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLogArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('action', models.CharField(max_length=20)),
+                ('entity', models.CharField(max_length=50)),
+                ('entity_id', models.CharField(max_length=50)),
+                ('payload', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['created_at', 'id'], name='registrar_a_created_037d5f_idx'),
+        ),
+        migrations.AddField(
+            model_name='auditlogarchive',
+            name='actor',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='auditlogarchive',
+            index=models.Index(fields=['created_at', 'id'], name='registrar_a_created_ad89fd_idx'),
+        ),
+    ]
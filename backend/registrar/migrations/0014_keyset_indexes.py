@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0013_auditlog_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academichistory',
+            index=models.Index(fields=['academic_year', 'semester', 'id'], name='registrar_a_academi_bf6764_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['name', 'id'], name='registrar_d_name_92b2cf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(fields=['name', 'id'], name='registrar_p_name_dcd08e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promotionjob',
+            index=models.Index(fields=['created_at', 'id'], name='registrar_p_created_9a1749_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='section',
+            index=models.Index(fields=['name', 'program', 'year_level', 'semester', 'id'], name='registrar_s_name_60f18e_idx'),
+        ),
+    ]
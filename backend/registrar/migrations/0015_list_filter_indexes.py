@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0014_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academichistory',
+            index=models.Index(fields=['program', 'year_level', 'semester'], name='registrar_a_program_12aab9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['is_active', 'program', 'year_level', 'semester'], name='registrar_s_is_acti_8d03e4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['is_active', 'academic_year', 'semester'], name='registrar_s_is_acti_173273_idx'),
+        ),
+    ]
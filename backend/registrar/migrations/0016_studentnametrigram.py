@@ -0,0 +1,48 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:45
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_name_trigrams(apps, schema_editor):
+    Student = apps.get_model('registrar', 'Student')
+    StudentNameTrigram = apps.get_model('registrar', 'StudentNameTrigram')
+    rows = []
+    for student in Student.objects.values('pk', 'first_name', 'middle_name', 'last_name', 'extension_name').iterator():
+        text = ' '.join(student[field] or '' for field in ('first_name', 'middle_name', 'last_name', 'extension_name'))
+        text = ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+        grams = set()
+        for word in re.sub(r'[^0-9a-z]+', ' ', text.lower()).split():
+            padded = f'  {word} '
+            grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+        rows.extend(StudentNameTrigram(student_id=student['pk'], trigram=gram) for gram in grams)
+        if len(rows) >= 5000:
+            StudentNameTrigram.objects.bulk_create(rows, batch_size=1000)
+            rows = []
+    StudentNameTrigram.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0015_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentNameTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='registrar.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['trigram', 'student'], name='registrar_s_trigram_d13ce7_idx')],
+                'unique_together': {('student', 'trigram')},
+            },
+        ),
+        migrations.RunPython(populate_name_trigrams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-16 23:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_stale_transcript_terms(apps, schema_editor):
+    # Every existing student term starts stale; it is built on first read.
+    AcademicHistory = apps.get_model('registrar', 'AcademicHistory')
+    StudentLoad = apps.get_model('registrar', 'StudentLoad')
+    TranscriptTerm = apps.get_model('registrar', 'TranscriptTerm')
+    keys = set(AcademicHistory.objects.values_list('student_id', 'academic_year', 'semester'))
+    keys.update(StudentLoad.objects.values_list('student_id', 'term__year_label', 'term__semester').distinct())
+    TranscriptTerm.objects.bulk_create(
+        [
+            TranscriptTerm(student_id=student_id, academic_year=academic_year, semester=semester)
+            for student_id, academic_year, semester in keys
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrar', '0016_studentnametrigram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='academicsubject',
+            name='grade',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True),
+        ),
+        migrations.CreateModel(
+            name='TranscriptTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('academic_year', models.CharField(max_length=20)),
+                ('semester', models.PositiveSmallIntegerField()),
+                ('year_level', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('subjects', models.JSONField(default=list)),
+                ('units', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('earned_units', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('graded_units', models.DecimalField(decimal_places=1, default=0, max_digits=6)),
+                ('grade_points', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('stale', models.BooleanField(default=True)),
+                ('revision', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(blank=True, null=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='registrar.student')),
+            ],
+            options={
+                'unique_together': {('student', 'academic_year', 'semester')},
+            },
+        ),
+        migrations.RunPython(populate_stale_transcript_terms, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 ﻿from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -14,6 +15,9 @@ class Department(TimeStampedModel):
     name = models.CharField(max_length=120)
     code = models.CharField(max_length=20, blank=True, default='')
 
+    class Meta:
+        indexes = [models.Index(fields=['name', 'id'])]
+
     def __str__(self) -> str:
         return f'{self.code} - {self.name}' if self.code else self.name
 
@@ -25,6 +29,9 @@ class Program(TimeStampedModel):
     program_adviser = models.CharField(max_length=120, blank=True)
     school_dean = models.CharField(max_length=120, blank=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['name', 'id'])]
+
     def __str__(self) -> str:
         return self.name
 
@@ -44,6 +51,9 @@ class Section(TimeStampedModel):
     year_level = models.PositiveSmallIntegerField(db_index=True)
     semester = models.PositiveSmallIntegerField(default=1, db_index=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['name', 'program', 'year_level', 'semester', 'id'])]
+
 
 class Subject(TimeStampedModel):
     code = models.CharField(max_length=20, unique=True)
@@ -71,6 +81,17 @@ class ProspectusEntry(TimeStampedModel):
         ]
 
 
+class ProspectusRequisite(TimeStampedModel):
+    # Additional requisites for a prospectus entry on top of its legacy
+    # single `prerequisite` FK.
+    entry = models.ForeignKey(ProspectusEntry, on_delete=models.CASCADE, related_name='requisites')
+    subject = models.ForeignKey(Subject, on_delete=models.PROTECT, related_name='required_by')
+    kind = models.CharField(max_length=20, default='prerequisite')  # prerequisite, corequisite
+
+    class Meta:
+        unique_together = ('entry', 'subject', 'kind')
+
+
 class Student(TimeStampedModel):
     student_id = models.CharField(max_length=30, unique=True, db_index=True)
     first_name = models.CharField(max_length=80)
@@ -110,6 +131,12 @@ class Student(TimeStampedModel):
     dean_approval_status = models.CharField(max_length=20, default='pending')
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', 'program', 'year_level', 'semester']),
+            models.Index(fields=['is_active', 'academic_year', 'semester']),
+        ]
+
     def __str__(self) -> str:
         return self.student_id
 
@@ -124,6 +151,36 @@ class StudentLoad(TimeStampedModel):
         unique_together = ('student', 'term', 'subject')
 
 
+class CompletedSubject(models.Model):
+    # Denormalized from StudentLoad rows with a passed/completed status so
+    # prerequisite checks are a set lookup. Rebuild with
+    # `manage.py rebuild_completed_subjects`.
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='completed_subjects')
+    subject = models.ForeignKey(Subject, on_delete=models.PROTECT, related_name='+')
+
+    class Meta:
+        unique_together = ('student', 'subject')
+
+
+class StudentNameTrigram(models.Model):
+    # Trigrams of a student's normalized name parts, maintained from Student
+    # writes by registrar.search; see `manage.py rebuild_name_index`.
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='+')
+    trigram = models.CharField(max_length=3)
+
+    class Meta:
+        unique_together = ('student', 'trigram')
+        indexes = [models.Index(fields=['trigram', 'student'])]
+
+
+class HistoryProfile(models.Model):
+    # Personal, contact, family and schooling columns shared by every
+    # AcademicHistory snapshot with identical values (see registrar.history).
+    digest = models.CharField(max_length=64, unique=True)
+    data = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
 class AcademicHistory(TimeStampedModel):
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='academic_history')
     academic_year = models.CharField(max_length=20)  # "2025-2026"
@@ -131,6 +188,9 @@ class AcademicHistory(TimeStampedModel):
     semester = models.PositiveSmallIntegerField()  # 1, 2, Summer
     program = models.ForeignKey(Program, on_delete=models.PROTECT)
     section = models.ForeignKey(Section, on_delete=models.PROTECT, null=True, blank=True)
+    # Compact snapshots point at a shared profile and leave the profile
+    # columns below empty; registrar.history.materialize fills them back in.
+    profile = models.ForeignKey(HistoryProfile, on_delete=models.PROTECT, null=True, blank=True, related_name='+')
     
     # Personal Information (snapshot from Student at time of semester)
     first_name = models.CharField(max_length=80, null=True, blank=True)
@@ -180,6 +240,10 @@ class AcademicHistory(TimeStampedModel):
     class Meta:
         unique_together = ('student', 'academic_year', 'semester')
         ordering = ['-academic_year', '-semester']
+        indexes = [
+            models.Index(fields=['academic_year', 'semester', 'id']),
+            models.Index(fields=['program', 'year_level', 'semester']),
+        ]
 
     def __str__(self) -> str:
         return f'{self.student.student_id} - {self.academic_year} Year {self.year_level} Sem {self.semester}'
@@ -190,6 +254,7 @@ class AcademicSubject(TimeStampedModel):
     subject = models.ForeignKey(Subject, on_delete=models.PROTECT)
     credits = models.DecimalField(max_digits=4, decimal_places=1)
     status = models.CharField(max_length=20, default='enrolled')  # enrolled, completed
+    grade = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)  # 1.00 - 5.00
     
     class Meta:
         unique_together = ('academic_history', 'subject')
@@ -198,9 +263,99 @@ class AcademicSubject(TimeStampedModel):
         return f'{self.academic_history.student.student_id} - {self.subject.code}'
 
 
+class TranscriptTerm(models.Model):
+    # Materialized transcript of one student term, rebuilt by
+    # registrar.transcripts only while `stale`. Writes to the source rows
+    # mark the term stale and bump `revision`.
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='+')
+    academic_year = models.CharField(max_length=20)
+    semester = models.PositiveSmallIntegerField()
+    year_level = models.PositiveSmallIntegerField(null=True, blank=True)
+    subjects = models.JSONField(default=list)
+    units = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    earned_units = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    graded_units = models.DecimalField(max_digits=6, decimal_places=1, default=0)
+    grade_points = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    stale = models.BooleanField(default=True)
+    revision = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('student', 'academic_year', 'semester')
+
+
+class PromotionJob(TimeStampedModel):
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    status = models.CharField(max_length=20, default='pending')  # pending, running, completed, failed
+    filters = models.JSONField(default=dict)
+    target = models.JSONField(default=dict)
+    term = models.ForeignKey(AcademicTerm, on_delete=models.PROTECT, null=True, blank=True, related_name='+')
+    total_students = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['created_at', 'id'])]
+
+
+class PromotionJobChunk(TimeStampedModel):
+    # Student pks are frozen when the job is created; a chunk's promotion and
+    # its `committed` checkpoint are written in the same transaction.
+    job = models.ForeignKey(PromotionJob, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+    student_ids = models.JSONField(default=list)
+    status = models.CharField(max_length=20, default='pending')  # pending, committed, failed
+    processed = models.PositiveIntegerField(default=0)
+    committed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('job', 'index')
+        ordering = ['index']
+
+
+class StudentImport(TimeStampedModel):
+    # Uploaded intake CSV, processed in chunks by registrar.imports. Each
+    # chunk's students and the processed_rows checkpoint commit together, so
+    # a rerun continues after the last committed chunk.
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    status = models.CharField(max_length=20, default='pending')  # pending, running, completed, failed
+    filename = models.CharField(max_length=255, blank=True)
+    source = models.TextField(blank=True)
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['created_at', 'id'])]
+
+
 class AuditLog(TimeStampedModel):
+    # The event time, set when the entry is built; buffered entries are
+    # written later than they happen.
+    created_at = models.DateTimeField(default=timezone.now)
     actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     action = models.CharField(max_length=20)
     entity = models.CharField(max_length=50)
     entity_id = models.CharField(max_length=50)
     payload = models.JSONField(default=dict)
+
+    class Meta:
+        indexes = [models.Index(fields=['created_at', 'id'])]
+
+
+class AuditLogArchive(models.Model):
+    # Warm tier for AuditLog rows past the hot window. Rows keep their
+    # original id and timestamps; see `manage.py archive_audit_log`.
+    id = models.BigIntegerField(primary_key=True)
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+')
+    action = models.CharField(max_length=20)
+    entity = models.CharField(max_length=50)
+    entity_id = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=['created_at', 'id'])]
@@ -0,0 +1,129 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    # Forward-only keyset pagination over a unique, indexed ordering (the
+    # view's `keyset_ordering`). The cursor holds the ordering values of the
+    # last row served, so every page is a range scan regardless of depth.
+    # Existing clients can send ?paginate=false to get the full list as a
+    # bare array, unless the view sets allow_unpaginated = False.
+    page_size = api_settings.PAGE_SIZE or 50
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    legacy_query_param = 'paginate'
+    ordering = ('id',)
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def is_unpaginated(self, request, view):
+        value = request.query_params.get(self.legacy_query_param, '').lower()
+        return value in ('false', '0', 'no') and getattr(view, 'allow_unpaginated', True)
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, 'keyset_ordering', self.ordering))
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request, model, ordering):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if len(values) != len(ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(ordering, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, row, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def keyset_filter(self, ordering, values):
+        # (a, b) after (x, y) == a > x OR (a = x AND b > y), per direction.
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            clause = Q(**{f'{name}__{lookup}': values[index]})
+            for previous, value in zip(ordering[:index], values[:index]):
+                clause &= Q(**{previous.lstrip('-'): value})
+            condition |= clause
+        return condition
+
+    def sort_key(self, ordering):
+        # Merging several querysets needs one direction for every field.
+        descending = {field.startswith('-') for field in ordering}
+        if len(descending) != 1:
+            raise ValueError('Merged keyset pages need a single ordering direction.')
+        names = [field.lstrip('-') for field in ordering]
+        return (lambda row: tuple(getattr(row, name) for name in names)), descending.pop()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        if self.is_unpaginated(request, view):
+            return None
+        ordering = self.get_ordering(view)
+        self.page_size_value = self.get_page_size(request)
+        self.request = request
+
+        rows = []
+        for queryset in querysets:
+            values = self.decode_cursor(request, queryset.model, ordering)
+            queryset = queryset.order_by(*ordering)
+            if values is not None:
+                queryset = queryset.filter(self.keyset_filter(ordering, values))
+            rows.extend(queryset[:self.page_size_value + 1])
+
+        if len(querysets) > 1:
+            key, reverse = self.sort_key(ordering)
+            rows.sort(key=key, reverse=reverse)
+
+        self.has_next = len(rows) > self.page_size_value
+        page = rows[:self.page_size_value]
+        self.next_cursor = self.encode_cursor(page[-1], ordering) if self.has_next else None
+        return page
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_first_link(self):
+        return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
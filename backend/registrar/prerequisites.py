@@ -0,0 +1,178 @@
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .caching import VersionedLRUCache
+from .curriculum import curriculum_tiers
+from .models import ProspectusEntry, ProspectusRequisite
+
+PREREQUISITE_GRAPH_NAMESPACE = 'prerequisite-graph'
+PREREQUISITE = 'prerequisite'
+COREQUISITE = 'corequisite'
+
+_graphs = VersionedLRUCache(
+    PREREQUISITE_GRAPH_NAMESPACE,
+    maxsize=getattr(settings, 'REGISTRAR_PREREQUISITE_GRAPH_CACHE_SIZE', 256),
+)
+
+_EMPTY = frozenset()
+
+
+class PrerequisiteGraph(NamedTuple):
+    # Subject-level requisites of one curriculum variant of a program: each
+    # subject takes its edges from the most specific (academic_year, section)
+    # tier that lists it, as ResolvedCurriculum.entry_for_subject does.
+    prerequisites: dict
+    corequisites: dict
+    closure: dict
+    order: tuple
+    cycle: tuple
+
+    def missing_prerequisites(self, subject_id, completed):
+        return self.prerequisites.get(subject_id, _EMPTY) - completed
+
+    def outstanding_prerequisites(self, subject_id, completed):
+        # The whole unfinished chain below a subject, in curriculum order.
+        outstanding = self.closure.get(subject_id, _EMPTY) - completed
+        return [node for node in self.order if node in outstanding]
+
+    def creates_cycle(self, subject_id, prerequisite_id):
+        return subject_id == prerequisite_id or subject_id in self.closure.get(prerequisite_id, _EMPTY)
+
+    def eligible(self, subject_ids, completed, concurrent=_EMPTY):
+        # Prerequisites must already be completed. Co-requisites may also be
+        # taken in the same term, so drop subjects until every remaining one
+        # has its co-requisites completed, concurrent or still selected.
+        selected = [subject_id for subject_id in subject_ids if not self.missing_prerequisites(subject_id, completed)]
+        while True:
+            available = completed | concurrent | set(selected)
+            kept = [
+                subject_id
+                for subject_id in selected
+                if self.corequisites.get(subject_id, _EMPTY) <= available
+            ]
+            if len(kept) == len(selected):
+                return kept
+            selected = kept
+
+
+def _topological_order(nodes, prerequisites):
+    # Kahn's algorithm; any nodes left over sit on a cycle.
+    remaining = {node: len(prerequisites.get(node, _EMPTY)) for node in nodes}
+    dependents = defaultdict(list)
+    for node, requirements in prerequisites.items():
+        for requirement in requirements:
+            dependents[requirement].append(node)
+
+    ready = sorted(node for node, count in remaining.items() if count == 0)
+    order = []
+    while ready:
+        node = ready.pop()
+        order.append(node)
+        for dependent in dependents[node]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    cyclic = sorted(node for node, count in remaining.items() if count > 0)
+    return tuple(order), tuple(cyclic)
+
+
+def build_prerequisite_graph(edges):
+    prerequisites = defaultdict(set)
+    corequisites = defaultdict(set)
+    nodes = set()
+    for subject_id, requisite_id, kind in edges:
+        nodes.add(subject_id)
+        if requisite_id is None:
+            continue
+        nodes.add(requisite_id)
+        if kind == COREQUISITE:
+            corequisites[subject_id].add(requisite_id)
+        else:
+            prerequisites[subject_id].add(requisite_id)
+
+    prerequisites = {node: frozenset(requirements) for node, requirements in prerequisites.items()}
+    order, cycle = _topological_order(nodes, prerequisites)
+
+    closure = {}
+    for node in order + cycle:
+        seen = set()
+        stack = list(prerequisites.get(node, _EMPTY))
+        while stack:
+            requirement = stack.pop()
+            if requirement in seen:
+                continue
+            seen.add(requirement)
+            if requirement in closure:
+                seen |= closure[requirement]
+            else:
+                stack.extend(prerequisites.get(requirement, _EMPTY))
+        closure[node] = frozenset(seen)
+
+    return PrerequisiteGraph(
+        prerequisites=prerequisites,
+        corequisites={node: frozenset(requirements) for node, requirements in corequisites.items()},
+        closure=closure,
+        order=order + cycle,
+        cycle=cycle,
+    )
+
+
+def graph_key(program_id, academic_year='', section_id=None):
+    return (program_id, academic_year or '', section_id)
+
+
+def student_graph_key(student):
+    return graph_key(student.program_id, student.academic_year, student.section_id)
+
+
+def get_prerequisite_graphs(keys):
+    keys = set(keys)
+    _graphs.sync()
+    graphs = {}
+    missing = []
+    for key in keys:
+        graph = _graphs.get(key)
+        if graph is None:
+            missing.append(key)
+        else:
+            graphs[key] = graph
+
+    if missing:
+        # program -> (academic_year, section_id) tier -> subject -> edges
+        tiers = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        entry_tiers = {}
+        entry_rows = ProspectusEntry.objects.filter(program_id__in={key[0] for key in missing}).values_list(
+            'pk', 'program_id', 'academic_year', 'section_id', 'subject_id', 'prerequisite_id'
+        )
+        for pk, program_id, academic_year, section_id, subject_id, prerequisite_id in entry_rows:
+            tier = tiers[program_id][(academic_year, section_id)]
+            tier[subject_id].append((subject_id, prerequisite_id, PREREQUISITE))
+            entry_tiers[pk] = tier
+        requisite_rows = ProspectusRequisite.objects.filter(entry_id__in=entry_tiers).values_list(
+            'entry_id', 'entry__subject_id', 'subject_id', 'kind'
+        )
+        for entry_id, subject_id, requisite_id, kind in requisite_rows:
+            entry_tiers[entry_id][subject_id].append((subject_id, requisite_id, kind))
+
+        for key in missing:
+            program_id, academic_year, section_id = key
+            edges_by_subject = {}
+            for tier in curriculum_tiers(academic_year, section_id):
+                for subject_id, edges in tiers[program_id].get(tier, {}).items():
+                    edges_by_subject.setdefault(subject_id, edges)
+            graph = build_prerequisite_graph(edge for edges in edges_by_subject.values() for edge in edges)
+            _graphs.set(key, graph)
+            graphs[key] = graph
+    return graphs
+
+
+def get_prerequisite_graph(key):
+    return get_prerequisite_graphs([key])[key]
+
+
+def invalidate_prerequisite_graphs():
+    _graphs.clear()
+    transaction.on_commit(_graphs.invalidate)
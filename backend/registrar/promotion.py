@@ -0,0 +1,237 @@
+from typing import NamedTuple
+
+from datetime import date
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .audit import audit_entry, record_audit_entries
+from .history import HISTORY_STORAGE_COMPACT, compact, history_storage_mode
+from .models import AcademicHistory, PromotionJob, PromotionJobChunk, Student
+from .transcripts import mark_transcript_terms_stale
+
+PROMOTION_CHUNK_SIZE = getattr(settings, 'REGISTRAR_PROMOTION_CHUNK_SIZE', 200)
+
+# Student columns copied into every AcademicHistory snapshot; in compact
+# storage the registrar.history.PROFILE_FIELDS subset moves to HistoryProfile.
+SNAPSHOT_FIELDS = [
+    'first_name',
+    'last_name',
+    'middle_name',
+    'extension_name',
+    'gender',
+    'sex',
+    'date_of_birth',
+    'age',
+    'civil_status',
+    'nationality',
+    'admission_date',
+    'scholarship',
+    'course',
+    'home_address',
+    'postal_code',
+    'email_address',
+    'contact_number',
+    'mother_maiden_name',
+    'mother_contact_number',
+    'father_name',
+    'father_contact_number',
+    'elementary_school',
+    'junior_high_school',
+    'senior_high_school',
+    'senior_high_track_strand',
+    'subject_load_schedule',
+    'adviser_name',
+    'adviser_approval_status',
+    'dean_name',
+    'dean_approval_status',
+]
+HISTORY_UPDATE_FIELDS = [
+    'year_level',
+    'program',
+    'section',
+    'profile',
+    *SNAPSHOT_FIELDS,
+    'status',
+    'start_date',
+    'end_date',
+    'updated_at',
+]
+PROMOTED_STUDENT_FIELDS = [
+    'program',
+    'year_level',
+    'academic_year',
+    'semester',
+    'section',
+    'admission_date',
+    'subject_load_schedule',
+    'adviser_name',
+    'adviser_approval_status',
+    'dean_name',
+    'dean_approval_status',
+    'updated_at',
+]
+
+
+class PromotionTarget(NamedTuple):
+    program_id: int
+    year_level: int
+    academic_year: str
+    semester: int
+    section_id: int | None
+    admission_date: object
+    subject_load_schedule: str
+    adviser_name: str
+    dean_name: str
+
+
+def target_to_json(target):
+    data = target._asdict()
+    if data['admission_date']:
+        data['admission_date'] = data['admission_date'].isoformat()
+    return data
+
+
+def target_from_json(data):
+    admission_date = date.fromisoformat(data['admission_date']) if data.get('admission_date') else None
+    return PromotionTarget(**{**data, 'admission_date': admission_date})
+
+
+def history_snapshot(student, **overrides):
+    values = {field: getattr(student, field) for field in SNAPSHOT_FIELDS}
+    values.update(
+        student_id=student.pk,
+        academic_year=student.academic_year,
+        semester=student.semester,
+        year_level=student.year_level,
+        program_id=student.program_id,
+        section_id=student.section_id,
+    )
+    values.update(overrides)
+    return AcademicHistory(**values)
+
+
+def chunked_student_pks(queryset, chunk_size=PROMOTION_CHUNK_SIZE):
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(pks), chunk_size):
+        yield pks[start:start + chunk_size]
+
+
+def _history_upsert_options():
+    options = {'update_conflicts': True, 'update_fields': HISTORY_UPDATE_FIELDS}
+    # MySQL's ON DUPLICATE KEY UPDATE takes no conflict target.
+    if connections[AcademicHistory.objects.db].features.supports_update_conflicts_with_target:
+        options['unique_fields'] = ['student', 'academic_year', 'semester']
+    return options
+
+
+def promote_chunk(student_pks, target, today, actor=None, audit_payload=None):
+    # Statement count is constant per chunk: one locking select, one history
+    # upsert (plus the profile dedupe in compact storage), one student
+    # bulk_update, two transcript staleness writes and one audit bulk_create
+    # once the sink flushes.
+    students = list(Student.objects.select_for_update().filter(pk__in=student_pks).order_by('pk'))
+    snapshots = {}
+    now = timezone.now()
+
+    for student in students:
+        current_academic_year = student.academic_year or target.academic_year
+        previous = history_snapshot(
+            student,
+            academic_year=current_academic_year,
+            semester=student.semester or 1,
+            status='completed',
+            start_date=student.admission_date or today,
+            end_date=today,
+        )
+        snapshots[(student.pk, previous.academic_year, previous.semester)] = previous
+
+        student.program_id = target.program_id
+        student.year_level = target.year_level
+        student.academic_year = target.academic_year
+        student.semester = target.semester
+        student.section_id = target.section_id
+        if target.admission_date and not student.admission_date:
+            student.admission_date = target.admission_date
+        student.subject_load_schedule = target.subject_load_schedule
+        student.adviser_name = target.adviser_name
+        student.adviser_approval_status = 'pending'
+        student.dean_name = target.dean_name
+        student.dean_approval_status = 'pending'
+        student.updated_at = now
+
+        # Keyed like the table's unique constraint so the ongoing record wins
+        # when the previous and target semesters coincide.
+        current = history_snapshot(student, status='ongoing', start_date=today, end_date=None)
+        snapshots[(student.pk, current.academic_year, current.semester)] = current
+
+    if history_storage_mode() == HISTORY_STORAGE_COMPACT:
+        compact(snapshots.values())
+    AcademicHistory.objects.bulk_create(snapshots.values(), **_history_upsert_options())
+    Student.objects.bulk_update(students, PROMOTED_STUDENT_FIELDS)
+    mark_transcript_terms_stale(snapshots)
+    if actor is not None:
+        record_audit_entries(audit_entry(actor, 'promote', 'Student', student.pk, audit_payload) for student in students)
+    return [student.student_id for student in students]
+
+
+def create_promotion_job(students, target, actor=None, term=None, filters=None, chunk_size=PROMOTION_CHUNK_SIZE):
+    with transaction.atomic():
+        job = PromotionJob.objects.create(
+            actor=actor,
+            filters=filters or {},
+            target=target_to_json(target),
+            term=term,
+        )
+        chunks = [
+            PromotionJobChunk(job=job, index=index, student_ids=student_pks)
+            for index, student_pks in enumerate(chunked_student_pks(students, chunk_size=chunk_size))
+        ]
+        PromotionJobChunk.objects.bulk_create(chunks)
+        job.total_students = sum(len(chunk.student_ids) for chunk in chunks)
+        job.save(update_fields=['total_students', 'updated_at'])
+    return job
+
+
+def run_promotion_job(job_id, on_chunk_committed=None):
+    # Safe to call again after a crash or failure: committed chunks are
+    # skipped, so no student is snapshotted or promoted twice.
+    job = PromotionJob.objects.select_related('actor').get(pk=job_id)
+    if job.status == 'completed':
+        return job
+    job.status = 'running'
+    job.last_error = ''
+    job.save(update_fields=['status', 'last_error', 'updated_at'])
+
+    target = target_from_json(job.target)
+    audit_payload = {**job.target, 'term_id': job.term_id, 'promotion_job': job.pk}
+    today = date.today()
+
+    for chunk_pk in job.chunks.exclude(status='committed').values_list('pk', flat=True):
+        try:
+            with transaction.atomic():
+                chunk = PromotionJobChunk.objects.select_for_update().get(pk=chunk_pk)
+                if chunk.status == 'committed':
+                    continue
+                processed = promote_chunk(chunk.student_ids, target, today, actor=job.actor, audit_payload=audit_payload)
+                chunk.status = 'committed'
+                chunk.processed = len(processed)
+                chunk.committed_at = timezone.now()
+                chunk.save(update_fields=['status', 'processed', 'committed_at', 'updated_at'])
+                if on_chunk_committed is not None:
+                    # robust: a failed follow-up is logged, and the committed
+                    # chunk is never reported (and later re-run) as failed.
+                    transaction.on_commit(lambda processed=processed: on_chunk_committed(job, processed), robust=True)
+        except Exception as exc:
+            PromotionJobChunk.objects.filter(pk=chunk_pk).exclude(status='committed').update(
+                status='failed', updated_at=timezone.now()
+            )
+            job.status = 'failed'
+            job.last_error = str(exc)
+            job.save(update_fields=['status', 'last_error', 'updated_at'])
+            raise
+
+    job.status = 'completed'
+    job.save(update_fields=['status', 'updated_at'])
+    return job
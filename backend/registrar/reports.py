@@ -0,0 +1,58 @@
+import csv
+import json
+
+from .models import Student, Subject
+from .services import AUTO_LOAD_BATCH_SIZE, iter_student_chunks, plan_auto_loads
+
+DRY_RUN_CSV_FIELDS = ['student_id', 'program_id', 'year_level', 'outcome', 'subject_code', 'missing_requisites']
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def ndjson_stream(rows):
+    for row in rows:
+        yield json.dumps(row, default=str) + '\n'
+
+
+def csv_stream(rows, fieldnames):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fieldnames)
+    for row in rows:
+        yield writer.writerow([row.get(field, '') for field in fieldnames])
+
+
+def auto_load_dry_run(term, students=None, chunk_size=AUTO_LOAD_BATCH_SIZE):
+    # Generator over every active student, one chunk at a time, so memory
+    # stays flat no matter how many students the term has. Nothing is written.
+    if students is None:
+        students = Student.objects.filter(is_active=True)
+    subject_codes = dict(Subject.objects.values_list('id', 'code'))
+    for chunk in iter_student_chunks(students, chunk_size=chunk_size):
+        for plan in plan_auto_loads(chunk, term):
+            yield {
+                'student_id': plan.student.student_id,
+                'program_id': plan.student.program_id,
+                'year_level': plan.student.year_level,
+                'would_add': [subject_codes[subject_id] for subject_id in plan.add],
+                'blocked': [
+                    {'subject': subject_codes[subject_id], 'missing': [subject_codes[missing_id] for missing_id in missing]}
+                    for subject_id, missing in plan.blocked
+                ],
+            }
+
+
+def flatten_dry_run(rows):
+    for row in rows:
+        base = {'student_id': row['student_id'], 'program_id': row['program_id'], 'year_level': row['year_level']}
+        for code in row['would_add']:
+            yield {**base, 'outcome': 'add', 'subject_code': code}
+        for blocked in row['blocked']:
+            yield {
+                **base,
+                'outcome': 'blocked',
+                'subject_code': blocked['subject'],
+                'missing_requisites': ' '.join(blocked['missing']),
+            }
@@ -0,0 +1,82 @@
+import threading
+
+from django.conf import settings
+from rest_framework.response import Response
+
+from .caching import ReadThroughCache
+from .conditional import table_namespace
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(model):
+    namespace = table_namespace(model)
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = ReadThroughCache(
+                namespace,
+                maxsize=getattr(settings, 'REGISTRAR_RESPONSE_CACHE_L1_SIZE', 256),
+                ttl=getattr(settings, 'REGISTRAR_RESPONSE_CACHE_L1_TTL', 30),
+                timeout=getattr(settings, 'REGISTRAR_RESPONSE_CACHE_TIMEOUT', 300),
+                version_ttl=getattr(settings, 'REGISTRAR_RESPONSE_CACHE_VERSION_TTL', 1),
+                stats_flush_every=getattr(settings, 'REGISTRAR_RESPONSE_CACHE_STATS_FLUSH_EVERY', 100),
+            )
+        return _caches[namespace]
+
+
+def response_cache_stats():
+    stats = {}
+    with _caches_lock:
+        caches = list(_caches.values())
+    for read_cache in caches:
+        stats[read_cache.namespace] = {
+            'process': read_cache.stats.local(),
+            'total': read_cache.stats.shared(ReadThroughCache.METRICS),
+        }
+    return stats
+
+
+class CachedReadMixin:
+    # Read-through cache for list/retrieve response data of a single-table
+    # viewset, keyed on the full request path (filters, cursor, fieldsets).
+    # Every write through the viewset invalidates the table's namespace; the
+    # model signals cover writes made elsewhere.
+    cache_model = None
+
+    @property
+    def response_cache(self):
+        return get_response_cache(self.cache_model)
+
+    def _cached(self, request, handler, *args, **kwargs):
+        computed = {}
+
+        def compute():
+            response = handler(request, *args, **kwargs)
+            computed['response'] = response
+            return response.data
+
+        # Reuse the ETag's version snapshot when there is one, so a body is
+        # never sent under a validator newer than its contents.
+        read_cache = self.response_cache
+        version = (getattr(self, 'table_versions', None) or {}).get(read_cache.namespace)
+        data = read_cache.get_or_set(request.get_full_path(), compute, version=version)
+        return computed.get('response') or Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(request, super().retrieve, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.response_cache.invalidate()
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.response_cache.invalidate()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self.response_cache.invalidate()
@@ -0,0 +1,134 @@
+import re
+import unicodedata
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models import Count
+
+from .models import Student, StudentNameTrigram
+
+NAME_FIELDS = ('first_name', 'middle_name', 'last_name', 'extension_name')
+INDEX_BATCH_SIZE = 1000
+SEARCH_CANDIDATES = 200
+
+
+class NameMatch(NamedTuple):
+    student: Student
+    score: float
+    similarity: float
+
+
+def normalize_name(value):
+    # Lowercase, drop accents ("Peña" -> "pena") and split on anything that
+    # is not a letter or digit.
+    value = unicodedata.normalize('NFKD', value or '')
+    value = ''.join(char for char in value if not unicodedata.combining(char))
+    return re.sub(r'[^0-9a-z]+', ' ', value.lower()).split()
+
+
+def trigrams(text):
+    # pg_trgm-style: each word is padded with two leading blanks and one
+    # trailing blank, so short words and word starts still produce trigrams.
+    grams = set()
+    for word in normalize_name(text):
+        padded = f'  {word} '
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def name_text(student):
+    if isinstance(student, dict):
+        return ' '.join(student.get(field) or '' for field in NAME_FIELDS)
+    return ' '.join(getattr(student, field) or '' for field in NAME_FIELDS)
+
+
+def sync_student_name_index(students):
+    # Brings the trigram rows of the given students in line with their
+    # current names; bulk writers that bypass Student.save call this directly.
+    students = list(students)
+    if not students:
+        return
+    expected = {student.pk: trigrams(name_text(student)) for student in students}
+    actual = defaultdict(set)
+    for student_id, trigram in StudentNameTrigram.objects.filter(student_id__in=expected).values_list(
+        'student_id', 'trigram'
+    ):
+        actual[student_id].add(trigram)
+
+    StudentNameTrigram.objects.bulk_create(
+        [
+            StudentNameTrigram(student_id=student_id, trigram=trigram)
+            for student_id, grams in expected.items()
+            for trigram in grams - actual[student_id]
+        ],
+        batch_size=INDEX_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    for student_id, grams in expected.items():
+        stale = actual[student_id] - grams
+        if stale:
+            StudentNameTrigram.objects.filter(student_id=student_id, trigram__in=stale).delete()
+
+
+def rebuild_name_index(batch_size=INDEX_BATCH_SIZE):
+    count = 0
+    queryset = Student.objects.order_by('pk').only('pk', *NAME_FIELDS)
+    last_pk = 0
+    while True:
+        students = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not students:
+            return count
+        sync_student_name_index(students)
+        count += len(students)
+        last_pk = students[-1].pk
+
+
+def name_index_drift():
+    # Students whose indexed trigrams differ from their current names.
+    drifted = []
+    indexed = defaultdict(set)
+    for student_id, trigram in StudentNameTrigram.objects.values_list('student_id', 'trigram').iterator():
+        indexed[student_id].add(trigram)
+    for row in Student.objects.values('pk', *NAME_FIELDS).iterator():
+        if indexed.get(row['pk'], set()) != trigrams(name_text(row)):
+            drifted.append(row['pk'])
+    return drifted
+
+
+def search_students(query, limit=20, queryset=None, min_score=None):
+    # Candidates come from the (trigram, student) index only; the best
+    # SEARCH_CANDIDATES by shared trigram count are then scored by how much
+    # of the query they cover, with Jaccard similarity as the tie-breaker.
+    query_grams = trigrams(query)
+    if not query_grams:
+        return []
+    if min_score is None:
+        min_score = getattr(settings, 'REGISTRAR_NAME_SEARCH_MIN_SCORE', 0.3)
+
+    if queryset is None:
+        queryset = Student.objects.filter(is_active=True)
+    # The caller's filters go into the candidate query, so students they
+    # exclude cannot crowd real matches out of the top SEARCH_CANDIDATES.
+    hits = dict(
+        StudentNameTrigram.objects.filter(trigram__in=query_grams, student__in=queryset.order_by().values('pk'))
+        .values('student_id')
+        .annotate(hits=Count('id'))
+        .order_by('-hits', 'student_id')
+        .values_list('student_id', 'hits')[:SEARCH_CANDIDATES]
+    )
+    candidates = queryset.filter(pk__in=hits)
+
+    ranked = []
+    for student in candidates:
+        shared = hits[student.pk]
+        coverage = shared / len(query_grams)
+        if coverage < min_score:
+            continue
+        student_grams = len(trigrams(name_text(student)))
+        similarity = shared / (len(query_grams) + student_grams - shared)
+        ranked.append((coverage, similarity, student))
+    ranked.sort(key=lambda item: (-item[0], -item[1], item[2].student_id))
+    return [
+        NameMatch(student, round(coverage, 3), round(similarity, 3)) for coverage, similarity, student in ranked[:limit]
+    ]
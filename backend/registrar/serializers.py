@@ -1,52 +1,115 @@
-﻿from rest_framework import serializers
-
-from .models import AcademicHistory, AcademicTerm, AuditLog, Department, Program, ProspectusEntry, Section, Student, StudentLoad, Subject
-from .services import _prospectus_entries_for_student
-
-
-class DepartmentSerializer(serializers.ModelSerializer):
+﻿from decimal import Decimal
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+from .audit import expand_payload
+from .fieldsets import SparseFieldsMixin
+from .history import HISTORY_STORAGE_COMPACT, compact, history_storage_mode, materialize
+from .models import (
+    AcademicHistory,
+    AcademicSubject,
+    AcademicTerm,
+    AuditLog,
+    AuditLogArchive,
+    Department,
+    Program,
+    ProspectusEntry,
+    ProspectusRequisite,
+    PromotionJob,
+    PromotionJobChunk,
+    Section,
+    Student,
+    StudentImport,
+    StudentLoad,
+    Subject,
+)
+from .completions import completed_subject_ids
+from .curriculum import get_resolved_curriculum
+from .prerequisites import COREQUISITE, PREREQUISITE, get_prerequisite_graph, graph_key, student_graph_key
+
+
+class DepartmentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Department
         fields = '__all__'
 
 
-class ProgramSerializer(serializers.ModelSerializer):
+class ProgramSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Program
         fields = '__all__'
 
 
-class AcademicTermSerializer(serializers.ModelSerializer):
+class AcademicTermSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AcademicTerm
         fields = '__all__'
 
 
-class SectionSerializer(serializers.ModelSerializer):
+class SectionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Section
         fields = '__all__'
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SubjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Subject
         fields = '__all__'
 
 
-class ProspectusEntrySerializer(serializers.ModelSerializer):
+def _validate_acyclic(key, subject, prerequisite):
+    if prerequisite and get_prerequisite_graph(key).creates_cycle(subject.pk, prerequisite.pk):
+        raise serializers.ValidationError(
+            f'{prerequisite.code} cannot be a prerequisite of {subject.code}: it would create a prerequisite cycle.'
+        )
+
+
+class ProspectusEntrySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ProspectusEntry
         fields = '__all__'
 
+    def validate(self, attrs):
+        program = attrs.get('program') or getattr(self.instance, 'program', None)
+        subject = attrs.get('subject') or getattr(self.instance, 'subject', None)
+        prerequisite = attrs['prerequisite'] if 'prerequisite' in attrs else getattr(self.instance, 'prerequisite', None)
+        academic_year = attrs['academic_year'] if 'academic_year' in attrs else getattr(self.instance, 'academic_year', '')
+        section = attrs['section'] if 'section' in attrs else getattr(self.instance, 'section', None)
+        if program and subject:
+            _validate_acyclic(graph_key(program.pk, academic_year, section and section.pk), subject, prerequisite)
+        return attrs
+
+
+class ProspectusRequisiteSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    kind = serializers.ChoiceField(choices=[PREREQUISITE, COREQUISITE], default=PREREQUISITE)
 
-class StudentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProspectusRequisite
+        fields = '__all__'
+
+    def validate(self, attrs):
+        entry = attrs.get('entry') or getattr(self.instance, 'entry', None)
+        subject = attrs.get('subject') or getattr(self.instance, 'subject', None)
+        kind = attrs.get('kind') or getattr(self.instance, 'kind', PREREQUISITE)
+        if entry and subject:
+            if subject.pk == entry.subject_id:
+                raise serializers.ValidationError('A subject cannot be its own requisite.')
+            if kind == PREREQUISITE:
+                key = graph_key(entry.program_id, entry.academic_year, entry.section_id)
+                _validate_acyclic(key, entry.subject, subject)
+        return attrs
+
+
+class StudentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         fields = '__all__'
 
 
-class StudentLoadSerializer(serializers.ModelSerializer):
+class StudentLoadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = StudentLoad
         fields = '__all__'
@@ -62,32 +125,70 @@ class StudentLoadSerializer(serializers.ModelSerializer):
         if not term.is_active:
             raise serializers.ValidationError('Loads can only be created or updated for the active term.')
 
-        prospectus_entry = _prospectus_entries_for_student(student, term, subject=subject).select_related('prerequisite').first()
+        prospectus_entry = get_resolved_curriculum(student, term.semester).entry_for_subject(subject.pk)
         if not prospectus_entry:
             raise serializers.ValidationError('Selected subject is not available in student prospectus mapping for this term.')
 
-        prerequisite = prospectus_entry.prerequisite
-        if prerequisite:
-            passed = StudentLoad.objects.filter(
-                student=student,
-                subject=prerequisite,
-                status__in=['passed', 'completed'],
-            ).exists()
-            if not passed:
-                raise serializers.ValidationError(
-                    f'Prerequisite not satisfied. Complete {prerequisite.code} before enrolling this subject.'
-                )
+        # Co-requisites are not checked here: mutual co-requisites can only be
+        # satisfied when loads are created together (auto-load).
+        graph = get_prerequisite_graph(student_graph_key(student))
+        missing = graph.missing_prerequisites(subject.pk, completed_subject_ids(student))
+        if missing:
+            codes = ', '.join(Subject.objects.filter(pk__in=missing).order_by('code').values_list('code', flat=True))
+            raise serializers.ValidationError(
+                f'Prerequisite not satisfied. Complete {codes} before enrolling this subject.'
+            )
 
         return attrs
 
 
-class AcademicHistorySerializer(serializers.ModelSerializer):
+class AcademicHistorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AcademicHistory
         fields = '__all__'
+        read_only_fields = ['profile']
 
+    def to_representation(self, instance):
+        return super().to_representation(materialize(instance))
 
-class StudentDetailSerializer(serializers.ModelSerializer):
+    def _store(self, instance):
+        instance.profile_id = None
+        if history_storage_mode() == HISTORY_STORAGE_COMPACT:
+            compact([instance])
+        instance.save()
+        return instance
+
+    def create(self, validated_data):
+        return self._store(AcademicHistory(**validated_data))
+
+    def update(self, instance, validated_data):
+        materialize(instance)
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        return self._store(instance)
+
+
+class AcademicSubjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    grade = serializers.DecimalField(
+        max_digits=4, decimal_places=2, min_value=Decimal('1.00'), max_value=Decimal('5.00'), allow_null=True, required=False
+    )
+
+    class Meta:
+        model = AcademicSubject
+        fields = '__all__'
+
+
+def student_loads_prefetch():
+    # Fills `ordered_loads`, which StudentDetailSerializer.get_loads reads
+    # instead of querying per student.
+    return Prefetch(
+        'loads',
+        queryset=StudentLoad.objects.select_related('subject', 'term').order_by('-term__year_label', 'subject__code'),
+        to_attr='ordered_loads',
+    )
+
+
+class StudentDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     loads = serializers.SerializerMethodField()
 
     class Meta:
@@ -95,7 +196,9 @@ class StudentDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
     def get_loads(self, obj):
-        load_qs = obj.loads.select_related('subject', 'term').all().order_by('-term__year_label', 'subject__code')
+        load_qs = getattr(obj, 'ordered_loads', None)
+        if load_qs is None:
+            load_qs = obj.loads.select_related('subject', 'term').all().order_by('-term__year_label', 'subject__code')
         result = []
         for load in load_qs:
             result.append(
@@ -112,9 +215,59 @@ class StudentDetailSerializer(serializers.ModelSerializer):
         return result
 
 
-class AuditLogSerializer(serializers.ModelSerializer):
+class AuditLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     actor_username = serializers.CharField(source='actor.username', read_only=True)
 
     class Meta:
         model = AuditLog
         fields = '__all__'
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['payload'] = expand_payload(data['payload'])
+        return data
+
+
+class AuditLogArchiveSerializer(AuditLogSerializer):
+    class Meta:
+        model = AuditLogArchive
+        fields = '__all__'
+
+
+class PromotionJobChunkSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    student_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PromotionJobChunk
+        fields = ['index', 'status', 'student_count', 'processed', 'committed_at', 'updated_at']
+
+    def get_student_count(self, obj):
+        return len(obj.student_ids)
+
+
+class PromotionJobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    chunks = PromotionJobChunkSerializer(many=True, read_only=True)
+    processed_students = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PromotionJob
+        fields = '__all__'
+
+    def get_processed_students(self, obj):
+        return sum(chunk.processed for chunk in obj.chunks.all())
+
+
+class StudentImportSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = StudentImport
+        exclude = ['source']
+
+
+class RegistrarTokenObtainPairSerializer(TokenObtainPairSerializer):
+    # Role claims let stateless endpoints (job polling) authorize without a user lookup.
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
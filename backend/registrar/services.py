@@ -1,69 +1,106 @@
-﻿from django.db import transaction
-
-from .models import AcademicTerm, ProspectusEntry, Student, StudentLoad
-
-
-def _has_passed_prerequisite(student, prerequisite_subject):
-    if not prerequisite_subject:
-        return True
-    return StudentLoad.objects.filter(
-        student=student,
-        subject=prerequisite_subject,
-        status__in=['passed', 'completed'],
-    ).exists()
-
-
-def _prospectus_entries_for_student(student, term, subject=None):
-    base_qs = ProspectusEntry.objects.filter(
-        program=student.program,
-        year_level=student.year_level,
-        semester=term.semester,
-    )
-    if subject is not None:
-        base_qs = base_qs.filter(subject=subject)
-
-    year = student.academic_year or ''
-    section_id = student.section_id
-
-    if year and section_id:
-        qs = base_qs.filter(academic_year=year, section_id=section_id)
-        if qs.exists():
-            return qs
-    if year:
-        qs = base_qs.filter(academic_year=year, section__isnull=True)
-        if qs.exists():
-            return qs
-    if section_id:
-        qs = base_qs.filter(academic_year='', section_id=section_id)
-        if qs.exists():
-            return qs
-    return base_qs.filter(academic_year='', section__isnull=True)
+﻿from collections import defaultdict
+from itertools import islice
+from typing import NamedTuple
+
+from django.db import transaction
+
+from .completions import completed_subject_ids, completed_subject_ids_by_student
+from .curriculum import curriculum_key, get_resolved_curricula, get_resolved_curriculum
+from .models import AcademicTerm, Student, StudentLoad, Subject
+from .prerequisites import get_prerequisite_graph, get_prerequisite_graphs, student_graph_key
+from .transcripts import mark_transcript_terms_stale
+
+AUTO_LOAD_BATCH_SIZE = 500
+PLAN_STUDENT_FIELDS = ('id', 'student_id', 'program_id', 'year_level', 'academic_year', 'section_id')
 
 
 def get_eligible_subjects(student, term):
-    entries = _prospectus_entries_for_student(student, term).select_related('subject', 'prerequisite')
+    subject_ids = [subject_id for subject_id, _ in get_resolved_curriculum(student, term.semester).entries]
+    graph = get_prerequisite_graph(student_graph_key(student))
+    eligible_ids = graph.eligible(subject_ids, completed_subject_ids(student))
+    subjects = Subject.objects.in_bulk(eligible_ids)
+    return [subjects[subject_id] for subject_id in eligible_ids]
+
+
+class AutoLoadPlan(NamedTuple):
+    student: Student
+    add: list
+    blocked: list
+
+
+def iter_student_chunks(queryset, chunk_size=AUTO_LOAD_BATCH_SIZE):
+    iterator = queryset.order_by('pk').only(*PLAN_STUDENT_FIELDS).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
-    eligible = []
-    for entry in entries:
-        if _has_passed_prerequisite(student, entry.prerequisite):
-            eligible.append(entry.subject)
-    return eligible
+
+def plan_auto_loads(students, term):
+    # Constant number of queries for the whole list of students; curricula
+    # and prerequisite graphs usually come straight from their caches.
+    student_pks = [student.pk for student in students]
+    curricula = get_resolved_curricula(curriculum_key(student, term.semester) for student in students)
+    graphs = get_prerequisite_graphs({student_graph_key(student) for student in students})
+    completed_by_student = completed_subject_ids_by_student(student_pks)
+    loaded_by_student = defaultdict(set)
+    existing = StudentLoad.objects.filter(term_id=term.pk, student_id__in=student_pks).values_list('student_id', 'subject_id')
+    for student_pk, subject_id in existing:
+        loaded_by_student[student_pk].add(subject_id)
+
+    for student in students:
+        graph = graphs[student_graph_key(student)]
+        completed = completed_by_student.get(student.pk, set())
+        loaded = loaded_by_student[student.pk]
+        entries = curricula[curriculum_key(student, term.semester)].entries
+        subject_ids = list(dict.fromkeys(subject_id for subject_id, _ in entries))
+        eligible_ids = graph.eligible(subject_ids, completed, concurrent=loaded)
+
+        available = completed | loaded | set(eligible_ids)
+        blocked = []
+        for subject_id in subject_ids:
+            if subject_id in available:
+                continue
+            missing = graph.missing_prerequisites(subject_id, completed) or (
+                graph.corequisites.get(subject_id, frozenset()) - available
+            )
+            blocked.append((subject_id, sorted(missing)))
+
+        yield AutoLoadPlan(
+            student=student,
+            add=[subject_id for subject_id in eligible_ids if subject_id not in loaded],
+            blocked=blocked,
+        )
 
 
 def auto_load_students(student_ids, term_id):
-    created = 0
+    new_loads = []
     with transaction.atomic():
         term = AcademicTerm.objects.get(pk=term_id)
-        students = Student.objects.filter(student_id__in=student_ids, is_active=True).select_related('program')
-        for student in students:
-            subjects = get_eligible_subjects(student, term)
-            for subject in subjects:
-                _, was_created = StudentLoad.objects.get_or_create(
-                    student=student,
-                    term_id=term_id,
-                    subject=subject,
-                    defaults={'status': 'enrolled'},
-                )
-                if was_created:
-                    created += 1
+        students = list(Student.objects.filter(student_id__in=student_ids, is_active=True).only(*PLAN_STUDENT_FIELDS))
+        for plan in plan_auto_loads(students, term):
+            new_loads.extend(
+                StudentLoad(student_id=plan.student.pk, term_id=term.pk, subject_id=subject_id, status='enrolled')
+                for subject_id in plan.add
+            )
+        # A concurrent run may insert some of the same rows first; those are
+        # skipped as conflicts and must not be reported as created here.
+        planned = {(load.student_id, load.subject_id) for load in new_loads}
+        before = _present_loads(term, planned)
+        StudentLoad.objects.bulk_create(new_loads, batch_size=AUTO_LOAD_BATCH_SIZE, ignore_conflicts=True)
+        created = len(_present_loads(term, planned)) - len(before)
+        mark_transcript_terms_stale({(load.student_id, term.year_label, term.semester) for load in new_loads})
     return {'created_load_rows': created}
+
+
+def _present_loads(term, pairs):
+    # The (student pk, subject pk) pairs in `pairs` that have a load in term.
+    if not pairs:
+        return set()
+    rows = StudentLoad.objects.filter(
+        term_id=term.pk,
+        student_id__in={student_id for student_id, _ in pairs},
+        subject_id__in={subject_id for _, subject_id in pairs},
+    ).values_list('student_id', 'subject_id')
+    return set(rows) & pairs
@@ -0,0 +1,155 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .bootstrap import BOOTSTRAP_MODELS
+from .completions import sync_completed_subject
+from .conditional import on_tables_touched, touch_tables
+from .curriculum import invalidate_curricula
+from .models import (
+    AcademicHistory,
+    AcademicSubject,
+    AcademicTerm,
+    Department,
+    Program,
+    ProspectusEntry,
+    ProspectusRequisite,
+    Section,
+    Student,
+    StudentLoad,
+    Subject,
+)
+from .prerequisites import invalidate_prerequisite_graphs
+from .search import NAME_FIELDS, sync_student_name_index
+from .tasks import queue_bootstrap_render
+from .transcripts import (
+    history_transcript_key,
+    load_transcript_key,
+    mark_transcript_terms_stale,
+    subject_transcript_keys,
+    term_transcript_keys,
+)
+
+
+@receiver([post_save, post_delete], sender=ProspectusEntry)
+@receiver([post_save, post_delete], sender=Subject)
+@receiver([post_save, post_delete], sender=Section)
+def invalidate_curricula_on_change(sender, **kwargs):
+    invalidate_curricula()
+
+
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Program)
+@receiver([post_save, post_delete], sender=AcademicTerm)
+@receiver([post_save, post_delete], sender=Section)
+@receiver([post_save, post_delete], sender=Subject)
+@receiver([post_save, post_delete], sender=ProspectusEntry)
+def touch_reference_table(sender, **kwargs):
+    touch_tables(sender)
+
+
+@on_tables_touched
+def prerender_bootstrap_on_touch(models):
+    if set(models) & set(BOOTSTRAP_MODELS):
+        queue_bootstrap_render()
+
+
+@receiver([post_save, post_delete], sender=ProspectusEntry)
+@receiver([post_save, post_delete], sender=ProspectusRequisite)
+def invalidate_prerequisite_graphs_on_change(sender, **kwargs):
+    invalidate_prerequisite_graphs()
+
+
+@receiver(pre_save, sender=StudentLoad)
+def remember_previous_load_subject(sender, instance, **kwargs):
+    instance._previous_completion_key = None
+    instance._previous_term_id = None
+    instance._previous_load_state = None
+    if instance.pk:
+        previous = (
+            StudentLoad.objects.filter(pk=instance.pk)
+            .values_list('student_id', 'subject_id', 'term_id', 'status')
+            .first()
+        )
+        if previous:
+            instance._previous_completion_key = previous[:2]
+            instance._previous_term_id = previous[2]
+            instance._previous_load_state = previous
+
+
+@receiver(post_save, sender=StudentLoad)
+def sync_completed_subject_on_save(sender, instance, **kwargs):
+    previous_state = getattr(instance, '_previous_load_state', None)
+    if previous_state and previous_state[:2] == (instance.student_id, instance.subject_id) and previous_state[3] == instance.status:
+        return
+    sync_completed_subject(instance.student_id, instance.subject_id, instance.status)
+    previous = getattr(instance, '_previous_completion_key', None)
+    if previous and previous != (instance.student_id, instance.subject_id):
+        sync_completed_subject(*previous)
+
+
+@receiver(post_delete, sender=StudentLoad)
+def sync_completed_subject_on_delete(sender, instance, **kwargs):
+    sync_completed_subject(instance.student_id, instance.subject_id)
+
+
+@receiver([post_save, post_delete], sender=StudentLoad)
+def mark_load_transcript_stale(sender, instance, signal=None, **kwargs):
+    state = (instance.student_id, instance.subject_id, instance.term_id, instance.status)
+    if signal is post_save and getattr(instance, '_previous_load_state', None) == state:
+        return
+    term = instance.term if StudentLoad.term.is_cached(instance) else None
+    keys = {load_transcript_key(instance.student_id, instance.term_id, term)}
+    previous = getattr(instance, '_previous_completion_key', None)
+    if previous and (previous[0], instance._previous_term_id) != (instance.student_id, instance.term_id):
+        keys.add(load_transcript_key(previous[0], instance._previous_term_id))
+    mark_transcript_terms_stale(key for key in keys if key)
+
+
+@receiver(pre_save, sender=AcademicTerm)
+def remember_previous_term_label(sender, instance, **kwargs):
+    instance._previous_term_label = None
+    if instance.pk:
+        instance._previous_term_label = (
+            AcademicTerm.objects.filter(pk=instance.pk).values_list('year_label', 'semester').first()
+        )
+
+
+@receiver(post_save, sender=AcademicTerm)
+def mark_term_transcripts_stale(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_term_label', None)
+    if previous and previous != (instance.year_label, instance.semester):
+        mark_transcript_terms_stale(term_transcript_keys(instance.pk, previous))
+
+
+@receiver(pre_save, sender=AcademicHistory)
+def remember_previous_history_term(sender, instance, **kwargs):
+    instance._previous_transcript_key = history_transcript_key(instance.pk) if instance.pk else None
+
+
+@receiver([post_save, post_delete], sender=AcademicHistory)
+def mark_history_transcript_stale(sender, instance, **kwargs):
+    keys = {(instance.student_id, instance.academic_year, instance.semester)}
+    previous = getattr(instance, '_previous_transcript_key', None)
+    if previous:
+        keys.add(previous)
+    mark_transcript_terms_stale(keys)
+
+
+@receiver([post_save, post_delete], sender=AcademicSubject)
+def mark_academic_subject_transcript_stale(sender, instance, **kwargs):
+    key = history_transcript_key(instance.academic_history_id)
+    if key:
+        mark_transcript_terms_stale([key])
+
+
+@receiver(post_save, sender=Subject)
+def mark_subject_transcripts_stale(sender, instance, created=False, **kwargs):
+    if not created:
+        mark_transcript_terms_stale(subject_transcript_keys(instance.pk))
+
+
+@receiver(post_save, sender=Student)
+def sync_name_index_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(NAME_FIELDS):
+        return
+    sync_student_name_index([instance])
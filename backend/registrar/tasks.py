@@ -1,8 +1,109 @@
-﻿from celery import shared_task
+﻿import logging
 
+from celery import chord, shared_task
+from django.conf import settings
+from django.db import DatabaseError
+
+from .bootstrap import get_bootstrap_bundle
+from .imports import run_student_import
+from .jobs import mark_job_started, record_job_progress
+from .promotion import run_promotion_job
 from .services import auto_load_students
 
+logger = logging.getLogger(__name__)
+
+AUTO_LOAD_CHUNK_SIZE = getattr(settings, 'REGISTRAR_AUTO_LOAD_CHUNK_SIZE', 100)
+
+
+def chunked(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=10,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+)
+def auto_load_students_task(self, student_ids, term_id, job_id=None):
+    # Each chunk commits on its own and auto_load_students skips existing
+    # loads, so a retried chunk never duplicates work done by the others.
+    mark_job_started(job_id)
+    try:
+        result = auto_load_students(student_ids=student_ids, term_id=term_id)
+    except DatabaseError:
+        if self.request.retries >= self.max_retries:
+            record_job_progress(job_id, failed=len(student_ids))
+        raise
+    except Exception:
+        record_job_progress(job_id, failed=len(student_ids))
+        raise
+    record_job_progress(job_id, processed=len(student_ids), created=result['created_load_rows'])
+    return result
+
+
+@shared_task
+def summarize_auto_load_task(results):
+    return {'created_load_rows': sum(result['created_load_rows'] for result in results)}
+
+
+def queue_auto_load(student_ids, term_id, job_id=None, chunk_size=None):
+    chunk_size = chunk_size or AUTO_LOAD_CHUNK_SIZE
+    header = [auto_load_students_task.s(chunk, term_id, job_id) for chunk in chunked(student_ids, chunk_size)]
+    return chord(header)(summarize_auto_load_task.s())
+
+
+def _queue_chunk_auto_load(job, processed_student_ids):
+    if job.term_id and processed_student_ids:
+        auto_load_students_task.delay(processed_student_ids, job.term_id)
+
+
+@shared_task(
+    bind=True,
+    max_retries=5,
+    default_retry_delay=30,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def run_promotion_job_task(self, job_id):
+    # acks_late + reject_on_worker_lost redeliver the task if the worker dies;
+    # the job then resumes from its first uncommitted chunk.
+    job = run_promotion_job(job_id, on_chunk_committed=_queue_chunk_auto_load)
+    return {'job_id': job.pk, 'status': job.status, 'total_students': job.total_students}
+
+
+@shared_task(
+    bind=True,
+    max_retries=5,
+    default_retry_delay=30,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def run_student_import_task(self, import_id):
+    # Like promotion jobs, a redelivered or retried import resumes after its
+    # last committed chunk.
+    job = run_student_import(import_id)
+    return {'import_id': job.pk, 'status': job.status, 'created': job.created_count, 'errors': job.error_count}
+
+
+@shared_task
+def render_bootstrap_task():
+    # Renders the bundle for the current versions; a no-op if a later task
+    # already did.
+    get_bootstrap_bundle()
+
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=10)
-def auto_load_students_task(self, student_ids, term_id):
-    return auto_load_students(student_ids=student_ids, term_id=term_id)
+def queue_bootstrap_render():
+    # Runs after a bundled table's version moved. If the broker is down the
+    # first request after the bump renders the bundle instead.
+    try:
+        render_bootstrap_task.delay()
+    except Exception:
+        logger.exception('Could not queue the bootstrap bundle render.')
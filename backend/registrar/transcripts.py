@@ -0,0 +1,223 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .completions import COMPLETED_LOAD_STATUSES
+from .models import AcademicHistory, AcademicSubject, AcademicTerm, Student, StudentLoad, TranscriptTerm
+
+MARK_BATCH_SIZE = 500
+GWA_PLACES = Decimal('0.0001')
+
+
+class Transcript(NamedTuple):
+    terms: list
+    units: Decimal
+    earned_units: Decimal
+    gwa: Decimal | None
+
+
+def _batches(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def mark_transcript_terms_stale(keys):
+    # keys: (student pk, academic_year, semester). Existing terms are marked
+    # stale with a new revision, so a rebuild that read the old rows cannot
+    # clear the flag; missing terms are created stale.
+    keys = {key for key in keys if all(part is not None for part in key)}
+    for batch in _batches(sorted(keys), MARK_BATCH_SIZE):
+        condition = Q()
+        for student_id, academic_year, semester in batch:
+            condition |= Q(student_id=student_id, academic_year=academic_year, semester=semester)
+        TranscriptTerm.objects.filter(condition).update(stale=True, revision=F('revision') + 1)
+        TranscriptTerm.objects.bulk_create(
+            [
+                TranscriptTerm(student_id=student_id, academic_year=academic_year, semester=semester)
+                for student_id, academic_year, semester in batch
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def history_transcript_key(history_id):
+    return AcademicHistory.objects.filter(pk=history_id).values_list('student_id', 'academic_year', 'semester').first()
+
+
+def load_transcript_key(student_id, term_id, term=None):
+    # `term` is the load's already-fetched AcademicTerm, if any.
+    if term is not None and term.pk == term_id:
+        return (student_id, term.year_label, term.semester)
+    term = AcademicTerm.objects.filter(pk=term_id).values_list('year_label', 'semester').first()
+    return (student_id, *term) if term else None
+
+
+def subject_transcript_keys(subject_id):
+    keys = set(
+        AcademicSubject.objects.filter(subject_id=subject_id).values_list(
+            'academic_history__student_id', 'academic_history__academic_year', 'academic_history__semester'
+        )
+    )
+    keys.update(
+        StudentLoad.objects.filter(subject_id=subject_id).values_list('student_id', 'term__year_label', 'term__semester')
+    )
+    return keys
+
+
+def term_transcript_keys(term_id, previous_label):
+    # Every student with loads in the term, under its current and previous
+    # (year_label, semester).
+    keys = set()
+    loads = StudentLoad.objects.filter(term_id=term_id).values_list('student_id', 'term__year_label', 'term__semester')
+    for student_id, year_label, semester in loads.distinct():
+        keys.add((student_id, year_label, semester))
+        keys.add((student_id, *previous_label))
+    return keys
+
+
+def _subject_row(subject, credits, status, grade, year_level, semester):
+    return {
+        'id': subject.pk,
+        'subject_code': subject.code,
+        'descriptive_title': subject.title,
+        'grade_final': f'{grade:.2f}' if grade is not None else '',
+        'completion': status,
+        'credits': float(credits),
+        'semester': semester,
+        'year_level': year_level,
+    }
+
+
+def build_term(year_level, semester, academic_subjects, loads):
+    # Recorded AcademicSubject rows win over loads for the same subject;
+    # loads fill in subjects that have not been recorded yet.
+    rows = []
+    units = earned = graded = points = Decimal('0')
+    seen = set()
+    entries = [(item.subject, item.credits, item.status, item.grade) for item in academic_subjects]
+    entries += [(load.subject, load.subject.units, load.status, None) for load in loads]
+    for subject, credits, status, grade in sorted(entries, key=lambda entry: entry[0].code):
+        if subject.pk in seen:
+            continue
+        seen.add(subject.pk)
+        credits = Decimal(credits)
+        units += credits
+        if status in COMPLETED_LOAD_STATUSES:
+            earned += credits
+        if grade is not None:
+            graded += credits
+            points += credits * grade
+        rows.append(_subject_row(subject, credits, status, grade, year_level, semester))
+    return {'subjects': rows, 'units': units, 'earned_units': earned, 'graded_units': graded, 'grade_points': points}
+
+
+def refresh_transcripts(student_pks):
+    # Rebuilds only the stale terms of the given students, with a constant
+    # number of reads for the whole batch. Returns the number of terms built.
+    stale = list(
+        TranscriptTerm.objects.filter(student_id__in=student_pks, stale=True).values(
+            'pk', 'student_id', 'academic_year', 'semester', 'revision'
+        )
+    )
+    if not stale:
+        return 0
+    keys = {(row['student_id'], row['academic_year'], row['semester']) for row in stale}
+    student_ids = {key[0] for key in keys}
+
+    histories = {
+        (history.student_id, history.academic_year, history.semester): history
+        for history in AcademicHistory.objects.filter(student_id__in=student_ids)
+        .order_by()
+        .only('id', 'student_id', 'academic_year', 'semester', 'year_level')
+    }
+    histories = {key: history for key, history in histories.items() if key in keys}
+    recorded = defaultdict(list)
+    for item in AcademicSubject.objects.filter(
+        academic_history_id__in=[history.pk for history in histories.values()]
+    ).select_related('subject'):
+        recorded[item.academic_history_id].append(item)
+
+    terms = {
+        term.pk: (term.year_label, term.semester)
+        for term in AcademicTerm.objects.filter(year_label__in={key[1] for key in keys})
+        if (term.year_label, term.semester) in {key[1:] for key in keys}
+    }
+    loads = defaultdict(list)
+    for load in StudentLoad.objects.filter(student_id__in=student_ids, term_id__in=terms).select_related('subject'):
+        loads[(load.student_id, *terms[load.term_id])].append(load)
+    current = {
+        row['pk']: row for row in Student.objects.filter(pk__in=student_ids).values('pk', 'year_level', 'academic_year', 'semester')
+    }
+
+    now = timezone.now()
+    for row in stale:
+        key = (row['student_id'], row['academic_year'], row['semester'])
+        history = histories.get(key)
+        target = TranscriptTerm.objects.filter(pk=row['pk'], revision=row['revision'])
+        if history is None and not loads[key]:
+            target.delete()
+            continue
+        if history is not None:
+            year_level = history.year_level
+        else:
+            student = current[row['student_id']]
+            on_current_term = (student['academic_year'], student['semester']) == key[1:]
+            year_level = student['year_level'] if on_current_term else None
+        built = build_term(year_level, row['semester'], recorded[history.pk] if history else [], loads[key])
+        target.update(year_level=year_level, stale=False, computed_at=now, **built)
+    return len(stale)
+
+
+def _term_order(term):
+    return (term.academic_year, term.semester)
+
+
+def get_transcripts(student_pks):
+    # {student pk: Transcript}; only stale terms are recomputed.
+    student_pks = list(student_pks)
+    refresh_transcripts(student_pks)
+    by_student = defaultdict(list)
+    # A term re-marked stale by a concurrent write keeps its last build.
+    for term in TranscriptTerm.objects.filter(student_id__in=student_pks, computed_at__isnull=False):
+        by_student[term.student_id].append(term)
+
+    transcripts = {}
+    for student_pk in student_pks:
+        terms = sorted(by_student[student_pk], key=_term_order)
+        graded = sum((term.graded_units for term in terms), Decimal('0'))
+        points = sum((term.grade_points for term in terms), Decimal('0'))
+        transcripts[student_pk] = Transcript(
+            terms=terms,
+            units=sum((term.units for term in terms), Decimal('0')),
+            earned_units=sum((term.earned_units for term in terms), Decimal('0')),
+            gwa=(points / graded).quantize(GWA_PLACES) if graded else None,
+        )
+    return transcripts
+
+
+def term_gwa(term):
+    return (term.grade_points / term.graded_units).quantize(GWA_PLACES) if term.graded_units else None
+
+
+def transcript_payload(transcript):
+    return {
+        'terms': [
+            {
+                'academic_year': term.academic_year,
+                'semester': term.semester,
+                'year_level': term.year_level,
+                'subjects': term.subjects,
+                'units': term.units,
+                'earned_units': term.earned_units,
+                'gwa': term_gwa(term),
+            }
+            for term in transcript.terms
+        ],
+        'units': transcript.units,
+        'earned_units': transcript.earned_units,
+        'gwa': transcript.gwa,
+    }
@@ -2,13 +2,20 @@
 
 from .views import (
     AcademicHistoryViewSet,
+    AcademicSubjectViewSet,
     AcademicTermViewSet,
     AuditLogViewSet,
+    BootstrapViewSet,
+    CacheStatsViewSet,
     ContinuingViewSet,
     DepartmentViewSet,
+    JobViewSet,
     ProgramViewSet,
+    PromotionJobViewSet,
+    ProspectusRequisiteViewSet,
     ProspectusViewSet,
     SectionViewSet,
+    StudentImportViewSet,
     StudentLoadViewSet,
     StudentViewSet,
     SubjectViewSet,
@@ -21,10 +28,17 @@ router.register('terms', AcademicTermViewSet, basename='terms')
 router.register('sections', SectionViewSet, basename='sections')
 router.register('subjects', SubjectViewSet, basename='subjects')
 router.register('prospectus', ProspectusViewSet, basename='prospectus')
+router.register('prospectus-requisites', ProspectusRequisiteViewSet, basename='prospectus-requisites')
 router.register('students', StudentViewSet, basename='students')
+router.register('student-imports', StudentImportViewSet, basename='student-imports')
 router.register('student-loads', StudentLoadViewSet, basename='student-loads')
 router.register('academic-history', AcademicHistoryViewSet, basename='academic-history')
+router.register('academic-subjects', AcademicSubjectViewSet, basename='academic-subjects')
 router.register('continuing', ContinuingViewSet, basename='continuing')
+router.register('promotion-jobs', PromotionJobViewSet, basename='promotion-jobs')
 router.register('audit-logs', AuditLogViewSet, basename='audit-logs')
+router.register('jobs', JobViewSet, basename='jobs')
+router.register('bootstrap', BootstrapViewSet, basename='bootstrap')
+router.register('cache-stats', CacheStatsViewSet, basename='cache-stats')
 
 urlpatterns = router.urls
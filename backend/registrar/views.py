@@ -1,84 +1,210 @@
-from datetime import date
+import gzip
+from datetime import date, datetime, time
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
-
-from .models import AcademicHistory, AcademicTerm, AuditLog, Department, Program, ProspectusEntry, Section, Student, StudentLoad, Subject
+from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet, ViewSet
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+from .archive import hot_cutoff
+from .audit import change_payload, instance_state, record_audit
+from .bootstrap import accepts_gzip, get_bootstrap_bundle
+from .conditional import ConditionalGetMixin, touch_tables
+from .curriculum import invalidate_curricula
+from .exports import (
+    ACADEMIC_HISTORY_EXPORT_COLUMNS,
+    EXPORT_FORMATS,
+    STUDENT_EXPORT_COLUMNS,
+    STUDENT_LOAD_EXPORT_COLUMNS,
+    export_rows,
+    export_stream,
+    history_export_rows,
+)
+from .fastpath import FastListMixin
+from .fieldsets import SparseQuerysetMixin, defer_unused_columns, sparse_field_params
+from .history import materialize
+from .imports import IMPORT_ERROR_CSV_FIELDS, create_student_import, error_report_rows
+from .jobs import create_job, get_job_status, mark_job_started, record_job_progress
+from .models import (
+    AcademicHistory,
+    AcademicSubject,
+    AcademicTerm,
+    AuditLog,
+    AuditLogArchive,
+    Department,
+    Program,
+    ProspectusEntry,
+    ProspectusRequisite,
+    PromotionJob,
+    Section,
+    Student,
+    StudentImport,
+    StudentLoad,
+    Subject,
+)
+from .prerequisites import invalidate_prerequisite_graphs
+from .promotion import PromotionTarget, chunked_student_pks, create_promotion_job, promote_chunk
 from .permissions import IsRegistrarOrStaff
+from .reports import DRY_RUN_CSV_FIELDS, auto_load_dry_run, csv_stream, flatten_dry_run, ndjson_stream
+from .response_cache import CachedReadMixin, response_cache_stats
+from .search import search_students
 from .serializers import (
     AcademicHistorySerializer,
+    AcademicSubjectSerializer,
     AcademicTermSerializer,
+    AuditLogArchiveSerializer,
     AuditLogSerializer,
     DepartmentSerializer,
     ProgramSerializer,
     ProspectusEntrySerializer,
+    ProspectusRequisiteSerializer,
+    PromotionJobSerializer,
     SectionSerializer,
     StudentDetailSerializer,
+    StudentImportSerializer,
     StudentLoadSerializer,
     StudentSerializer,
     SubjectSerializer,
+    student_loads_prefetch,
 )
 from .services import auto_load_students, get_eligible_subjects
-from .tasks import auto_load_students_task
+from .tasks import queue_auto_load, run_promotion_job_task, run_student_import_task
+from .transcripts import get_transcripts, transcript_payload
 
 
-class BaseRegistrarViewSet(ModelViewSet):
+class BaseRegistrarViewSet(SparseQuerysetMixin, ModelViewSet):
     permission_classes = [IsRegistrarOrStaff]
+    # query parameter -> ORM lookup; every lookup should hit an index.
+    query_filters = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        for param, lookup in self.query_filters.items():
+            value = self.request.query_params.get(param)
+            if value in (None, ''):
+                continue
+            value = {'true': True, 'false': False}.get(value.lower(), value)
+            try:
+                queryset = queryset.filter(**{lookup: value})
+            except (ValueError, DjangoValidationError):
+                raise ValidationError({param: 'Invalid value.'})
+        return queryset
+
+    def _export_response(self, request, rows, columns, basename):
+        # Streams `rows` (a lazy generator over the filtered queryset) as a
+        # CSV or XLSX attachment.
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            return Response({'detail': 'output must be csv or xlsx.'}, status=status.HTTP_400_BAD_REQUEST)
+        response = StreamingHttpResponse(
+            export_stream(rows, columns, output, sheet=basename), content_type=EXPORT_FORMATS[output]
+        )
+        response['Content-Disposition'] = f'attachment; filename="{basename}-{timezone.localdate():%Y%m%d}.{output}"'
+        return response
 
     def _write_audit_log(self, action_name, instance, payload):
         if not getattr(self.request, 'user', None) or not self.request.user.is_authenticated:
             return
-        AuditLog.objects.create(
-            actor=self.request.user,
-            action=action_name,
-            entity=instance.__class__.__name__,
-            entity_id=str(instance.pk),
-            payload=payload or {},
-        )
+        record_audit(self.request.user, action_name, instance.__class__.__name__, instance.pk, payload)
+
+    def audit_state(self, instance):
+        return instance_state(instance)
 
     def perform_create(self, serializer):
         instance = serializer.save()
-        self._write_audit_log('create', instance, self.request.data)
+        self._write_audit_log('create', instance, change_payload(None, instance, state=self.audit_state))
 
     def perform_update(self, serializer):
+        before = self.audit_state(serializer.instance)
         instance = serializer.save()
-        self._write_audit_log('update', instance, self.request.data)
+        self._write_audit_log('update', instance, change_payload(before, instance, state=self.audit_state))
 
     def perform_destroy(self, instance):
         instance.delete()
         self._write_audit_log('delete', instance, {})
 
 
-class DepartmentViewSet(BaseRegistrarViewSet):
-    queryset = Department.objects.all().order_by('name')
+class DepartmentViewSet(ConditionalGetMixin, CachedReadMixin, BaseRegistrarViewSet):
+    conditional_models = (Department,)
+    cache_model = Department
+    queryset = Department.objects.all().order_by('name', 'id')
+    keyset_ordering = ('name', 'id')
     serializer_class = DepartmentSerializer
 
 
-class ProgramViewSet(BaseRegistrarViewSet):
+class ProgramViewSet(ConditionalGetMixin, CachedReadMixin, BaseRegistrarViewSet):
+    conditional_models = (Program,)
+    cache_model = Program
     queryset = Program.objects.select_related('department').all().order_by('name', 'id')
+    keyset_ordering = ('name', 'id')
+    query_filters = {'department': 'department_id'}
     serializer_class = ProgramSerializer
 
 
-class AcademicTermViewSet(BaseRegistrarViewSet):
+class AcademicTermViewSet(ConditionalGetMixin, CachedReadMixin, BaseRegistrarViewSet):
+    conditional_models = (AcademicTerm,)
+    cache_model = AcademicTerm
     queryset = AcademicTerm.objects.all().order_by('-year_label', 'semester')
+    keyset_ordering = ('-year_label', 'semester')
+    query_filters = {'is_active': 'is_active', 'semester': 'semester', 'year_label': 'year_label'}
     serializer_class = AcademicTermSerializer
 
-
-class SectionViewSet(BaseRegistrarViewSet):
+    @action(detail=True, methods=['get'], url_path='auto-load-dry-run')
+    def auto_load_dry_run(self, request, pk=None):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in ['ndjson', 'csv']:
+            return Response({'detail': 'output must be ndjson or csv.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        term = self.get_object()
+        students = Student.objects.filter(is_active=True)
+        program_id = request.query_params.get('program')
+        if program_id:
+            students = students.filter(program_id=program_id)
+
+        rows = auto_load_dry_run(term, students)
+        if output == 'csv':
+            response = StreamingHttpResponse(csv_stream(flatten_dry_run(rows), DRY_RUN_CSV_FIELDS), content_type='text/csv')
+            response['Content-Disposition'] = f'attachment; filename="auto-load-dry-run-term-{term.pk}.csv"'
+            return response
+        return StreamingHttpResponse(ndjson_stream(rows), content_type='application/x-ndjson')
+
+
+class SectionViewSet(ConditionalGetMixin, CachedReadMixin, BaseRegistrarViewSet):
+    conditional_models = (Section,)
+    cache_model = Section
     queryset = Section.objects.select_related('program').all().order_by('name', 'program_id', 'year_level', 'semester', 'id')
+    keyset_ordering = ('name', 'program_id', 'year_level', 'semester', 'id')
+    query_filters = {'program': 'program_id', 'year_level': 'year_level', 'semester': 'semester'}
     serializer_class = SectionSerializer
 
 
-class SubjectViewSet(BaseRegistrarViewSet):
+class SubjectViewSet(ConditionalGetMixin, CachedReadMixin, BaseRegistrarViewSet):
+    conditional_models = (Subject,)
+    cache_model = Subject
     queryset = Subject.objects.all().order_by('code')
+    keyset_ordering = ('code',)
     serializer_class = SubjectSerializer
 
 
-class ProspectusViewSet(BaseRegistrarViewSet):
-    queryset = ProspectusEntry.objects.select_related('program', 'subject', 'prerequisite').all()
+class ProspectusViewSet(ConditionalGetMixin, FastListMixin, BaseRegistrarViewSet):
+    conditional_models = (ProspectusEntry,)
+    queryset = ProspectusEntry.objects.select_related('program', 'subject', 'prerequisite').all().order_by('id')
+    keyset_ordering = ('id',)
+    query_filters = {
+        'program': 'program_id',
+        'year_level': 'year_level',
+        'semester': 'semester',
+        'academic_year': 'academic_year',
+        'section': 'section_id',
+    }
     serializer_class = ProspectusEntrySerializer
 
     @action(detail=False, methods=['post'], url_path='copy-section')
@@ -113,16 +239,17 @@ class ProspectusViewSet(BaseRegistrarViewSet):
             semester=semester,
             academic_year=academic_year,
             section_id=source_section_id,
-        ).values('subject_id', 'prerequisite_id')
+        ).values('id', 'subject_id', 'prerequisite_id')
 
         if not source_entries.exists():
             return Response({'detail': 'No source prospectus entries found for the provided filters.'}, status=status.HTTP_400_BAD_REQUEST)
 
         created = 0
         skipped = 0
+        copied_entry_ids = {}
         with transaction.atomic():
             for entry in source_entries:
-                _, was_created = ProspectusEntry.objects.get_or_create(
+                target_entry, was_created = ProspectusEntry.objects.get_or_create(
                     program_id=program_id,
                     subject_id=entry['subject_id'],
                     year_level=year_level,
@@ -133,16 +260,28 @@ class ProspectusViewSet(BaseRegistrarViewSet):
                 )
                 if was_created:
                     created += 1
+                    copied_entry_ids[entry['id']] = target_entry.pk
                 else:
                     skipped += 1
+            ProspectusRequisite.objects.bulk_create(
+                [
+                    ProspectusRequisite(entry_id=copied_entry_ids[entry_id], subject_id=subject_id, kind=kind)
+                    for entry_id, subject_id, kind in ProspectusRequisite.objects.filter(
+                        entry_id__in=copied_entry_ids
+                    ).values_list('entry_id', 'subject_id', 'kind')
+                ]
+            )
+            invalidate_curricula()
+            invalidate_prerequisite_graphs()
+            touch_tables(ProspectusEntry)
 
         if getattr(request, 'user', None) and request.user.is_authenticated:
-            AuditLog.objects.create(
-                actor=request.user,
-                action='copy_section',
-                entity='ProspectusEntry',
-                entity_id='bulk-copy',
-                payload={
+            record_audit(
+                request.user,
+                'copy_section',
+                'ProspectusEntry',
+                'bulk-copy',
+                {
                     'program': program_id,
                     'year_level': year_level,
                     'semester': semester,
@@ -159,13 +298,53 @@ class ProspectusViewSet(BaseRegistrarViewSet):
         )
 
 
-class StudentViewSet(BaseRegistrarViewSet):
-    queryset = Student.objects.select_related('program', 'section').prefetch_related('loads').filter(is_active=True)
+class ProspectusRequisiteViewSet(FastListMixin, BaseRegistrarViewSet):
+    queryset = ProspectusRequisite.objects.select_related('entry', 'subject').all().order_by('entry_id', 'subject_id', 'kind')
+    keyset_ordering = ('entry_id', 'subject_id', 'kind')
+    query_filters = {'entry': 'entry_id'}
+    serializer_class = ProspectusRequisiteSerializer
+
+
+class StudentViewSet(FastListMixin, BaseRegistrarViewSet):
+    queryset = Student.objects.select_related('program', 'section').order_by('student_id')
     serializer_class = StudentSerializer
     lookup_field = 'student_id'
+    keyset_ordering = ('student_id',)
+    query_filters = {
+        'program': 'program_id',
+        'section': 'section_id',
+        'year_level': 'year_level',
+        'academic_year': 'academic_year',
+        'semester': 'semester',
+        'is_active': 'is_active',
+        'student_id': 'student_id__startswith',
+    }
+
+    def _includes_loads(self):
+        keep, omit = sparse_field_params(self.request)
+        if 'loads' in omit or (keep and 'loads' not in keep):
+            return False
+        if self.action == 'retrieve':
+            return True
+        return self.action == 'list' and 'loads' in self.request.query_params.get('include', '').split(',')
+
+    def get_queryset(self):
+        # Loads are only fetched when they are serialized: always on retrieve,
+        # and on list with ?include=loads, where the prefetch runs once for
+        # the whole page.
+        queryset = super().get_queryset()
+        if self._includes_loads():
+            queryset = queryset.prefetch_related(student_loads_prefetch())
+        return queryset
+
+    def filter_queryset(self, queryset):
+        # Soft-deleted students stay hidden unless ?is_active= asks for them.
+        if 'is_active' not in self.request.query_params:
+            queryset = queryset.filter(is_active=True)
+        return super().filter_queryset(queryset)
 
     def get_serializer_class(self):
-        if self.action == 'retrieve':
+        if self._includes_loads():
             return StudentDetailSerializer
         return StudentSerializer
 
@@ -174,6 +353,61 @@ class StudentViewSet(BaseRegistrarViewSet):
         instance.save(update_fields=['is_active', 'updated_at'])
         self._write_audit_log('soft_delete', instance, {'is_active': False})
 
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        rows = export_rows(self.filter_queryset(self.get_queryset()), STUDENT_EXPORT_COLUMNS, self.keyset_ordering)
+        return self._export_response(request, rows, STUDENT_EXPORT_COLUMNS, 'students')
+
+    @action(detail=True, methods=['get'], url_path='transcript')
+    def transcript(self, request, student_id=None):
+        student = self.get_object()
+        transcript = get_transcripts([student.pk])[student.pk]
+        return Response({'student_id': student.student_id, **transcript_payload(transcript)}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='tor-subjects')
+    def tor_subjects(self, request, student_id=None):
+        student = self.get_object()
+        transcript = get_transcripts([student.pk])[student.pk]
+        return Response([row for term in transcript.terms for row in term.subjects], status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'detail': 'q query parameter is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), 100))
+        except ValueError:
+            return Response({'detail': 'limit must be a number.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        matches = search_students(query, limit=limit, queryset=self.filter_queryset(self.get_queryset()))
+        results = []
+        for match in matches:
+            row = StudentSerializer(match.student, context=self.get_serializer_context()).data
+            row['score'] = match.score
+            results.append(row)
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='history')
+    def history(self, request, student_id=None):
+        # With academic_year and semester this is a single unique-index lookup;
+        # otherwise it lists the student's snapshots, newest first.
+        student = self.get_object()
+        histories = AcademicHistory.objects.select_related('student', 'program', 'section', 'profile').filter(
+            student=student
+        )
+        academic_year = request.query_params.get('academic_year')
+        semester = request.query_params.get('semester')
+        if academic_year and semester:
+            try:
+                history = histories.get(academic_year=academic_year, semester=semester)
+            except (AcademicHistory.DoesNotExist, ValueError):
+                return Response({'detail': 'No academic history for that term.'}, status=status.HTTP_404_NOT_FOUND)
+            return Response(AcademicHistorySerializer(history).data)
+        if academic_year:
+            histories = histories.filter(academic_year=academic_year)
+        return Response(AcademicHistorySerializer(histories, many=True).data)
+
     @action(detail=True, methods=['get'], url_path='auto-load-preview')
     def auto_load_preview(self, request, student_id=None):
         term_id = request.query_params.get('term_id')
@@ -201,15 +435,118 @@ class StudentViewSet(BaseRegistrarViewSet):
         return Response(result, status=status.HTTP_200_OK)
 
 
-class StudentLoadViewSet(BaseRegistrarViewSet):
-    queryset = StudentLoad.objects.select_related('student', 'term', 'subject').all()
+class StudentLoadViewSet(FastListMixin, BaseRegistrarViewSet):
+    queryset = StudentLoad.objects.select_related('student', 'term', 'subject').all().order_by('id')
+    keyset_ordering = ('id',)
+    query_filters = {'student': 'student_id', 'term': 'term_id', 'subject': 'subject_id'}
     serializer_class = StudentLoadSerializer
 
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = export_rows(queryset, STUDENT_LOAD_EXPORT_COLUMNS, self.keyset_ordering)
+        return self._export_response(request, rows, STUDENT_LOAD_EXPORT_COLUMNS, 'student-loads')
+
 
 class AcademicHistoryViewSet(BaseRegistrarViewSet):
-    queryset = AcademicHistory.objects.select_related('student', 'program', 'section').all()
+    queryset = AcademicHistory.objects.select_related('student', 'program', 'section', 'profile').all()
+    keyset_ordering = ('-academic_year', '-semester', '-id')
+    query_filters = {
+        'student': 'student_id',
+        'student_id': 'student__student_id__startswith',
+        'program': 'program_id',
+        'section': 'section_id',
+        'year_level': 'year_level',
+        'academic_year': 'academic_year',
+        'semester': 'semester',
+    }
     serializer_class = AcademicHistorySerializer
 
+    def audit_state(self, instance):
+        # Compact snapshots keep their profile columns in HistoryProfile and
+        # get a new profile on every change; diff the materialized columns.
+        state = instance_state(materialize(instance))
+        state.pop('profile', None)
+        return state
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        rows = history_export_rows(self.filter_queryset(self.get_queryset()), self.keyset_ordering)
+        return self._export_response(request, rows, ACADEMIC_HISTORY_EXPORT_COLUMNS, 'academic-history')
+
+
+PROMOTION_AUDIT_FIELDS = [
+    'target_year_level',
+    'target_academic_year',
+    'target_semester',
+    'target_program',
+    'target_section',
+    'term_id',
+]
+
+
+def _parse_promotion_request(data):
+    target_year_level = data.get('target_year_level')
+    target_academic_year = data.get('target_academic_year')
+    target_semester = data.get('target_semester')
+    target_program = data.get('target_program')
+    target_section = data.get('target_section', None)
+    admission_date_raw = (data.get('admission_date') or '').strip()
+    # Frontend sends the dragged schedule with day/time format, e.g.:
+    # "MWF 7:00-8:00: ... | TTH 7:00-8:30: ..."
+    # Persist this verbatim (trimmed) to both Student and AcademicHistory.
+    subject_load_schedule = (data.get('subject_load_schedule', '') or '').strip()
+    term_id = data.get('term_id')
+
+    required_fields = [target_year_level, target_academic_year, target_semester, target_program]
+    if any(field in [None, ''] for field in required_fields):
+        return None, None, 'target_year_level, target_academic_year, target_semester, and target_program are required.'
+
+    term = None
+    if term_id:
+        try:
+            term = AcademicTerm.objects.get(pk=term_id)
+        except AcademicTerm.DoesNotExist:
+            return None, None, 'Specified term does not exist.'
+
+        if not term.is_active:
+            return None, None, 'Promotion is only allowed for the active term.'
+
+    parsed_admission_date = None
+    if admission_date_raw:
+        try:
+            parsed_admission_date = date.fromisoformat(admission_date_raw)
+        except ValueError:
+            return None, None, 'Invalid admission_date format. Use YYYY-MM-DD.'
+
+    try:
+        program_id = int(target_program)
+        year_level = int(target_year_level)
+        semester = int(target_semester)
+        section_id = int(target_section) if target_section not in [None, ''] else None
+    except (TypeError, ValueError):
+        return None, None, 'target_program, target_year_level, target_semester, and target_section must be integers.'
+
+    target = PromotionTarget(
+        program_id=program_id,
+        year_level=year_level,
+        academic_year=target_academic_year,
+        semester=semester,
+        section_id=section_id,
+        admission_date=parsed_admission_date,
+        subject_load_schedule=subject_load_schedule,
+        adviser_name=data.get('adviser_name', ''),
+        dean_name=data.get('dean_name', ''),
+    )
+    return target, term, None
+
+
+class AcademicSubjectViewSet(FastListMixin, BaseRegistrarViewSet):
+    queryset = AcademicSubject.objects.select_related('subject').all().order_by('id')
+    serializer_class = AcademicSubjectSerializer
+    keyset_ordering = ('id',)
+    query_filters = {'academic_history': 'academic_history_id', 'subject': 'subject_id'}
+
 
 class ContinuingViewSet(BaseRegistrarViewSet):
     queryset = Student.objects.none()
@@ -218,186 +555,42 @@ class ContinuingViewSet(BaseRegistrarViewSet):
     @action(detail=False, methods=['post'], url_path='promote')
     def promote(self, request):
         student_ids = request.data.get('student_ids', [])
-        target_year_level = request.data.get('target_year_level')
-        target_academic_year = request.data.get('target_academic_year')
-        target_semester = request.data.get('target_semester')
-        target_program = request.data.get('target_program')
-        target_section = request.data.get('target_section', None)
-        admission_date_raw = (request.data.get('admission_date') or '').strip()
-        # Frontend sends the dragged schedule with day/time format, e.g.:
-        # "MWF 7:00-8:00: ... | TTH 7:00-8:30: ..."
-        # Persist this verbatim (trimmed) to both Student and AcademicHistory.
-        subject_load_schedule = (request.data.get('subject_load_schedule', '') or '').strip()
-        adviser_name = request.data.get('adviser_name', '')
-        dean_name = request.data.get('dean_name', '')
-        term_id = request.data.get('term_id')
-
         if not student_ids:
             return Response({'detail': 'student_ids are required.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        required_fields = [target_year_level, target_academic_year, target_semester, target_program]
-        if any(field in [None, ''] for field in required_fields):
-            return Response(
-                {'detail': 'target_year_level, target_academic_year, target_semester, and target_program are required.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        term = None
-        if term_id:
-            try:
-                term = AcademicTerm.objects.get(pk=term_id)
-            except AcademicTerm.DoesNotExist:
-                return Response({'detail': 'Specified term does not exist.'}, status=status.HTTP_400_BAD_REQUEST)
-
-            if not term.is_active:
-                return Response({'detail': 'Promotion is only allowed for the active term.'}, status=status.HTTP_400_BAD_REQUEST)
-
-        parsed_admission_date = None
-        if admission_date_raw:
-            try:
-                parsed_admission_date = date.fromisoformat(admission_date_raw)
-            except ValueError:
-                return Response({'detail': 'Invalid admission_date format. Use YYYY-MM-DD.'}, status=status.HTTP_400_BAD_REQUEST)
+        target, term, error = _parse_promotion_request(request.data)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
 
-        students = Student.objects.select_related('program', 'section').filter(student_id__in=student_ids, is_active=True)
+        students = Student.objects.filter(student_id__in=student_ids, is_active=True)
         if not students.exists():
             return Response({'detail': 'No active students found for the provided student_ids.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        audit_payload = {field: request.data.get(field) for field in PROMOTION_AUDIT_FIELDS}
+        actor = request.user if request.user.is_authenticated else None
         today = date.today()
         processed_student_ids = []
 
         with transaction.atomic():
-            for student in students.select_for_update():
-                current_semester = student.semester or 1
-                current_academic_year = student.academic_year or target_academic_year
-
-                # Save previous semester snapshot before mutating the Student row.
-                AcademicHistory.objects.update_or_create(
-                    student=student,
-                    academic_year=current_academic_year,
-                    semester=current_semester,
-                    defaults={
-                        'year_level': student.year_level,
-                        'program': student.program,
-                        'section': student.section,
-                        'first_name': student.first_name,
-                        'last_name': student.last_name,
-                        'middle_name': student.middle_name,
-                        'extension_name': student.extension_name,
-                        'gender': student.gender,
-                        'sex': student.sex,
-                        'date_of_birth': student.date_of_birth,
-                        'age': student.age,
-                        'civil_status': student.civil_status,
-                        'nationality': student.nationality,
-                        'admission_date': student.admission_date,
-                        'scholarship': student.scholarship,
-                        'course': student.course,
-                        'home_address': student.home_address,
-                        'postal_code': student.postal_code,
-                        'email_address': student.email_address,
-                        'contact_number': student.contact_number,
-                        'mother_maiden_name': student.mother_maiden_name,
-                        'mother_contact_number': student.mother_contact_number,
-                        'father_name': student.father_name,
-                        'father_contact_number': student.father_contact_number,
-                        'elementary_school': student.elementary_school,
-                        'junior_high_school': student.junior_high_school,
-                        'senior_high_school': student.senior_high_school,
-                        'senior_high_track_strand': student.senior_high_track_strand,
-                        'subject_load_schedule': student.subject_load_schedule,
-                        'adviser_name': student.adviser_name,
-                        'adviser_approval_status': student.adviser_approval_status,
-                        'dean_name': student.dean_name,
-                        'dean_approval_status': student.dean_approval_status,
-                        'status': 'completed',
-                        'start_date': student.admission_date or today,
-                        'end_date': today,
-                    },
+            for student_pks in chunked_student_pks(students):
+                processed_student_ids.extend(
+                    promote_chunk(student_pks, target, today, actor=actor, audit_payload=audit_payload)
                 )
 
-                student.program_id = int(target_program)
-                student.year_level = int(target_year_level)
-                student.academic_year = target_academic_year
-                student.semester = int(target_semester)
-                student.section_id = int(target_section) if target_section not in [None, ''] else None
-                if parsed_admission_date and not student.admission_date:
-                    student.admission_date = parsed_admission_date
-                student.subject_load_schedule = subject_load_schedule
-                student.adviser_name = adviser_name
-                student.adviser_approval_status = 'pending'
-                student.dean_name = dean_name
-                student.dean_approval_status = 'pending'
-                student.save()
-
-                # Keep an up-to-date record for the target semester as ongoing.
-                AcademicHistory.objects.update_or_create(
-                    student=student,
-                    academic_year=student.academic_year,
-                    semester=student.semester,
-                    defaults={
-                        'year_level': student.year_level,
-                        'program': student.program,
-                        'section': student.section,
-                        'first_name': student.first_name,
-                        'last_name': student.last_name,
-                        'middle_name': student.middle_name,
-                        'extension_name': student.extension_name,
-                        'gender': student.gender,
-                        'sex': student.sex,
-                        'date_of_birth': student.date_of_birth,
-                        'age': student.age,
-                        'civil_status': student.civil_status,
-                        'nationality': student.nationality,
-                        'admission_date': student.admission_date,
-                        'scholarship': student.scholarship,
-                        'course': student.course,
-                        'home_address': student.home_address,
-                        'postal_code': student.postal_code,
-                        'email_address': student.email_address,
-                        'contact_number': student.contact_number,
-                        'mother_maiden_name': student.mother_maiden_name,
-                        'mother_contact_number': student.mother_contact_number,
-                        'father_name': student.father_name,
-                        'father_contact_number': student.father_contact_number,
-                        'elementary_school': student.elementary_school,
-                        'junior_high_school': student.junior_high_school,
-                        'senior_high_school': student.senior_high_school,
-                        'senior_high_track_strand': student.senior_high_track_strand,
-                        # Save dragged schedule day/time placement for this target semester.
-                        'subject_load_schedule': subject_load_schedule,
-                        'adviser_name': student.adviser_name,
-                        'adviser_approval_status': student.adviser_approval_status,
-                        'dean_name': student.dean_name,
-                        'dean_approval_status': student.dean_approval_status,
-                        'status': 'ongoing',
-                        'start_date': today,
-                        'end_date': None,
-                    },
-                )
-
-                self._write_audit_log(
-                    'promote',
-                    student,
-                    {
-                        'target_year_level': target_year_level,
-                        'target_academic_year': target_academic_year,
-                        'target_semester': target_semester,
-                        'target_program': target_program,
-                        'target_section': target_section,
-                        'term_id': term_id,
-                    },
-                )
-                processed_student_ids.append(student.student_id)
-
         job_result = None
+        job_id = None
         mode = 'skipped'
         if term:
+            job_id = create_job('auto_load', len(processed_student_ids), term_id=term.id)
             try:
-                auto_load_students_task.delay(processed_student_ids, term.id)
+                queue_auto_load(processed_student_ids, term.id, job_id=job_id)
                 mode = 'queued'
             except Exception:
+                mark_job_started(job_id)
                 job_result = auto_load_students(processed_student_ids, term.id)
+                record_job_progress(
+                    job_id, processed=len(processed_student_ids), created=job_result['created_load_rows']
+                )
                 mode = 'sync_fallback'
 
         return Response(
@@ -405,13 +598,238 @@ class ContinuingViewSet(BaseRegistrarViewSet):
                 'detail': f'Processed {len(processed_student_ids)} students with academic history tracking.',
                 'auto_load_mode': mode,
                 'auto_load_result': job_result,
+                'auto_load_job_id': job_id,
                 'processed_student_ids': processed_student_ids,
             },
             status=status.HTTP_200_OK,
         )
 
 
-class AuditLogViewSet(ReadOnlyModelViewSet):
+class AuditLogViewSet(SparseQuerysetMixin, ReadOnlyModelViewSet):
     permission_classes = [IsRegistrarOrStaff]
-    queryset = AuditLog.objects.select_related('actor').all().order_by('-created_at')
+    queryset = AuditLog.objects.select_related('actor').all().order_by('-created_at', '-id')
     serializer_class = AuditLogSerializer
+    keyset_ordering = ('-created_at', '-id')
+    allow_unpaginated = False
+
+    def _parse_range(self):
+        bounds = {}
+        for param in ('since', 'until'):
+            raw = self.request.query_params.get(param)
+            if not raw:
+                continue
+            value = parse_datetime(raw)
+            if value is None:
+                parsed_date = parse_date(raw)
+                if parsed_date is None:
+                    raise ValidationError({param: 'Use an ISO date or datetime.'})
+                value = datetime.combine(parsed_date, time.min)
+            if timezone.is_naive(value):
+                value = timezone.make_aware(value)
+            bounds[param] = value
+        return bounds.get('since'), bounds.get('until')
+
+    def _parse_filters(self):
+        filters = {}
+        for field in ('action', 'entity', 'entity_id', 'actor'):
+            value = self.request.query_params.get(field)
+            if not value:
+                continue
+            if field == 'actor':
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ValidationError({field: 'Must be an integer.'})
+            filters[field] = value
+        return filters
+
+    def _filter(self, queryset, since, until, filters):
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+        if until is not None:
+            queryset = queryset.filter(created_at__lt=until)
+        return queryset.filter(**filters)
+
+    def list(self, request):
+        # Only the hot table is read unless the request can reach archived
+        # rows: a range starting before the archive cutoff or ending by it, or
+        # an open-ended lookup of one entity's whole trail. Archived rows are
+        # then merged into the same keyset page.
+        since, until = self._parse_range()
+        filters = self._parse_filters()
+        cutoff = hot_cutoff()
+        querysets = [self._filter(self.get_queryset(), since, until, filters)]
+        if (
+            (since is not None and since < cutoff)
+            or (until is not None and until <= cutoff)
+            or (since is None and 'entity' in filters and 'entity_id' in filters)
+        ):
+            archived = AuditLogArchive.objects.select_related('actor')
+            if request.query_params.get('fields') or request.query_params.get('omit'):
+                archived = defer_unused_columns(archived, self.get_serializer())
+            querysets.append(self._filter(archived, since, until, filters))
+        paginator = self.paginator
+        page = paginator.paginate_querysets(querysets, request, view=self)
+        context = self.get_serializer_context()
+        data = [
+            (AuditLogArchiveSerializer if isinstance(row, AuditLogArchive) else AuditLogSerializer)(
+                row, context=context
+            ).data
+            for row in page
+        ]
+        return paginator.get_paginated_response(data)
+
+
+class PromotionJobViewSet(SparseQuerysetMixin, ReadOnlyModelViewSet):
+    permission_classes = [IsRegistrarOrStaff]
+    queryset = PromotionJob.objects.prefetch_related('chunks').all().order_by('-created_at', '-id')
+    keyset_ordering = ('-created_at', '-id')
+    serializer_class = PromotionJobSerializer
+
+    def create(self, request):
+        source_program = request.data.get('source_program')
+        source_year_level = request.data.get('source_year_level')
+        source_section = request.data.get('source_section')
+        if source_program in [None, ''] and source_year_level in [None, '']:
+            return Response(
+                {'detail': 'source_program or source_year_level is required.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        target, term, error = _parse_promotion_request(request.data)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = {}
+        for field, name, value in (
+            ('program_id', 'source_program', source_program),
+            ('year_level', 'source_year_level', source_year_level),
+            ('section_id', 'source_section', source_section),
+        ):
+            if value in [None, '']:
+                continue
+            try:
+                filters[field] = int(value)
+            except (TypeError, ValueError):
+                return Response({'detail': f'{name} must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        students = Student.objects.filter(is_active=True, **filters)
+        if not students.exists():
+            return Response({'detail': 'No active students match the provided filters.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        actor = request.user if request.user.is_authenticated else None
+        job = create_promotion_job(students, target, actor=actor, term=term, filters=filters)
+        return self._queue(job)
+
+    @action(detail=True, methods=['post'], url_path='resume')
+    def resume(self, request, pk=None):
+        job = self.get_object()
+        if job.status == 'completed':
+            return Response({'detail': 'Promotion job is already completed.'}, status=status.HTTP_400_BAD_REQUEST)
+        return self._queue(job)
+
+    def _queue(self, job):
+        try:
+            run_promotion_job_task.delay(job.pk)
+        except Exception:
+            return Response(
+                {'detail': 'Promotion job could not be queued. Retry with the resume action.', 'job': self.get_serializer(job).data},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class StudentImportViewSet(SparseQuerysetMixin, ReadOnlyModelViewSet):
+    permission_classes = [IsRegistrarOrStaff]
+    queryset = StudentImport.objects.all().order_by('-created_at', '-id')
+    keyset_ordering = ('-created_at', '-id')
+    serializer_class = StudentImportSerializer
+
+    def get_queryset(self):
+        return super().get_queryset().defer('source')
+
+    def create(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'detail': 'A CSV file upload is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            source = upload.read().decode('utf-8-sig')
+        except UnicodeDecodeError:
+            return Response({'detail': 'The file must be UTF-8 encoded CSV.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        actor = request.user if request.user.is_authenticated else None
+        try:
+            job = create_student_import(source, filename=upload.name, actor=actor)
+        except ValueError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return self._queue(job)
+
+    @action(detail=True, methods=['post'], url_path='resume')
+    def resume(self, request, pk=None):
+        # A 'running' import may belong to a worker that died; every chunk
+        # locks the import row and starts from its checkpoint, so running it
+        # again alongside a live worker cannot import a row twice.
+        job = self.get_object()
+        if job.status == 'completed':
+            return Response({'detail': 'Student import is already completed.'}, status=status.HTTP_400_BAD_REQUEST)
+        return self._queue(job)
+
+    @action(detail=True, methods=['get'], url_path='errors')
+    def errors(self, request, pk=None):
+        job = self.get_object()
+        response = StreamingHttpResponse(csv_stream(error_report_rows(job), IMPORT_ERROR_CSV_FIELDS), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="student-import-{job.pk}-errors.csv"'
+        return response
+
+    def _queue(self, job):
+        try:
+            run_student_import_task.delay(job.pk)
+        except Exception:
+            return Response(
+                {'detail': 'Student import could not be queued. Retry with the resume action.', 'job': self.get_serializer(job).data},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class JobViewSet(ViewSet):
+    # Stateless JWT auth plus cache-backed job state keeps polling off MySQL.
+    authentication_classes = [JWTStatelessUserAuthentication]
+    permission_classes = [IsRegistrarOrStaff]
+
+    def retrieve(self, request, pk=None):
+        job_status = get_job_status(pk)
+        if job_status is None:
+            return Response({'detail': 'Job not found or expired.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job_status, status=status.HTTP_200_OK)
+
+
+class BootstrapViewSet(ViewSet):
+    permission_classes = [IsRegistrarOrStaff]
+
+    def list(self, request):
+        # Served straight from the cached gzip bytes when the client accepts
+        # gzip; otherwise decompressed once here. The bundle is normally
+        # rendered ahead of time by render_bootstrap_task.
+        version, bundle = get_bootstrap_bundle()
+        etag = f'"{version}"'
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+
+        if accepts_gzip(request.headers.get('Accept-Encoding', '')):
+            response = HttpResponse(bundle, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(gzip.decompress(bundle), content_type='application/json')
+        patch_vary_headers(response, ['Accept-Encoding'])
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+class CacheStatsViewSet(ViewSet):
+    permission_classes = [IsRegistrarOrStaff]
+
+    def list(self, request):
+        return Response(response_cache_stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from config.celery import app
+from registrar.caching import clear_local_versions
+from registrar.models import AcademicTerm, Department, Program, Section, Student, Subject
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # In-process indexes are keyed by versions held in the shared cache, so
+    # clearing it (and the versions read-through caches hold locally) is
+    # enough to stop state leaking between tests.
+    cache.clear()
+    clear_local_versions()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def eager_celery(monkeypatch):
+    # There is no broker in tests; anything queued runs inline.
+    monkeypatch.setattr(app.conf, 'task_always_eager', True)
+
+
+@pytest.fixture(autouse=True)
+def sync_audit_sink(settings):
+    settings.REGISTRAR_AUDIT_SINK = 'sync'
+
+
+@pytest.fixture
+def staff_user():
+    return User.objects.create_user(username='registrar', password='registrar-pass', is_staff=True)
+
+
+@pytest.fixture
+def staff_client(staff_user):
+    client = APIClient()
+    client.force_authenticate(staff_user)
+    return client
+
+
+@pytest.fixture
+def program():
+    department = Department.objects.create(name='College of Computer Studies', code='CCS')
+    return Program.objects.create(name='BS Information Technology', code='BSIT', department=department)
+
+
+@pytest.fixture
+def term():
+    return AcademicTerm.objects.create(year_label='2025-2026', semester=1, is_active=True)
+
+
+@pytest.fixture
+def section(program):
+    return Section.objects.create(name='BSIT 1-A', program=program, year_level=1, semester=1)
+
+
+@pytest.fixture
+def make_subject():
+    def _make(code, units='3.0'):
+        return Subject.objects.create(code=code, title=f'{code} title', units=Decimal(units))
+
+    return _make
+
+
+@pytest.fixture
+def make_student(program):
+    counter = {'value': 0}
+
+    def _make(**overrides):
+        counter['value'] += 1
+        data = {
+            'student_id': f'2025-{counter["value"]:04d}',
+            'first_name': 'Juan',
+            'last_name': 'Dela Cruz',
+            'program': program,
+            'year_level': 1,
+        }
+        data.update(overrides)
+        return Student.objects.create(**data)
+
+    return _make
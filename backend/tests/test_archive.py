@@ -0,0 +1,90 @@
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from registrar.archive import archive_audit_entries, export_cold_entries, hot_cutoff, read_cold_entries
+from registrar.models import AuditLog, AuditLogArchive
+
+
+def make_entries(actor, count, created_at):
+    entries = AuditLog.objects.bulk_create(
+        [AuditLog(actor=actor, action='update', entity='Student', entity_id=str(i)) for i in range(count)]
+    )
+    AuditLog.objects.filter(pk__in=[entry.pk for entry in entries]).update(created_at=created_at)
+    return entries
+
+
+@pytest.mark.django_db
+def test_archive_moves_rows_and_keeps_ids(staff_user, settings, tmp_path):
+    settings.REGISTRAR_AUDIT_COLD_STORAGE_DIR = str(tmp_path)
+    old = hot_cutoff() - timedelta(days=40)
+    old_ids = {entry.pk for entry in make_entries(staff_user, 5, old)}
+    make_entries(staff_user, 2, timezone.now())
+
+    assert archive_audit_entries(hot_cutoff(), batch_size=2) == 5
+    assert AuditLog.objects.count() == 2
+    assert set(AuditLogArchive.objects.values_list('id', flat=True)) == old_ids
+
+    assert export_cold_entries(hot_cutoff(), batch_size=3) == 5
+    assert not AuditLogArchive.objects.exists()
+    [path] = tmp_path.iterdir()
+    rows = list(read_cold_entries(path))
+    assert {row['id'] for row in rows} == old_ids
+    assert rows[0]['created_at'] == old
+
+
+@pytest.mark.django_db
+def test_archive_command_dry_run(staff_user, settings, tmp_path):
+    settings.REGISTRAR_AUDIT_COLD_STORAGE_DIR = str(tmp_path)
+    make_entries(staff_user, 3, hot_cutoff() - timedelta(days=1))
+    call_command('archive_audit_log', '--dry-run')
+    assert AuditLog.objects.count() == 3
+    call_command('archive_audit_log')
+    assert AuditLogArchive.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_audit_list_pages_by_keyset_and_reads_archive_only_for_old_ranges(staff_client, staff_user):
+    make_entries(staff_user, 3, timezone.now())
+    old = hot_cutoff() - timedelta(days=3)
+    make_entries(staff_user, 2, old)
+    archive_audit_entries(hot_cutoff())
+
+    first = staff_client.get('/api/audit-logs/', {'page_size': 2}).json()
+    assert len(first['results']) == 2
+    second = staff_client.get(first['next']).json()
+    assert len(second['results']) == 1
+    assert second['next'] is None
+
+    since = (old - timedelta(days=1)).isoformat()
+    merged = staff_client.get('/api/audit-logs/', {'since': since, 'page_size': 10}).json()['results']
+    assert len(merged) == 5
+    assert merged[-1]['actor_username'] == staff_user.username
+    created = [row['created_at'] for row in merged]
+    assert created == sorted(created, reverse=True)
+
+    assert staff_client.get('/api/audit-logs/', {'cursor': 'garbage'}).status_code == 404
+    assert staff_client.get('/api/audit-logs/', {'since': 'nope'}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_audit_list_reads_archive_for_entity_trails_and_closed_old_ranges(staff_client, staff_user):
+    make_entries(staff_user, 2, timezone.now())
+    make_entries(staff_user, 2, hot_cutoff() - timedelta(days=3))
+    archive_audit_entries(hot_cutoff())
+
+    trail = staff_client.get('/api/audit-logs/', {'entity': 'Student', 'entity_id': '1'}).json()['results']
+    assert len(trail) == 2
+    until = hot_cutoff().isoformat()
+    assert len(staff_client.get('/api/audit-logs/', {'until': until}).json()['results']) == 2
+
+    assert staff_client.get('/api/audit-logs/', {'actor': 'me'}).status_code == 400
+    assert len(staff_client.get('/api/audit-logs/', {'actor': staff_user.pk}).json()['results']) == 2
+
+    AuditLog.objects.create(actor=staff_user, action='create', entity='ProspectusEntry', entity_id='bulk-copy')
+    bulk = staff_client.get('/api/audit-logs/', {'entity': 'ProspectusEntry', 'entity_id': 'bulk-copy'})
+    assert [row['entity_id'] for row in bulk.json()['results']] == ['bulk-copy']
@@ -0,0 +1,114 @@
+import pytest
+from django.db import DatabaseError
+from django.utils import timezone
+
+from registrar.audit import COMPRESSED_PAYLOAD_KEY, BufferedAuditSink, audit_entry, expand_payload
+from registrar.models import AcademicHistory, AuditLog, Department
+
+
+@pytest.mark.django_db
+def test_buffered_sink_writes_on_commit_and_flush(staff_user, django_capture_on_commit_callbacks):
+    sink = BufferedAuditSink(max_size=3)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sink.record([audit_entry(staff_user, 'create', 'Department', 1)])
+    assert not AuditLog.objects.exists()
+
+    assert sink.flush() == 1
+    assert AuditLog.objects.get().entity_id == '1'
+
+    sink.write([audit_entry(staff_user, 'update', 'Department', pk) for pk in range(3)])
+    assert AuditLog.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_buffered_sink_drops_entries_from_rolled_back_transactions(staff_user, django_capture_on_commit_callbacks):
+    sink = BufferedAuditSink()
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        sink.record([audit_entry(staff_user, 'create', 'Department', 1)])
+    assert len(callbacks) == 1
+    assert sink.flush() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_viewset_writes_are_flushed_at_request_end(staff_client, settings):
+    settings.REGISTRAR_AUDIT_SINK = 'buffered'
+    response = staff_client.post('/api/departments/', {'name': 'College of Education', 'code': 'COE'})
+
+    assert response.status_code == 201
+    assert AuditLog.objects.get().entity_id == str(Department.objects.get().pk)
+
+
+@pytest.mark.django_db
+def test_update_records_only_changed_fields(staff_client, make_student):
+    student = make_student(subject_load_schedule='MWF 8:00-9:00 ' * 50)
+    response = staff_client.patch(f'/api/students/{student.student_id}/', {'first_name': 'Pedro'}, format='json')
+
+    assert response.status_code == 200
+    entry = AuditLog.objects.get(action='update')
+    assert entry.payload == {'changes': {'first_name': ['Juan', 'Pedro']}}
+
+
+@pytest.mark.django_db
+def test_large_payloads_are_compressed_and_capped(staff_user, staff_client, settings):
+    settings.REGISTRAR_AUDIT_COMPRESS_BYTES = 64
+    payload = {'changes': {'subject_load_schedule': ['', 'TTh 1:00-2:30 ' * 40]}}
+    entry = audit_entry(staff_user, 'update', 'Student', 1, payload)
+    entry.save()
+
+    assert set(entry.payload) == {COMPRESSED_PAYLOAD_KEY}
+    assert expand_payload(entry.payload) == payload
+    assert staff_client.get('/api/audit-logs/').json()['results'][0]['payload'] == payload
+
+    settings.REGISTRAR_AUDIT_PAYLOAD_MAX_BYTES = 16
+    capped = audit_entry(staff_user, 'update', 'Student', 1, payload)
+    assert capped.payload['truncated'] is True
+    assert capped.payload['fields'] == ['subject_load_schedule']
+
+
+@pytest.mark.django_db
+def test_compact_history_update_records_profile_field_changes(staff_client, make_student, program):
+    student = make_student()
+    created = staff_client.post('/api/academic-history/', {
+        'student': student.pk, 'academic_year': '2025-2026', 'semester': 1, 'year_level': 1,
+        'program': program.pk, 'start_date': '2025-08-01', 'home_address': 'X',
+    }, format='json')
+    history = AcademicHistory.objects.get(pk=created.json()['id'])
+    assert history.profile_id and history.home_address == ''
+
+    response = staff_client.patch(f'/api/academic-history/{history.pk}/', {'home_address': 'Y'}, format='json')
+
+    assert response.status_code == 200
+    assert AuditLog.objects.get(action='update').payload == {'changes': {'home_address': ['X', 'Y']}}
+    assert 'profile' not in AuditLog.objects.get(action='create').payload['changes']
+
+
+@pytest.mark.django_db
+def test_full_buffer_blocks_the_writer_instead_of_dropping(staff_user, monkeypatch):
+    sink = BufferedAuditSink(max_size=3, retry_delay=0)
+    original = AuditLog.objects.bulk_create
+    sizes, failures = [], [2]
+
+    def flaky(entries, **kwargs):
+        sizes.append(len(sink._entries) + len(entries))
+        if failures[0]:
+            failures[0] -= 1
+            raise DatabaseError('database is down')
+        return original(entries, **kwargs)
+
+    monkeypatch.setattr(AuditLog.objects, 'bulk_create', flaky)
+    for pk in range(4):
+        sink.write([audit_entry(staff_user, 'update', 'Department', pk) for _ in range(2)])
+    sink.flush()
+
+    assert AuditLog.objects.count() == 8
+    assert max(sizes) <= 6
+
+
+@pytest.mark.django_db
+def test_buffered_entries_keep_their_event_time(staff_user):
+    sink = BufferedAuditSink()
+    sink.write([audit_entry(staff_user, 'update', 'Department', 1)])
+    recorded = timezone.now()
+    sink.flush()
+    assert AuditLog.objects.get().created_at < recorded
\ No newline at end of file
@@ -0,0 +1,69 @@
+import pytest
+
+from registrar import services
+from registrar.models import ProspectusEntry, StudentLoad
+from registrar.services import auto_load_students, get_eligible_subjects
+
+
+@pytest.mark.django_db
+def test_auto_load_matches_per_student_eligibility(program, term, section, make_subject, make_student):
+    intro, prog1, prog2, sectioned = (make_subject(code) for code in ['IT101', 'IT102', 'IT201', 'IT103'])
+    ProspectusEntry.objects.create(program=program, subject=intro, year_level=1, semester=1)
+    ProspectusEntry.objects.create(program=program, subject=prog1, year_level=1, semester=1)
+    ProspectusEntry.objects.create(program=program, subject=prog2, year_level=1, semester=1, prerequisite=prog1)
+    ProspectusEntry.objects.create(
+        program=program, subject=sectioned, year_level=1, semester=1, academic_year='2025-2026', section=section
+    )
+
+    default_student = make_student()
+    sectioned_student = make_student(academic_year='2025-2026', section=section)
+    passed_student = make_student()
+    StudentLoad.objects.create(student=passed_student, term=term, subject=prog1, status='passed')
+
+    expected = {
+        student.pk: {subject.pk for subject in get_eligible_subjects(student, term)}
+        for student in [default_student, sectioned_student, passed_student]
+    }
+    existing = StudentLoad.objects.count()
+
+    result = auto_load_students(
+        [default_student.student_id, sectioned_student.student_id, passed_student.student_id], term.pk
+    )
+
+    assert result == {'created_load_rows': StudentLoad.objects.count() - existing}
+    for student_pk, subject_pks in expected.items():
+        loaded = set(StudentLoad.objects.filter(student_id=student_pk, term=term).values_list('subject_id', flat=True))
+        assert loaded == subject_pks
+    assert auto_load_students([default_student.student_id], term.pk) == {'created_load_rows': 0}
+
+
+@pytest.mark.django_db
+def test_auto_load_query_count_does_not_grow_with_students(
+    program, term, make_subject, make_student, django_assert_max_num_queries
+):
+    for code in ['GE1', 'GE2', 'GE3']:
+        ProspectusEntry.objects.create(program=program, subject=make_subject(code), year_level=1, semester=1)
+    student_ids = [make_student().student_id for _ in range(40)]
+
+    # Includes the two reads that count the rows actually inserted.
+    with django_assert_max_num_queries(14):
+        result = auto_load_students(student_ids, term.pk)
+    assert result == {'created_load_rows': 120}
+
+
+@pytest.mark.django_db
+def test_auto_load_does_not_count_rows_a_concurrent_run_inserted(program, term, make_subject, make_student, monkeypatch):
+    subjects = [make_subject(code) for code in ['GE1', 'GE2']]
+    for subject in subjects:
+        ProspectusEntry.objects.create(program=program, subject=subject, year_level=1, semester=1)
+    student = make_student()
+    plan = services.plan_auto_loads
+
+    def plan_then_race(students, term):
+        plans = list(plan(students, term))
+        StudentLoad.objects.create(student=student, term=term, subject=subjects[0])
+        return plans
+
+    monkeypatch.setattr(services, 'plan_auto_loads', plan_then_race)
+    assert auto_load_students([student.student_id], term.pk) == {'created_load_rows': 1}
+    assert StudentLoad.objects.filter(student=student, term=term).count() == 2
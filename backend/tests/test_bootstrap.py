@@ -0,0 +1,51 @@
+import gzip
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from registrar.bootstrap import accepts_gzip
+from registrar.models import Subject
+
+
+@pytest.mark.django_db
+def test_bootstrap_bundle_is_cached_and_rebuilt_on_change(
+    staff_client, program, term, section, make_subject, django_capture_on_commit_callbacks
+):
+    make_subject('IT101')
+    first = staff_client.get('/api/bootstrap/')
+    body = json.loads(first.content)
+    assert set(body) == {'departments', 'programs', 'terms', 'sections', 'subjects', 'prospectus'}
+    assert [row['code'] for row in body['subjects']] == ['IT101']
+
+    with CaptureQueriesContext(connection) as queries:
+        compressed = staff_client.get('/api/bootstrap/', HTTP_ACCEPT_ENCODING='gzip')
+    assert not any('registrar_subject' in query['sql'] for query in queries.captured_queries)
+    assert compressed['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(compressed.content)) == body
+    assert staff_client.get('/api/bootstrap/', HTTP_IF_NONE_MATCH=first['ETag']).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Subject.objects.create(code='IT102', title='Programming 2', units=3)
+    # Rendered when the version moved, not by the next request.
+    with CaptureQueriesContext(connection) as queries:
+        rebuilt = json.loads(staff_client.get('/api/bootstrap/').content)
+    assert not any('registrar_subject' in query['sql'] for query in queries.captured_queries)
+    assert [row['code'] for row in rebuilt['subjects']] == ['IT101', 'IT102']
+
+
+@pytest.mark.parametrize(
+    'header, expected',
+    [
+        ('gzip', True),
+        ('deflate, gzip;q=0.5', True),
+        ('gzip;q=0', False),
+        ('GZIP; Q=0.0, *', False),
+        ('br, *;q=0.1', True),
+        ('identity', False),
+        ('', False),
+    ],
+)
+def test_accepts_gzip_reads_q_values(header, expected):
+    assert accepts_gzip(header) is expected
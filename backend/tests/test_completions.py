@@ -0,0 +1,45 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from registrar.completions import completed_subject_ids
+from registrar.models import CompletedSubject, StudentLoad
+
+
+@pytest.mark.django_db
+def test_completed_subjects_follow_student_load_writes(term, make_subject, make_student):
+    student = make_student()
+    subject = make_subject('IT101')
+    load = StudentLoad.objects.create(student=student, term=term, subject=subject)
+    assert completed_subject_ids(student) == set()
+
+    load.status = 'passed'
+    load.save()
+    assert completed_subject_ids(student) == {subject.pk}
+
+    load.status = 'failed'
+    load.save()
+    assert completed_subject_ids(student) == set()
+
+    load.status = 'completed'
+    load.save()
+    load.delete()
+    assert completed_subject_ids(student) == set()
+
+
+@pytest.mark.django_db
+def test_rebuild_command_reports_and_repairs_drift(term, make_subject, make_student):
+    student = make_student()
+    passed, stale = make_subject('IT101'), make_subject('IT102')
+    StudentLoad.objects.create(student=student, term=term, subject=passed, status='passed')
+    CompletedSubject.objects.filter(student=student).delete()
+    CompletedSubject.objects.create(student=student, subject=stale)
+
+    out = StringIO()
+    call_command('rebuild_completed_subjects', '--check', stdout=out)
+    assert 'Drift found: 1 missing, 1 stale' in out.getvalue()
+    assert completed_subject_ids(student) == {stale.pk}
+
+    call_command('rebuild_completed_subjects', stdout=StringIO())
+    assert completed_subject_ids(student) == {passed.pk}
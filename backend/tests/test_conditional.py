@@ -0,0 +1,71 @@
+import pytest
+from django.core.cache import cache
+
+from registrar.caching import _version_key
+from registrar.conditional import table_namespace
+from registrar.models import Department, ProspectusEntry, Section
+
+
+@pytest.mark.django_db
+def test_unchanged_reference_list_answers_304(staff_client, program, django_capture_on_commit_callbacks):
+    first = staff_client.get('/api/programs/')
+    assert first.status_code == 200
+    etag = first['ETag']
+
+    again = staff_client.get('/api/programs/', HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304
+    assert again['ETag'] == etag
+    assert not again.content
+
+    filtered = staff_client.get('/api/programs/', {'department': program.department_id}, HTTP_IF_NONE_MATCH=etag)
+    assert filtered.status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        staff_client.patch(f'/api/programs/{program.pk}/', {'name': 'BS Information Systems'}, format='json')
+    changed = staff_client.get('/api/programs/', HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_copy_section_bumps_prospectus_version(
+    staff_client, program, section, make_subject, django_capture_on_commit_callbacks
+):
+    target = Section.objects.create(name='BSIT 1-B', program=program, year_level=1, semester=1)
+    ProspectusEntry.objects.create(
+        program=program, subject=make_subject('IT101'), year_level=1, semester=1, academic_year='2025-2026', section=section
+    )
+    etag = staff_client.get('/api/prospectus/')['ETag']
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = staff_client.post(
+            '/api/prospectus/copy-section/',
+            {
+                'program': program.pk,
+                'year_level': 1,
+                'semester': 1,
+                'academic_year': '2025-2026',
+                'source_section': section.pk,
+                'target_section': target.pk,
+            },
+            format='json',
+        )
+    assert response.json()['created'] == 1
+    assert staff_client.get('/api/prospectus/', HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_etag_and_cached_body_share_one_version(staff_client):
+    Department.objects.create(name='College of Engineering')
+    first = staff_client.get('/api/departments/')
+    assert len(first.json()['results']) == 1
+
+    # Another process commits a row and bumps the shared version while this
+    # one still holds the old version locally.
+    Department.objects.create(name='College of Nursing')
+    cache.incr(_version_key(table_namespace(Department)))
+
+    second = staff_client.get('/api/departments/', HTTP_IF_NONE_MATCH=first['ETag'])
+    assert second.status_code == 200
+    assert second['ETag'] != first['ETag']
+    assert len(second.json()['results']) == 2
@@ -0,0 +1,38 @@
+import pytest
+
+from registrar.curriculum import get_resolved_curriculum
+from registrar.models import ProspectusEntry
+
+
+@pytest.mark.django_db
+def test_resolved_curriculum_prefers_most_specific_tier(program, section, make_subject, make_student):
+    default_subject, section_subject = make_subject('GE101'), make_subject('IT101')
+    ProspectusEntry.objects.create(program=program, subject=default_subject, year_level=1, semester=1)
+    ProspectusEntry.objects.create(
+        program=program, subject=section_subject, year_level=1, semester=1, academic_year='2025-2026', section=section
+    )
+    student = make_student(academic_year='2025-2026', section=section)
+
+    curriculum = get_resolved_curriculum(student, 1)
+
+    assert curriculum.tier == ('2025-2026', section.pk)
+    assert curriculum.entries == ((section_subject.pk, None),)
+    assert curriculum.entry_for_subject(default_subject.pk) == (default_subject.pk, None)
+
+
+@pytest.mark.django_db
+def test_resolved_curriculum_is_cached_until_prospectus_changes(
+    program, make_subject, make_student, django_assert_num_queries
+):
+    first = make_subject('GE101')
+    ProspectusEntry.objects.create(program=program, subject=first, year_level=1, semester=1)
+    student = make_student()
+    get_resolved_curriculum(student, 1)
+
+    with django_assert_num_queries(0):
+        assert get_resolved_curriculum(student, 1).entries == ((first.pk, None),)
+
+    second = make_subject('GE102')
+    ProspectusEntry.objects.create(program=program, subject=second, year_level=1, semester=1, prerequisite=first)
+
+    assert get_resolved_curriculum(student, 1).entries == ((first.pk, None), (second.pk, first.pk))
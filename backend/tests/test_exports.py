@@ -0,0 +1,75 @@
+import csv
+import io
+import zipfile
+from datetime import date
+from xml.etree import ElementTree
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from registrar.history import compact_existing_histories
+from registrar.models import AcademicHistory, StudentLoad
+
+SHEET_NS = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+def _csv_rows(response):
+    assert response.streaming
+    return list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+
+@pytest.mark.django_db
+def test_student_export_streams_filtered_rows_in_chunks(staff_client, settings, make_student, section):
+    settings.REGISTRAR_EXPORT_CHUNK_SIZE = 2
+    for _ in range(5):
+        make_student(section=section)
+    make_student(is_active=False)
+
+    with CaptureQueriesContext(connection) as queries:
+        rows = _csv_rows(staff_client.get('/api/students/export/', {'section': section.pk}))
+    assert rows[0][:3] == ['student_id', 'last_name', 'first_name']
+    assert [row[0] for row in rows[1:]] == [f'2025-{index:04d}' for index in range(1, 6)]
+    assert rows[1][8] == 'BSIT 1-A'
+    student_queries = [q for q in queries.captured_queries if 'FROM "registrar_student"' in q['sql']]
+    assert len(student_queries) == 3
+
+
+@pytest.mark.django_db
+def test_load_and_history_exports(staff_client, make_student, make_subject, program, term):
+    student = make_student(first_name='María')
+    StudentLoad.objects.create(student=student, term=term, subject=make_subject('IT101'))
+    AcademicHistory.objects.create(
+        student=student, academic_year='2024-2025', semester=2, year_level=1, program=program,
+        first_name='María', last_name='Dela Cruz', start_date=date(2025, 1, 6),
+    )
+    compact_existing_histories()
+
+    loads = _csv_rows(staff_client.get('/api/student-loads/export/', {'term': term.pk}))
+    assert loads[1] == ['2025-0001', 'Dela Cruz', 'María', '2025-2026', '1', 'IT101', 'IT101 title', '3.0', 'enrolled']
+
+    history = _csv_rows(staff_client.get('/api/academic-history/export/', {'student_id': '2025'}))
+    assert history[1][:3] == ['2025-0001', 'Dela Cruz', 'María']
+    assert history[1][-2:] == ['2025-01-06', '']
+
+
+@pytest.mark.django_db
+def test_xlsx_export_is_a_readable_workbook(staff_client, make_student):
+    make_student(middle_name='<Santos & "Reyes">\x01')
+    make_student()
+    response = staff_client.get('/api/students/export/', {'output': 'xlsx'})
+    assert response['Content-Disposition'].endswith('.xlsx"')
+
+    workbook = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+    sheet = ElementTree.fromstring(workbook.read('xl/worksheets/sheet1.xml'))
+    rows = sheet.findall('.//x:row', SHEET_NS)
+    assert len(rows) == 3
+    cells = rows[1].findall('x:c', SHEET_NS)
+    assert cells[3].find('.//x:t', SHEET_NS).text == '<Santos & "Reyes">'
+    assert cells[9].find('x:v', SHEET_NS).text == '1'
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_output(staff_client):
+    response = staff_client.get('/api/students/export/', {'output': 'pdf'})
+    assert response.status_code == 400
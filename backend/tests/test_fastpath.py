@@ -0,0 +1,67 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from registrar import fastpath
+from registrar.models import AcademicHistory, AcademicSubject, ProspectusEntry, StudentLoad
+
+
+@pytest.fixture
+def records(make_student, make_subject, program, section, term):
+    first = make_student(
+        first_name='José', last_name='Peña Line', middle_name='tab\there "quoted" \x01',
+        date_of_birth=date(2004, 2, 29), section=section, semester=1,
+    )
+    make_student(email_address='second@example.com')
+    make_student(is_active=False)
+    subject = make_subject('IT101', '3.0')
+    StudentLoad.objects.create(student=first, term=term, subject=subject)
+    ProspectusEntry.objects.create(program=program, subject=subject, year_level=1, semester=1)
+    history = AcademicHistory.objects.create(
+        student=first, academic_year='2024-2025', semester=2, year_level=1, program=program, start_date=date.today()
+    )
+    AcademicSubject.objects.create(academic_history=history, subject=subject, credits=3, grade=Decimal('1.75'))
+    AcademicSubject.objects.create(academic_history=history, subject=make_subject('GE101'), credits=2)
+
+
+def _both(client, settings, url, params):
+    settings.REGISTRAR_FAST_LIST_RENDERING = False
+    slow = client.get(url, params)
+    settings.REGISTRAR_FAST_LIST_RENDERING = True
+    fast = client.get(url, params)
+    assert slow.status_code == fast.status_code == 200
+    return slow.content, fast.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('encoder', ['orjson', 'json'])
+@pytest.mark.parametrize('url,params', [
+    ('/api/students/', {}),
+    ('/api/students/', {'page_size': 1}),
+    ('/api/students/', {'paginate': 'false', 'is_active': 'false'}),
+    ('/api/students/', {'fields': 'student_id,date_of_birth,section'}),
+    ('/api/student-loads/', {}),
+    ('/api/prospectus/', {}),
+    ('/api/academic-subjects/', {}),
+])
+def test_fast_list_matches_serializer_bytes(staff_client, settings, monkeypatch, records, encoder, url, params):
+    if encoder == 'json':
+        monkeypatch.setattr(fastpath, 'orjson', None)
+    elif fastpath.orjson is None:
+        pytest.skip('orjson is not installed')
+    slow, fast = _both(staff_client, settings, url, params)
+    assert fast == slow
+
+
+@pytest.mark.django_db
+def test_cursor_pages_match(staff_client, settings, records):
+    next_url = staff_client.get('/api/students/', {'page_size': 1}).json()['next']
+    slow, fast = _both(staff_client, settings, next_url, {})
+    assert fast == slow and b'2025-0002' in fast
+
+
+@pytest.mark.django_db
+def test_method_field_serializers_fall_back(staff_client, settings, records):
+    slow, fast = _both(staff_client, settings, '/api/students/', {'include': 'loads'})
+    assert fast == slow and b'"loads"' in fast
@@ -0,0 +1,30 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+def test_fields_param_trims_payload_and_columns(staff_client, make_student):
+    make_student(home_address='123 Rizal Ave', subject_load_schedule='MWF 8:00')
+    make_student()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_client.get('/api/students/', {'fields': 'student_id,first_name,program'})
+    rows = response.json()['results']
+    assert set(rows[0]) == {'student_id', 'first_name', 'program'}
+    [student_query] = [q['sql'] for q in queries.captured_queries if 'FROM "registrar_student"' in q['sql']]
+    assert 'home_address' not in student_query
+    assert 'subject_load_schedule' not in student_query
+
+
+@pytest.mark.django_db
+def test_omit_param_and_writes_keep_full_fields(staff_client, make_student):
+    student = make_student()
+    detail = staff_client.get(f'/api/students/{student.student_id}/', {'omit': 'home_address,loads'}).json()
+    assert 'home_address' not in detail and 'loads' not in detail
+    assert detail['student_id'] == student.student_id
+
+    response = staff_client.patch(
+        f'/api/students/{student.student_id}/?fields=student_id', {'first_name': 'Pedro'}, format='json'
+    )
+    assert response.json()['first_name'] == 'Pedro'
@@ -0,0 +1,88 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from registrar.history import materialize_all, prune_unreferenced_profiles
+from registrar.models import AcademicHistory, HistoryProfile
+
+
+@pytest.mark.django_db
+def test_compact_and_expand_round_trip(program, make_student):
+    student = make_student(date_of_birth='2005-04-01', home_address='Bayawan City')
+    for academic_year in ['2024-2025', '2025-2026']:
+        AcademicHistory.objects.create(
+            student=student,
+            academic_year=academic_year,
+            semester=1,
+            year_level=1,
+            program=program,
+            first_name=student.first_name,
+            last_name=student.last_name,
+            date_of_birth=student.date_of_birth,
+            home_address=student.home_address,
+            start_date='2024-08-01',
+        )
+
+    call_command('compact_academic_history', stdout=StringIO())
+
+    assert HistoryProfile.objects.count() == 1
+    assert set(AcademicHistory.objects.values_list('home_address', flat=True)) == {''}
+    snapshots = materialize_all(AcademicHistory.objects.order_by('academic_year'))
+    assert [(snapshot.home_address, str(snapshot.date_of_birth)) for snapshot in snapshots] == [
+        ('Bayawan City', '2005-04-01'),
+        ('Bayawan City', '2005-04-01'),
+    ]
+
+    call_command('compact_academic_history', '--expand', stdout=StringIO())
+    assert set(AcademicHistory.objects.values_list('home_address', 'profile')) == {('Bayawan City', None)}
+
+
+@pytest.mark.django_db
+def test_history_api_reads_and_writes_through_profiles(staff_client, program, make_student):
+    student = make_student()
+    response = staff_client.post(
+        '/api/academic-history/',
+        {
+            'student': student.pk,
+            'academic_year': '2025-2026',
+            'semester': 1,
+            'year_level': 1,
+            'program': program.pk,
+            'first_name': 'Juan',
+            'home_address': 'Bayawan City',
+            'start_date': '2025-08-01',
+        },
+        format='json',
+    )
+    assert response.status_code == 201
+    assert response.data['home_address'] == 'Bayawan City'
+    assert AcademicHistory.objects.get().home_address == ''
+
+    response = staff_client.patch(f"/api/academic-history/{response.data['id']}/", {'status': 'completed'}, format='json')
+    assert (response.data['status'], response.data['first_name']) == ('completed', 'Juan')
+
+
+@pytest.mark.django_db
+def test_profiles_left_behind_by_edits_are_pruned(staff_client, program, make_student):
+    student = make_student()
+    created = staff_client.post(
+        '/api/academic-history/',
+        {
+            'student': student.pk,
+            'academic_year': '2025-2026',
+            'semester': 1,
+            'year_level': 1,
+            'program': program.pk,
+            'home_address': 'Bayawan City',
+            'start_date': '2025-08-01',
+        },
+        format='json',
+    )
+    staff_client.patch(f"/api/academic-history/{created.data['id']}/", {'home_address': 'Dumaguete City'}, format='json')
+    assert HistoryProfile.objects.count() == 2
+
+    assert prune_unreferenced_profiles() == 0
+    assert prune_unreferenced_profiles(grace=timedelta(0)) == 1
+    assert HistoryProfile.objects.get().pk == AcademicHistory.objects.get().profile_id
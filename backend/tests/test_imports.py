@@ -0,0 +1,132 @@
+import csv
+import io
+from itertools import islice
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+
+from config.celery import app
+from registrar import imports
+from registrar.imports import create_student_import, run_student_import
+from registrar.models import AuditLog, Student, StudentImport
+from registrar.search import search_students
+
+HEADER = 'student_id,first_name,last_name,program,section,date_of_birth,year_level,email_address\n'
+
+
+def _intake(*rows):
+    return HEADER + ''.join(row + '\n' for row in rows)
+
+
+@pytest.mark.django_db
+def test_upload_imports_valid_rows_and_reports_the_rest(staff_client, program, section, make_student, monkeypatch):
+    monkeypatch.setattr(app.conf, 'task_always_eager', True)
+    make_student(student_id='2025-9999')
+    source = _intake(
+        '2025-0101,Ana,Reyes,BSIT,BSIT 1-A,2006-05-14,,ana@example.com',
+        '2025-0102,Ben,Cruz,bsit,,,2,',
+        '2025-0103,Cara,Lim,NURS,,,,',
+        '2025-0104,Dan,Uy,BSIT,BSIT 9-Z,2006-02-30,x,not-an-email',
+        '2025-9999,Eve,Sy,BSIT,,,,',
+        '2025-0101,Ana,Again,BSIT,,,,',
+    )
+    upload = SimpleUploadedFile('intake.csv', source.encode('utf-8-sig'), content_type='text/csv')
+
+    response = staff_client.post('/api/student-imports/', {'file': upload}, format='multipart')
+
+    assert response.status_code == 202
+    job = StudentImport.objects.get(pk=response.data['id'])
+    assert (job.status, job.total_rows, job.created_count, job.error_count) == ('completed', 6, 2, 4)
+    ana = Student.objects.get(student_id='2025-0101')
+    assert ana.section == section and ana.year_level == 1 and str(ana.date_of_birth) == '2006-05-14'
+    assert Student.objects.get(student_id='2025-0102').year_level == 2
+    assert [match.student.student_id for match in search_students('Ana Reyes')][:1] == ['2025-0101']
+    assert AuditLog.objects.filter(action='import', entity='Student').count() == 2
+
+    errors = {entry['row']: entry['errors'] for entry in job.errors}
+    assert errors[4] == {'program': ['Unknown program.']}
+    assert set(errors[5]) == {'section', 'date_of_birth', 'year_level', 'email_address'}
+    assert list(errors[6]) == list(errors[7]) == ['student_id']
+
+    report = staff_client.get(f'/api/student-imports/{job.pk}/errors/')
+    rows = list(csv.DictReader(io.StringIO(b''.join(report.streaming_content).decode())))
+    assert {row['row'] for row in rows} == {'4', '5', '6', '7'}
+
+
+@pytest.mark.django_db
+def test_upload_rejects_bad_header(staff_client):
+    upload = SimpleUploadedFile('intake.csv', b'student_id,first_name,shoe_size\n', content_type='text/csv')
+    response = staff_client.post('/api/student-imports/', {'file': upload}, format='multipart')
+    assert response.status_code == 400
+    assert 'last_name' in response.data['detail']
+
+
+@pytest.mark.django_db
+def test_import_resumes_after_failed_chunk(program, monkeypatch, django_assert_max_num_queries):
+    job = create_student_import(_intake(*(f'2025-{index:04d},Juan,Cruz,BSIT,,,,' for index in range(1, 6))))
+    original = imports.sync_student_name_index
+    calls = []
+
+    def crash_on_second_chunk(students):
+        calls.append(students)
+        if len(calls) == 2:
+            raise RuntimeError('lost connection')
+        original(students)
+
+    monkeypatch.setattr(imports, 'sync_student_name_index', crash_on_second_chunk)
+    with pytest.raises(RuntimeError):
+        run_student_import(job.pk, chunk_size=2)
+    job.refresh_from_db()
+    assert (job.status, job.processed_rows, Student.objects.count()) == ('failed', 2, 2)
+
+    monkeypatch.setattr(imports, 'sync_student_name_index', original)
+    # Queries scale with chunks (each locks the import row), not rows.
+    with django_assert_max_num_queries(30):
+        job = run_student_import(job.pk, chunk_size=2)
+    assert (job.status, job.created_count, job.error_count, job.source) == ('completed', 5, 0, '')
+    assert Student.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_import_students_command(program, tmp_path):
+    path = tmp_path / 'intake.csv'
+    path.write_text(_intake('2025-0201,Lia,Tan,BSIT,,,,', '2025-0202,,Tan,BSIT,,,,'), encoding='utf-8')
+    report = tmp_path / 'errors.csv'
+
+    out = io.StringIO()
+    call_command('import_students', str(path), errors=str(report), stdout=out)
+
+    assert '1 students created, 1 rows rejected' in out.getvalue()
+    assert 'first_name' in report.read_text()
+
+
+@pytest.mark.django_db
+def test_import_continues_from_rows_committed_by_a_concurrent_run(staff_client, program, monkeypatch):
+    job = create_student_import(_intake(*(f'2025-{index:04d},Juan,Cruz,BSIT,,,,' for index in range(1, 6))))
+    lookups = imports.ImportLookups
+
+    class ConcurrentRun(lookups):
+        def __init__(self):
+            super().__init__()
+            # Another worker commits the first chunk after this run started.
+            rows = list(islice(enumerate(imports._reader(job.source), start=2), 2))
+            created, _ = imports.import_rows(rows, lookups())
+            StudentImport.objects.filter(pk=job.pk).update(processed_rows=2, created_count=len(created))
+
+    monkeypatch.setattr(imports, 'ImportLookups', ConcurrentRun)
+    job = run_student_import(job.pk, chunk_size=2)
+    assert (job.status, job.created_count, job.error_count) == ('completed', 5, 0)
+    assert staff_client.post(f'/api/student-imports/{job.pk}/resume/').status_code == 400
+
+
+@pytest.mark.django_db
+def test_resume_recovers_an_import_left_running_by_a_dead_worker(staff_client, program, monkeypatch):
+    monkeypatch.setattr(app.conf, 'task_always_eager', True)
+    job = create_student_import(_intake(*(f'2025-{index:04d},Juan,Cruz,BSIT,,,,' for index in range(1, 4))))
+    StudentImport.objects.filter(pk=job.pk).update(status='running')
+
+    response = staff_client.post(f'/api/student-imports/{job.pk}/resume/')
+    assert response.status_code == 202
+    job.refresh_from_db()
+    assert (job.status, job.created_count) == ('completed', 3)
@@ -0,0 +1,37 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from registrar.jobs import create_job, get_job_status, mark_job_started, record_job_progress
+
+
+def test_job_status_tracks_counters():
+    job_id = create_job('auto_load', 4, term_id=1)
+    assert get_job_status(job_id)['status'] == 'queued'
+
+    mark_job_started(job_id)
+    record_job_progress(job_id, processed=2, created=10)
+    running = get_job_status(job_id)
+    assert running['status'] == 'running'
+    assert running['eta_seconds'] is not None
+
+    record_job_progress(job_id, failed=2)
+    finished = get_job_status(job_id)
+    assert finished['status'] == 'completed_with_errors'
+    assert (finished['students_processed'], finished['rows_created'], finished['failures']) == (2, 10, 2)
+    assert finished['term_id'] == 1
+
+
+@pytest.mark.django_db
+def test_job_endpoint_authorizes_from_token_claims(django_assert_num_queries):
+    User.objects.create_user(username='registrar', password='registrar-pass', is_staff=True)
+    client = APIClient()
+    token = client.post('/api/auth/login/', {'username': 'registrar', 'password': 'registrar-pass'}).data['access']
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    job_id = create_job('auto_load', 1)
+
+    with django_assert_num_queries(0):
+        response = client.get(f'/api/jobs/{job_id}/')
+    assert response.status_code == 200
+    assert response.data['status'] == 'queued'
+    assert client.get('/api/jobs/missing/').status_code == 404
@@ -0,0 +1,66 @@
+from datetime import date
+
+import pytest
+
+from registrar.models import AcademicHistory, AcademicTerm
+
+
+@pytest.mark.django_db
+def test_students_page_by_cursor(staff_client, make_student):
+    for _ in range(5):
+        make_student()
+
+    seen = []
+    url, params = '/api/students/', {'page_size': 2}
+    while url:
+        body = staff_client.get(url, params).json()
+        seen.extend(row['student_id'] for row in body['results'])
+        url, params = body['next'], None
+    assert seen == [f'2025-{n:04d}' for n in range(1, 6)]
+
+
+@pytest.mark.django_db
+def test_mixed_direction_ordering_and_legacy_flag(staff_client):
+    for year in ('2023-2024', '2024-2025'):
+        for semester in (1, 2):
+            AcademicTerm.objects.create(year_label=year, semester=semester)
+
+    first = staff_client.get('/api/terms/', {'page_size': 3}).json()
+    rest = staff_client.get(first['next']).json()
+    pages = [(row['year_label'], row['semester']) for row in first['results'] + rest['results']]
+    assert pages == [('2024-2025', 1), ('2024-2025', 2), ('2023-2024', 1), ('2023-2024', 2)]
+
+    legacy = staff_client.get('/api/terms/', {'paginate': 'false'}).json()
+    assert [(row['year_label'], row['semester']) for row in legacy] == pages
+
+
+@pytest.mark.django_db
+def test_student_filters(staff_client, make_student, section):
+    make_student(year_level=2, semester=1)
+    make_student(section=section, semester=1)
+    make_student(is_active=False)
+
+    def ids(**params):
+        return [row['student_id'] for row in staff_client.get('/api/students/', params).json()['results']]
+
+    assert ids(year_level=2) == ['2025-0001']
+    assert ids(section=section.pk) == ['2025-0002']
+    assert ids(semester=1) == ['2025-0001', '2025-0002']
+    assert ids(is_active='false') == ['2025-0003']
+    assert ids(student_id='2025-000') == ['2025-0001', '2025-0002']
+    assert staff_client.get('/api/students/', {'year_level': 'x'}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_student_history_direct_lookup(staff_client, make_student, program):
+    student = make_student(academic_year='2025-2026', semester=1)
+    AcademicHistory.objects.create(
+        student=student, academic_year='2025-2026', semester=1, year_level=1, program=program, start_date=date.today()
+    )
+    url = f'/api/students/{student.student_id}/history/'
+
+    found = staff_client.get(url, {'academic_year': '2025-2026', 'semester': 1})
+    assert found.status_code == 200
+    assert found.json()['student'] == student.pk
+    assert staff_client.get(url, {'academic_year': '2025-2026', 'semester': 2}).status_code == 404
+    assert len(staff_client.get(url).json()) == 1
@@ -0,0 +1,85 @@
+import pytest
+
+from registrar.models import ProspectusEntry, ProspectusRequisite, StudentLoad
+from registrar.prerequisites import COREQUISITE, PREREQUISITE, build_prerequisite_graph
+from registrar.serializers import ProspectusEntrySerializer, ProspectusRequisiteSerializer, StudentLoadSerializer
+from registrar.services import get_eligible_subjects
+
+
+def test_graph_closure_order_and_cycles():
+    graph = build_prerequisite_graph([(2, 1, PREREQUISITE), (3, 2, PREREQUISITE), (3, 4, PREREQUISITE), (5, 3, COREQUISITE)])
+
+    assert graph.closure[3] == {1, 2, 4}
+    assert graph.order.index(1) < graph.order.index(2) < graph.order.index(3)
+    assert graph.outstanding_prerequisites(3, {2}) == [node for node in graph.order if node in {1, 4}]
+    assert graph.creates_cycle(1, 3)
+    assert not graph.creates_cycle(3, 5)
+    assert graph.eligible([1, 4, 5], set()) == [1, 4]
+    assert graph.eligible([1, 4, 5], set(), concurrent={3}) == [1, 4, 5]
+
+    cyclic = build_prerequisite_graph([(1, 2, PREREQUISITE), (2, 1, PREREQUISITE)])
+    assert cyclic.cycle == (1, 2)
+
+
+@pytest.mark.django_db
+def test_multiple_prerequisites_and_corequisites_gate_eligibility(program, term, make_subject, make_student):
+    math, prog, lab, lecture = (make_subject(code) for code in ['MATH1', 'IT101', 'IT201L', 'IT201'])
+    ProspectusEntry.objects.create(program=program, subject=math, year_level=1, semester=2)
+    ProspectusEntry.objects.create(program=program, subject=prog, year_level=1, semester=2)
+    lecture_entry = ProspectusEntry.objects.create(
+        program=program, subject=lecture, year_level=1, semester=1, prerequisite=prog
+    )
+    lab_entry = ProspectusEntry.objects.create(program=program, subject=lab, year_level=1, semester=1)
+    ProspectusRequisite.objects.create(entry=lecture_entry, subject=math, kind=PREREQUISITE)
+    ProspectusRequisite.objects.create(entry=lab_entry, subject=lecture, kind=COREQUISITE)
+
+    student = make_student()
+    StudentLoad.objects.create(student=student, term=term, subject=prog, status='passed')
+    assert get_eligible_subjects(student, term) == []
+
+    StudentLoad.objects.create(student=student, term=term, subject=math, status='passed')
+    assert {subject.code for subject in get_eligible_subjects(student, term)} == {'IT201', 'IT201L'}
+
+
+@pytest.mark.django_db
+def test_prospectus_serializers_reject_cycles(program, make_subject):
+    first, second = make_subject('IT101'), make_subject('IT102')
+    entry = ProspectusEntry.objects.create(program=program, subject=second, year_level=1, semester=2, prerequisite=first)
+
+    serializer = ProspectusEntrySerializer(
+        data={
+            'program': program.pk,
+            'subject': first.pk,
+            'year_level': 1,
+            'semester': 1,
+            'academic_year': '',
+            'section': None,
+            'prerequisite': second.pk,
+        }
+    )
+    assert not serializer.is_valid()
+    assert 'cycle' in str(serializer.errors)
+
+    first_entry = ProspectusEntry.objects.create(program=program, subject=first, year_level=1, semester=1)
+    serializer = ProspectusRequisiteSerializer(data={'entry': first_entry.pk, 'subject': second.pk})
+    assert not serializer.is_valid()
+    assert ProspectusRequisiteSerializer(
+        data={'entry': entry.pk, 'subject': first.pk, 'kind': COREQUISITE}
+    ).is_valid()
+
+
+@pytest.mark.django_db
+def test_prerequisites_follow_the_resolved_curriculum_variant(program, term, make_subject, make_student):
+    basics, advanced = make_subject('IT101'), make_subject('IT201')
+    ProspectusEntry.objects.create(
+        program=program, subject=advanced, year_level=1, semester=1, academic_year='2024-2025', prerequisite=basics
+    )
+    ProspectusEntry.objects.create(program=program, subject=advanced, year_level=1, semester=1, academic_year='2025-2026')
+
+    current = make_student(academic_year='2025-2026')
+    assert [subject.code for subject in get_eligible_subjects(current, term)] == ['IT201']
+    serializer = StudentLoadSerializer(data={'student': current.pk, 'term': term.pk, 'subject': advanced.pk})
+    assert serializer.is_valid(), serializer.errors
+
+    older = make_student(academic_year='2024-2025')
+    assert get_eligible_subjects(older, term) == []
@@ -0,0 +1,149 @@
+import pytest
+
+from registrar import promotion
+from registrar.history import materialize_all
+from registrar.models import AcademicHistory, AuditLog, Student
+from registrar.promotion import PromotionTarget, create_promotion_job, run_promotion_job
+
+
+def _promote(client, student_ids, **overrides):
+    payload = {
+        'student_ids': student_ids,
+        'target_year_level': 2,
+        'target_academic_year': '2026-2027',
+        'target_semester': 1,
+        'target_program': overrides.pop('target_program'),
+        'subject_load_schedule': ' MWF 7:00-8:00: IT201 ',
+        'adviser_name': 'Adviser',
+        'dean_name': 'Dean',
+    }
+    payload.update(overrides)
+    return client.post('/api/continuing/promote/', payload, format='json')
+
+
+@pytest.mark.django_db
+def test_promote_snapshots_history_and_updates_students(staff_client, program, section, make_student):
+    student = make_student(academic_year='2025-2026', semester=2, section=section, home_address='Bayawan City')
+    AcademicHistory.objects.create(
+        student=student,
+        academic_year='2025-2026',
+        semester=2,
+        year_level=1,
+        program=program,
+        status='ongoing',
+        start_date='2025-08-01',
+    )
+
+    response = _promote(staff_client, [student.student_id], target_program=program.pk)
+
+    assert response.status_code == 200
+    assert response.data['processed_student_ids'] == [student.student_id]
+    student.refresh_from_db()
+    assert (student.year_level, student.academic_year, student.semester, student.section_id) == (2, '2026-2027', 1, None)
+    assert student.subject_load_schedule == 'MWF 7:00-8:00: IT201'
+    assert student.adviser_name == 'Adviser'
+
+    previous, current = materialize_all(AcademicHistory.objects.filter(student=student).order_by('academic_year'))
+    assert (previous.status, previous.section_id, previous.home_address) == ('completed', section.pk, 'Bayawan City')
+    assert previous.end_date is not None
+    assert (current.status, current.year_level, current.end_date) == ('ongoing', 2, None)
+    assert current.subject_load_schedule == 'MWF 7:00-8:00: IT201'
+    assert AuditLog.objects.filter(action='promote', entity_id=str(student.pk)).count() == 1
+
+
+@pytest.mark.django_db
+def test_promote_statement_count_is_constant(staff_client, program, make_student, django_assert_max_num_queries):
+    student_ids = [make_student(academic_year='2026-2027', semester=1).student_id for _ in range(30)]
+
+    with django_assert_max_num_queries(14):
+        response = _promote(staff_client, student_ids, target_program=program.pk)
+
+    assert response.status_code == 200
+    # Previous and target semesters coincide, so only the ongoing record remains.
+    assert set(AcademicHistory.objects.values_list('status', flat=True)) == {'ongoing'}
+    assert AcademicHistory.objects.count() == 30
+    assert Student.objects.filter(year_level=2).count() == 30
+
+
+def _job_target(program):
+    return PromotionTarget(
+        program_id=program.pk,
+        year_level=2,
+        academic_year='2026-2027',
+        semester=1,
+        section_id=None,
+        admission_date=None,
+        subject_load_schedule='',
+        adviser_name='',
+        dean_name='',
+    )
+
+
+@pytest.mark.django_db
+def test_promotion_job_resumes_after_failed_chunk(staff_user, program, make_student, monkeypatch):
+    students = [make_student(academic_year='2025-2026', semester=2) for _ in range(5)]
+    job = create_promotion_job(Student.objects.all(), _job_target(program), actor=staff_user, chunk_size=2)
+    assert [len(chunk.student_ids) for chunk in job.chunks.all()] == [2, 2, 1]
+
+    calls = {'count': 0}
+    original = promotion.promote_chunk
+
+    def crash_on_second_chunk(*args, **kwargs):
+        calls['count'] += 1
+        if calls['count'] == 2:
+            raise RuntimeError('worker lost')
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(promotion, 'promote_chunk', crash_on_second_chunk)
+    with pytest.raises(RuntimeError):
+        run_promotion_job(job.pk)
+    job.refresh_from_db()
+    assert job.status == 'failed'
+    assert list(job.chunks.values_list('status', flat=True)) == ['committed', 'failed', 'pending']
+
+    monkeypatch.setattr(promotion, 'promote_chunk', original)
+    run_promotion_job(job.pk)
+    job.refresh_from_db()
+    assert job.status == 'completed'
+    assert set(job.chunks.values_list('status', flat=True)) == {'committed'}
+    for student in students:
+        assert list(
+            AcademicHistory.objects.filter(student=student).order_by('academic_year').values_list('status', flat=True)
+        ) == ['completed', 'ongoing']
+    assert AuditLog.objects.filter(action='promote').count() == 5
+
+
+@pytest.mark.django_db
+def test_promotion_job_rejects_non_integer_ids(staff_client, program, make_student):
+    make_student()
+    payload = {'target_year_level': 2, 'target_academic_year': '2026-2027', 'target_semester': 1, 'target_program': program.pk}
+
+    response = staff_client.post('/api/promotion-jobs/', {**payload, 'source_program': 'BSIT'}, format='json')
+    assert response.status_code == 400
+    assert response.data['detail'] == 'source_program must be an integer.'
+    response = staff_client.post('/api/promotion-jobs/', {**payload, 'source_year_level': 1, 'source_section': [1]}, format='json')
+    assert response.status_code == 400
+
+    response = _promote(staff_client, ['2025-0001'], target_program=program.pk, target_semester='first')
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_chunk_callback_does_not_fail_a_committed_chunk(staff_user, program, make_student):
+    for _ in range(3):
+        make_student(academic_year='2025-2026', semester=2)
+    job = create_promotion_job(Student.objects.all(), _job_target(program), actor=staff_user, chunk_size=2)
+    dispatched = []
+
+    def broken_dispatch(job, processed):
+        dispatched.append(processed)
+        raise RuntimeError('broker down')
+
+    job = run_promotion_job(job.pk, on_chunk_committed=broken_dispatch)
+    assert job.status == 'completed'
+    assert set(job.chunks.values_list('status', flat=True)) == {'committed'}
+
+    run_promotion_job(job.pk, on_chunk_committed=broken_dispatch)
+    assert len(dispatched) == 2
+    assert AuditLog.objects.filter(action='promote').count() == 3
+    assert AcademicHistory.objects.count() == 6
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from registrar.models import ProspectusEntry, StudentLoad
+
+
+@pytest.mark.django_db
+def test_auto_load_dry_run_streams_diff_without_writing(staff_client, program, term, make_subject, make_student):
+    intro, advanced = make_subject('IT101'), make_subject('IT201')
+    ProspectusEntry.objects.create(program=program, subject=intro, year_level=1, semester=1)
+    ProspectusEntry.objects.create(program=program, subject=advanced, year_level=1, semester=1, prerequisite=intro)
+    student = make_student()
+    make_student(is_active=False)
+
+    response = staff_client.get(f'/api/terms/{term.pk}/auto-load-dry-run/')
+    rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    assert rows == [
+        {
+            'student_id': student.student_id,
+            'program_id': program.pk,
+            'year_level': 1,
+            'would_add': ['IT101'],
+            'blocked': [{'subject': 'IT201', 'missing': ['IT101']}],
+        }
+    ]
+    assert not StudentLoad.objects.exists()
+
+    response = staff_client.get(f'/api/terms/{term.pk}/auto-load-dry-run/', {'output': 'csv'})
+    lines = b''.join(response.streaming_content).decode().splitlines()
+    assert lines[0] == 'student_id,program_id,year_level,outcome,subject_code,missing_requisites'
+    assert lines[2] == f'{student.student_id},{program.pk},1,blocked,IT201,IT101'
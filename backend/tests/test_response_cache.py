@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from django.db import connection
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+
+from registrar import caching
+from registrar.caching import ReadThroughCache, TTLLRUCache, bump_version
+from registrar.models import Subject
+from registrar.response_cache import get_response_cache
+
+
+def test_ttl_lru_cache_expires_and_evicts():
+    local = TTLLRUCache(maxsize=2, ttl=0.05)
+    local.set('a', 1)
+    local.set('b', 2)
+    local.set('c', 3)
+    assert local.get('a') is None
+    assert local.get('c') == 3
+    time.sleep(0.06)
+    assert local.get('c') is None
+
+
+class CountingCache:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(cache, name)
+
+
+def test_l1_hits_make_no_shared_cache_round_trips(monkeypatch):
+    read_cache = ReadThroughCache('test', version_ttl=60, stats_flush_every=3)
+    assert read_cache.get_or_set('key', lambda: 1) == 1
+
+    shared = CountingCache()
+    monkeypatch.setattr(caching, 'cache', shared)
+    assert read_cache.get_or_set('key', lambda: 2) == 1
+    assert shared.calls == []
+    assert read_cache.get_or_set('key', lambda: 2) == 1
+    assert set(shared.calls) <= {'incr', 'add'}
+    assert read_cache.stats.shared(ReadThroughCache.METRICS) == {'l1_hits': 2, 'l2_hits': 0, 'misses': 1}
+
+    bump_version('test')
+    assert read_cache.get_or_set('key', lambda: 3) == 3
+
+
+@pytest.mark.django_db
+def test_subject_reads_are_cached_until_a_write(staff_client, make_subject, django_capture_on_commit_callbacks):
+    subject = make_subject('IT101')
+    stats = get_response_cache(Subject).stats
+    before = stats.local()
+
+    assert staff_client.get('/api/subjects/').status_code == 200
+    with CaptureQueriesContext(connection) as queries:
+        cached = staff_client.get('/api/subjects/')
+    assert not any('registrar_subject' in query['sql'] for query in queries.captured_queries)
+    assert cached.json()['results'][0]['code'] == 'IT101'
+    after = stats.local()
+    assert after.get('misses', 0) - before.get('misses', 0) == 1
+    assert after.get('l1_hits', 0) - before.get('l1_hits', 0) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        staff_client.patch(f'/api/subjects/{subject.pk}/', {'title': 'Intro to Computing'}, format='json')
+    assert staff_client.get(f'/api/subjects/{subject.pk}/').json()['title'] == 'Intro to Computing'
+    assert staff_client.get('/api/subjects/').json()['results'][0]['title'] == 'Intro to Computing'
+
+    totals = staff_client.get('/api/cache-stats/').json()['table:registrar.subject']['total']
+    assert totals['misses'] >= 2
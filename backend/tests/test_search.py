@@ -0,0 +1,59 @@
+import pytest
+from django.core.management import call_command
+
+from registrar.models import Student, StudentNameTrigram
+from registrar.search import SEARCH_CANDIDATES, name_index_drift, search_students, sync_student_name_index, trigrams
+
+
+def test_trigrams_normalize_case_and_accents():
+    assert trigrams('Peña') == trigrams('pena') == {'  p', ' pe', 'pen', 'ena', 'na '}
+
+
+@pytest.mark.django_db
+def test_search_ranks_misspelled_and_partial_names(make_student):
+    santos = make_student(first_name='Maria', middle_name='Clara', last_name='Santos')
+    make_student(first_name='Mario', last_name='Santiago')
+    make_student(first_name='Jose', last_name='Rizal')
+
+    matches = search_students('Santso Maria')
+    assert matches[0].student == santos
+    assert all(match.student.last_name != 'Rizal' for match in matches)
+
+    assert [match.student for match in search_students('santi')][0].last_name == 'Santiago'
+
+
+@pytest.mark.django_db
+def test_index_follows_student_writes(staff_client, make_student):
+    student = make_student(first_name='Andres', last_name='Bonifacio')
+    response = staff_client.patch(f'/api/students/{student.student_id}/', {'last_name': 'Mabini'}, format='json')
+    assert response.status_code == 200
+
+    assert not search_students('Bonifacio')
+    results = staff_client.get('/api/students/search/', {'q': 'mabni'}).json()['results']
+    assert results[0]['student_id'] == student.student_id
+    assert not name_index_drift()
+
+
+@pytest.mark.django_db
+def test_rebuild_repairs_bulk_writes(make_student):
+    student = make_student(first_name='Emilio', last_name='Aguinaldo')
+    Student.objects.filter(pk=student.pk).update(last_name='Jacinto')
+    assert name_index_drift() == [student.pk]
+
+    call_command('rebuild_name_index')
+    assert not name_index_drift()
+    assert StudentNameTrigram.objects.filter(student=student, trigram='jac').exists()
+
+
+@pytest.mark.django_db
+def test_filtered_out_students_do_not_crowd_out_matches(staff_client, program, make_student):
+    crowd = Student.objects.bulk_create(
+        Student(student_id=f'2019-{index:04d}', first_name='Maria', last_name='Santos', program=program, is_active=False)
+        for index in range(SEARCH_CANDIDATES + 10)
+    )
+    sync_student_name_index(Student.objects.filter(pk__in=[student.pk for student in crowd]))
+    match = make_student(first_name='Maria', last_name='Santiago')
+
+    assert [found.student for found in search_students('Maria Santos')] == [match]
+    response = staff_client.get('/api/students/search/', {'q': 'Maria Santos', 'program': program.pk})
+    assert [row['student_id'] for row in response.json()['results']] == [match.student_id]
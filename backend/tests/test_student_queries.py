@@ -0,0 +1,42 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from registrar.models import StudentLoad
+
+
+@pytest.fixture
+def students_with_loads(make_student, make_subject, term):
+    subjects = [make_subject('IT102'), make_subject('IT101')]
+    students = [make_student() for _ in range(3)]
+    for student in students:
+        for subject in subjects:
+            StudentLoad.objects.create(student=student, term=term, subject=subject)
+    return students
+
+
+def load_queries(queries):
+    return [q['sql'] for q in queries.captured_queries if 'FROM "registrar_studentload"' in q['sql']]
+
+
+@pytest.mark.django_db
+def test_list_skips_loads_unless_included(staff_client, students_with_loads):
+    with CaptureQueriesContext(connection) as queries:
+        plain = staff_client.get('/api/students/').json()['results']
+    assert not load_queries(queries)
+    assert 'loads' not in plain[0]
+
+    with CaptureQueriesContext(connection) as queries:
+        included = staff_client.get('/api/students/', {'include': 'loads'}).json()['results']
+    assert len(load_queries(queries)) == 1
+    assert [load['subject_code'] for load in included[0]['loads']] == ['IT101', 'IT102']
+
+
+@pytest.mark.django_db
+def test_retrieve_uses_single_ordered_prefetch(staff_client, students_with_loads):
+    student = students_with_loads[0]
+    with CaptureQueriesContext(connection) as queries:
+        detail = staff_client.get(f'/api/students/{student.student_id}/').json()
+    [loads_sql] = load_queries(queries)
+    assert 'registrar_subject' in loads_sql and 'registrar_academicterm' in loads_sql
+    assert [load['subject_code'] for load in detail['loads']] == ['IT101', 'IT102']
@@ -0,0 +1,22 @@
+import pytest
+
+from config.celery import app
+from registrar.models import ProspectusEntry, StudentLoad
+from registrar.tasks import chunked, queue_auto_load
+
+
+def test_chunked_splits_into_fixed_size_chunks():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.django_db
+def test_queue_auto_load_sums_chunk_results(program, term, make_subject, make_student, monkeypatch):
+    monkeypatch.setattr(app.conf, 'task_always_eager', True)
+    for code in ['GE1', 'GE2']:
+        ProspectusEntry.objects.create(program=program, subject=make_subject(code), year_level=1, semester=1)
+    student_ids = [make_student().student_id for _ in range(5)]
+
+    result = queue_auto_load(student_ids, term.pk, chunk_size=2)
+
+    assert result.get() == {'created_load_rows': 10}
+    assert StudentLoad.objects.count() == 10
@@ -0,0 +1,82 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from registrar.models import AcademicHistory, AcademicSubject, StudentLoad, TranscriptTerm
+from registrar.transcripts import get_transcripts
+
+
+@pytest.fixture
+def graded_student(make_student, make_subject, program, term):
+    student = make_student(academic_year='2025-2026', semester=1)
+    history = AcademicHistory.objects.create(
+        student=student, academic_year='2024-2025', semester=2, year_level=1, program=program, start_date=date.today()
+    )
+    AcademicSubject.objects.create(
+        academic_history=history, subject=make_subject('IT101', 3), credits=3, status='completed', grade=Decimal('1.50')
+    )
+    AcademicSubject.objects.create(
+        academic_history=history, subject=make_subject('GE101', 2), credits=2, status='completed', grade=Decimal('2.00')
+    )
+    StudentLoad.objects.create(student=student, term=term, subject=make_subject('IT201', 3))
+    return student
+
+
+@pytest.mark.django_db
+def test_transcript_groups_terms_with_units_and_gwa(staff_client, graded_student):
+    body = staff_client.get(f'/api/students/{graded_student.student_id}/transcript/').json()
+
+    assert [(term['academic_year'], term['semester']) for term in body['terms']] == [('2024-2025', 2), ('2025-2026', 1)]
+    first, current = body['terms']
+    assert [row['subject_code'] for row in first['subjects']] == ['GE101', 'IT101']
+    assert first['gwa'] == 1.7
+    assert current['subjects'][0]['completion'] == 'enrolled'
+    assert current['subjects'][0]['year_level'] == 1
+    assert body['units'] == 8.0 and body['earned_units'] == 5.0
+    assert body['gwa'] == 1.7
+
+    rows = staff_client.get(f'/api/students/{graded_student.student_id}/tor-subjects/').json()
+    assert [row['subject_code'] for row in rows] == ['GE101', 'IT101', 'IT201']
+
+
+@pytest.mark.django_db
+def test_only_changed_terms_are_rebuilt(graded_student):
+    get_transcripts([graded_student.pk])
+    assert not TranscriptTerm.objects.filter(stale=True).exists()
+
+    with CaptureQueriesContext(connection) as queries:
+        get_transcripts([graded_student.pk])
+    assert not any('registrar_academicsubject' in query['sql'] for query in queries.captured_queries)
+
+    item = AcademicSubject.objects.get(subject__code='IT101')
+    item.grade = Decimal('1.00')
+    item.save()
+    assert list(TranscriptTerm.objects.filter(stale=True).values_list('academic_year', flat=True)) == ['2024-2025']
+
+    transcript = get_transcripts([graded_student.pk])[graded_student.pk]
+    assert transcript.terms[0].subjects[1]['grade_final'] == '1.00'
+    assert transcript.gwa == Decimal('1.4000')
+
+
+@pytest.mark.django_db
+def test_load_saves_mark_only_real_changes_and_term_renames_mark_loads(graded_student, term, django_assert_num_queries):
+    get_transcripts([graded_student.pk])
+    load = StudentLoad.objects.select_related('term').get(student=graded_student)
+
+    # Only the pre_save lookup and the UPDATE itself.
+    with django_assert_num_queries(2):
+        load.save()
+    assert not TranscriptTerm.objects.filter(stale=True).exists()
+
+    load.status = 'dropped'
+    load.save()
+    assert list(TranscriptTerm.objects.filter(stale=True).values_list('academic_year', flat=True)) == ['2025-2026']
+
+    get_transcripts([graded_student.pk])
+    term.year_label = '2026-2027'
+    term.save()
+    transcript = get_transcripts([graded_student.pk])[graded_student.pk]
+    assert [built.academic_year for built in transcript.terms] == ['2024-2025', '2026-2027']
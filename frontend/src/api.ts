@@ -82,6 +82,33 @@ api.interceptors.response.use(
   },
 )
 
+export type CursorPage<T> = {
+  next: string | null
+  results: T[]
+}
+
+export async function listAll<T>(url: string, params?: Record<string, unknown>): Promise<{ data: T[] }> {
+  const data: T[] = []
+  let next: string | null = url
+  let pageParams: Record<string, unknown> | undefined = { page_size: 500, ...params }
+  while (next) {
+    const response: { data: CursorPage<T> } = await api.get<CursorPage<T>>(next, { params: pageParams })
+    data.push(...response.data.results)
+    next = response.data.next
+    pageParams = undefined
+  }
+  return { data }
+}
+
+export type ReferenceBundle<Department, Program, Term, Section, Subject, Prospectus> = {
+  departments: Department[]
+  programs: Program[]
+  terms: Term[]
+  sections: Section[]
+  subjects: Subject[]
+  prospectus: Prospectus[]
+}
+
 export async function login(username: string, password: string): Promise<LoginResponse> {
   const response = await authApi.post<LoginResponse>('/auth/login/', { username, password })
   localStorage.setItem('access_token', response.data.access)
@@ -1,6 +1,6 @@
 ﻿import { FormEvent, useEffect, useState } from 'react'
 
-import { api, getErrorMessage } from '../api'
+import { api, getErrorMessage, listAll } from '../api'
 import { SaveIcon } from '../components/Icons'
 
 type Department = {
@@ -99,10 +99,10 @@ export function AdminPage() {
 
   const loadData = async () => {
     const [deptResp, progResp, termResp, sectionResp] = await Promise.all([
-      api.get<Department[]>('/departments/'),
-      api.get<Program[]>('/programs/'),
-      api.get<AcademicTerm[]>('/terms/'),
-      api.get<Section[]>('/sections/'),
+      listAll<Department>('/departments/'),
+      listAll<Program>('/programs/'),
+      listAll<AcademicTerm>('/terms/'),
+      listAll<Section>('/sections/'),
     ])
     setDepartments(deptResp.data)
     setPrograms(progResp.data)
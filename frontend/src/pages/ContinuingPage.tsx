@@ -1,6 +1,6 @@
 ﻿import { DragEvent, FormEvent, useEffect, useMemo, useRef, useState } from 'react'
 
-import { api, getErrorMessage } from '../api'
+import { api, getErrorMessage, listAll, type ReferenceBundle } from '../api'
 import { ContinuingIcon, SearchIcon } from '../components/Icons'
 
 type Program = {
@@ -253,21 +253,17 @@ export function ContinuingPage() {
   const academicYearOptions = useMemo(buildAcademicYearOptions, [])
 
   const loadReferenceData = async () => {
-    const [departmentResp, programResp, sectionResp, subjectResp, prospectusResp, termResp, studentsResp] = await Promise.all([
-      api.get<Department[]>('/departments/'),
-      api.get<Program[]>('/programs/'),
-      api.get<Section[]>('/sections/'),
-      api.get<Subject[]>('/subjects/'),
-      api.get<ProspectusEntry[]>('/prospectus/'),
-      api.get<AcademicTerm[]>('/terms/'),
-      api.get<StudentDetail[]>('/students/'), // Load detailed student data to check continuing status
+    const [bundleResp, studentsResp] = await Promise.all([
+      api.get<ReferenceBundle<Department, Program, AcademicTerm, Section, Subject, ProspectusEntry>>('/bootstrap/'),
+      listAll<StudentDetail>('/students/'), // Load detailed student data to check continuing status
     ])
-    setDepartments(departmentResp.data)
-    setPrograms(programResp.data)
-    setSections(sectionResp.data)
-    setSubjects(subjectResp.data)
-    setProspectusEntries(prospectusResp.data)
-    setTerms(termResp.data)
+    const bundle = bundleResp.data
+    setDepartments(bundle.departments)
+    setPrograms(bundle.programs)
+    setSections(bundle.sections)
+    setSubjects(bundle.subjects)
+    setProspectusEntries(bundle.prospectus)
+    setTerms(bundle.terms)
     
     // Filter to show only students who have undergone continuing process
     // Exclude 1st Year - 1st Semester students and only show actual continuing students
@@ -821,13 +817,10 @@ export function ContinuingPage() {
 
       // Keep current semester history in sync with finalized schedule/approvals.
       try {
-        const historyResponse = await api.get<AcademicHistoryRecord[]>('/academic-history/')
-        const matchedHistory = historyResponse.data.find(
-          (history) =>
-            history.student === student.id &&
-            history.academic_year === selectedAcademicYear &&
-            Number(history.semester) === Number(selectedSemester),
-        )
+        const historyResponse = await api.get<AcademicHistoryRecord>(`/students/${student.student_id}/history/`, {
+          params: { academic_year: selectedAcademicYear, semester: selectedSemester },
+        })
+        const matchedHistory = historyResponse.data
         if (matchedHistory) {
           await api.patch(`/academic-history/${matchedHistory.id}/`, {
             adviser_name: resolvedAdviserName,
@@ -877,13 +870,10 @@ export function ContinuingPage() {
       let resolvedScholarship = selected.scholarship || ''
       let resolvedDateOfBirth = selected.date_of_birth
       try {
-        const historyResponse = await api.get<AcademicHistoryRecord[]>('/academic-history/')
-        const matchedHistory = historyResponse.data.find(
-          (history) =>
-            history.student === selected.id &&
-            history.academic_year === selected.academic_year &&
-            Number(history.semester) === Number(selected.semester),
-        )
+        const historyResponse = await api.get<AcademicHistoryRecord>(`/students/${selected.student_id}/history/`, {
+          params: { academic_year: selected.academic_year, semester: selected.semester },
+        })
+        const matchedHistory = historyResponse.data
         if (matchedHistory) {
           resolvedStatus = formatStatusForSlip(matchedHistory.status)
           if (!resolvedScholarship) resolvedScholarship = matchedHistory.scholarship || ''
@@ -53,8 +53,8 @@ export function DashboardPage() {
 
   useEffect(() => {
     api
-      .get<AuditLog[]>('/audit-logs/')
-      .then((response) => setLogs(response.data.slice(0, 20)))
+      .get<{ next: string | null; results: AuditLog[] }>('/audit-logs/', { params: { page_size: 20 } })
+      .then((response) => setLogs(response.data.results))
       .catch((err) => setError(getErrorMessage(err)))
   }, [])
 
@@ -1,6 +1,6 @@
 import { DragEvent, FormEvent, useCallback, useEffect, useMemo, useState } from 'react'
 
-import { api, getErrorMessage } from '../api'
+import { api, getErrorMessage, listAll, type ReferenceBundle } from '../api'
 import { AddUserIcon, SearchIcon } from '../components/Icons'
 
 type Subject = {
@@ -419,7 +419,7 @@ export function EnrollmentPage() {
 
   const loadEnrolledStudents = useCallback(async () => {
     try {
-      const response = await api.get<EnrolledStudent[]>('/students/')
+      const response = await listAll<EnrolledStudent>('/students/', { year_level: 1, semester: 1 })
       const newlyEnrolledStudents = response.data.filter(
         (student) => student.year_level === 1 && Number(student.semester) === 1,
       )
@@ -430,22 +430,17 @@ export function EnrollmentPage() {
   }, [])
 
   const loadReferenceData = async () => {
-    const [subjectResp, termResp, departmentResp, programResp, sectionResp, prospectusResp] = await Promise.all([
-      api.get<Subject[]>('/subjects/'),
-      api.get<AcademicTerm[]>('/terms/'),
-      api.get<Department[]>('/departments/'),
-      api.get<Program[]>('/programs/'),
-      api.get<Section[]>('/sections/'),
-      api.get<ProspectusEntry[]>('/prospectus/'),
-    ])
-    setSubjects(subjectResp.data)
-    setTerms(termResp.data)
-    setDepartments(departmentResp.data)
-    setPrograms(programResp.data)
-    setSections(sectionResp.data)
-    setProspectusEntries(prospectusResp.data)
-
-    const activeTerm = termResp.data.find((term) => term.is_active)
+    const { data: bundle } = await api.get<
+      ReferenceBundle<Department, Program, AcademicTerm, Section, Subject, ProspectusEntry>
+    >('/bootstrap/')
+    setSubjects(bundle.subjects)
+    setTerms(bundle.terms)
+    setDepartments(bundle.departments)
+    setPrograms(bundle.programs)
+    setSections(bundle.sections)
+    setProspectusEntries(bundle.prospectus)
+
+    const activeTerm = bundle.terms.find((term) => term.is_active)
     if (activeTerm) {
       setSelectedTerm(String(activeTerm.id))
       setStudentForm((prev) => ({ ...prev, semester: String(activeTerm.semester), academic_year: activeTerm.year_label }))
@@ -476,13 +471,10 @@ export function EnrollmentPage() {
       let resolvedDateOfBirth = selectedStudent.date_of_birth
 
       try {
-        const historyResp = await api.get<AcademicHistoryRecord[]>('/academic-history/')
-        const matchedHistory = historyResp.data.find(
-          (history) =>
-            history.student === selectedStudent.id &&
-            history.academic_year === selectedStudent.academic_year &&
-            Number(history.semester) === Number(selectedStudent.semester),
-        )
+        const historyResp = await api.get<AcademicHistoryRecord>(`/students/${selectedStudent.student_id}/history/`, {
+          params: { academic_year: selectedStudent.academic_year, semester: selectedStudent.semester },
+        })
+        const matchedHistory = historyResp.data
         if (matchedHistory) {
           resolvedStatus = formatStatusForSlip(matchedHistory.status)
           if (!resolvedScholarship) resolvedScholarship = matchedHistory.scholarship || ''
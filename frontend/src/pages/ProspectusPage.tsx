@@ -1,6 +1,6 @@
 ﻿import { FormEvent, useEffect, useState } from 'react'
 
-import { api, getErrorMessage } from '../api'
+import { api, getErrorMessage, listAll } from '../api'
 import { AddIcon, ChevronDownIcon, FolderIcon, RemoveIcon, SaveIcon } from '../components/Icons'
 
 type Program = {
@@ -94,10 +94,10 @@ export function ProspectusPage() {
 
   const loadData = async () => {
     const [programResp, subjectResp, sectionResp, entryResp] = await Promise.all([
-      api.get<Program[]>('/programs/'),
-      api.get<Subject[]>('/subjects/'),
-      api.get<Section[]>('/sections/'),
-      api.get<ProspectusEntry[]>('/prospectus/'),
+      listAll<Program>('/programs/'),
+      listAll<Subject>('/subjects/'),
+      listAll<Section>('/sections/'),
+      listAll<ProspectusEntry>('/prospectus/'),
     ])
     setPrograms(programResp.data)
     setSubjects(subjectResp.data)
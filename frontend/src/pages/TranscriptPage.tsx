@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import { api, getErrorMessage } from '../api'
+import { api, getErrorMessage, listAll } from '../api'
 
 interface TORSubject {
   id: number
@@ -41,7 +41,7 @@ export function TranscriptPage() {
 
   const loadPrograms = async () => {
     try {
-      const response = await api.get<Program[]>('/programs/')
+      const response = await listAll<Program>('/programs/')
       setPrograms(response.data)
     } catch (err) {
       setError(getErrorMessage(err))
@@ -66,13 +66,13 @@ export function TranscriptPage() {
       setSuccess('Student found.')
       
       // Load TOR subjects for this student
-      loadTORSubjects(found.id)
+      loadTORSubjects(found.student_id)
     } catch (err) {
       setError(getErrorMessage(err))
     }
   }
 
-  const loadTORSubjects = async (studentId: number) => {
+  const loadTORSubjects = async (studentId: string) => {
     try {
       const response = await api.get<TORSubject[]>(`/students/${studentId}/tor-subjects/`)
       setTorSubjects(response.data)